@@ -0,0 +1,114 @@
+# Local imports
+import constants as const
+
+# Standard imports
+import csv
+import os
+
+
+class AppliedJobsStore:
+    """
+    In-memory index of applied job IDs backed by the append-only jobs.csv log.
+    The CSV is read once when the store is created, membership checks are O(1), and every
+    new row is flushed and fsynced so a crash never loses an application that was logged.
+    """
+
+    def __init__(self, csv_path: str = const.JOBS_CSV_FILE) -> None:
+        """
+        Initializes the store and imports any job IDs already present in the CSV log.
+        """
+        self.csv_path = csv_path
+        self.job_ids = set()
+        self._needs_newline = False
+        self._load()
+
+    def _load(self) -> None:
+        """
+        Reads the CSV log once and builds the in-memory job ID index.
+        """
+        if not os.path.isfile(self.csv_path):
+            return
+
+        try:
+            self._upgrade_header()
+
+            with open(self.csv_path, mode="r", newline="", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                for row in reader:
+                    job_id = row.get(const.CSV_HEADER_JOB_ID)
+                    if job_id:
+                        self.job_ids.add(job_id)
+
+            # A crash mid-write can leave a partial last line, so make sure the next row starts fresh
+            with open(self.csv_path, mode="rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    self._needs_newline = f.read(1) not in (b"\n", b"\r")
+        except Exception as e:
+            print(f"Warning: Error reading {self.csv_path}: {e}")
+
+        print(f"Loaded {len(self.job_ids)} applied job(s) from {self.csv_path}")
+
+    def _upgrade_header(self) -> None:
+        """
+        Rewrites a log written with an older, shorter column layout under the current header, so rows
+        appended with the new columns line up. Logs with any other header are left alone.
+        """
+        with open(self.csv_path, mode="r", newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+        if not rows:
+            return
+
+        header = rows[0]
+        if header == const.JOBS_CSV_HEADERS or header != const.JOBS_CSV_HEADERS[: len(header)]:
+            return
+
+        tmp_path = f"{self.csv_path}.tmp"
+        with open(tmp_path, mode="w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(const.JOBS_CSV_HEADERS)
+            for row in rows[1:]:
+                writer.writerow(row + [""] * (len(const.JOBS_CSV_HEADERS) - len(row)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.csv_path)
+
+        print(f"Added {', '.join(const.JOBS_CSV_HEADERS[len(header):])} column(s) to {self.csv_path}")
+
+    def __contains__(self, job_id) -> bool:
+        """
+        Returns True if the job ID has already been logged.
+        """
+        return job_id is not None and str(job_id) in self.job_ids
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def append(self, row: list) -> None:
+        """
+        Appends a row (in const.JOBS_CSV_HEADERS order) to the CSV log and indexes its job ID.
+        The header is written first if the log is new, and the write is fsynced before returning.
+        """
+        file_exists = (
+            os.path.isfile(self.csv_path) and os.path.getsize(self.csv_path) > 0
+        )
+
+        with open(self.csv_path, mode="a", newline="", encoding="utf-8") as f:
+            if self._needs_newline:
+                f.write("\n")
+                self._needs_newline = False
+
+            writer = csv.writer(f)
+
+            # Write header if file is new
+            if not file_exists:
+                writer.writerow(const.JOBS_CSV_HEADERS)
+
+            writer.writerow(row)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if row[0]:
+            self.job_ids.add(str(row[0]))
@@ -0,0 +1,317 @@
+# Local imports
+from cover_letter_generator import (
+    count_tokens,
+    generate_cover_letter,
+    load_resume_text,
+    GENERATION_PATHS,
+)
+from embedding_cache import EMBEDDING_CACHE_STATS, summary as embedding_cache_summary
+from llm_backends import get_backend, LLMBackend
+from pdf_renderer import PdfRenderPool
+from rate_limiter import TokenBucket
+import constants as const
+
+# Standard imports
+import argparse
+import csv
+import json
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# External imports
+from dotenv import load_dotenv
+from langchain_core.embeddings import Embeddings
+
+load_dotenv()
+
+# Load configuration from environment variables
+config = {
+    const.RESUME_PATH: os.getenv("RESUME_PATH"),
+    const.COVER_LETTER_PATH: os.getenv("COVER_LETTER_PATH"),
+    const.DIRECT_PROMPT_TOKEN_BUDGET: int(
+        os.getenv(
+            "DIRECT_PROMPT_TOKEN_BUDGET", const.DEFAULT_DIRECT_PROMPT_TOKEN_BUDGET
+        )
+    ),
+    const.RETRIEVAL_PROMPT_TOKEN_BUDGET: int(
+        os.getenv(
+            "RETRIEVAL_PROMPT_TOKEN_BUDGET",
+            const.DEFAULT_RETRIEVAL_PROMPT_TOKEN_BUDGET,
+        )
+    ),
+    const.EMBEDDING_CACHE_DIR: os.getenv(
+        "EMBEDDING_CACHE_DIR", const.DEFAULT_EMBEDDING_CACHE_DIR
+    ),
+    const.LLM_BACKEND: os.getenv("LLM_BACKEND", const.DEFAULT_LLM_BACKEND),
+    const.FAKE_LLM_LATENCY: float(os.getenv("FAKE_LLM_LATENCY", 0)),
+}
+
+
+def read_jobs(input_path: str) -> list:
+    """
+    Reads (job_id, description) records from a JSONL or CSV file.
+    Each record needs a job_id and a description (or job_description) field.
+    """
+    records = []
+
+    with open(input_path, mode="r", newline="", encoding="utf-8") as f:
+        if input_path.lower().endswith(".csv"):
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+
+        for row in rows:
+            job_id = row.get(const.JOB_ID)
+            description = row.get("description") or row.get(const.JOB_DESCRIPTION)
+            if not job_id or not description:
+                print(f"Warning: Skipping record without job_id/description: {row}")
+                continue
+            records.append((str(job_id), description))
+
+    return records
+
+
+def is_rate_limit_error(e: Exception) -> bool:
+    """
+    Returns True if the exception is an HTTP 429 from the OpenAI API.
+    """
+    return (
+        getattr(e, "status_code", None) == 429
+        or type(e).__name__ == "RateLimitError"
+    )
+
+
+def retry_after(e: Exception):
+    """
+    Returns the Retry-After delay (in seconds) sent with a 429, if any.
+    """
+    response = getattr(e, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def call_with_retry(call, request_limiter: TokenBucket, max_retries: int, label: str):
+    """
+    Makes one API call within the request limit, backing off exponentially on 429s. Only the
+    rate-limited call is retried, not the whole letter.
+    """
+    for attempt in range(max_retries + 1):
+        request_limiter.acquire()
+
+        try:
+            return call()
+        except Exception as e:
+            if not is_rate_limit_error(e) or attempt == max_retries:
+                raise
+
+            delay = retry_after(e) or min(60.0, 2**attempt) + random.uniform(0, 1)
+            print(f"Rate limited on {label}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+
+class RateLimitedChatModel:
+    """
+    Chat model wrapper that charges every invoke() to the request limiter and retries it on 429s.
+    """
+
+    def __init__(self, chat_model, request_limiter: TokenBucket, max_retries: int) -> None:
+        self.chat_model = chat_model
+        self.request_limiter = request_limiter
+        self.max_retries = max_retries
+
+    def invoke(self, message):
+        return call_with_retry(
+            lambda: self.chat_model.invoke(message),
+            self.request_limiter,
+            self.max_retries,
+            "chat completion",
+        )
+
+
+class RateLimitedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that charges every request to the request limiter and retries it on 429s.
+    Keeps the wrapped model's name, so the embedding cache files its vectors under the same model.
+    """
+
+    def __init__(self, embeddings: Embeddings, request_limiter: TokenBucket, max_retries: int) -> None:
+        self.embeddings = embeddings
+        self.model = getattr(embeddings, "model", None) or type(embeddings).__name__
+        self.dimensions = getattr(embeddings, "dimensions", None)
+        self.request_limiter = request_limiter
+        self.max_retries = max_retries
+
+    def embed_documents(self, texts: list) -> list:
+        return call_with_retry(
+            lambda: self.embeddings.embed_documents(texts),
+            self.request_limiter,
+            self.max_retries,
+            "embeddings",
+        )
+
+    def embed_query(self, text: str) -> list:
+        return call_with_retry(
+            lambda: self.embeddings.embed_query(text),
+            self.request_limiter,
+            self.max_retries,
+            "embeddings",
+        )
+
+
+class RateLimitedBackend(LLMBackend):
+    """
+    Backend whose chat model and embeddings share one requests-per-minute limit. A letter makes one
+    API call on the direct path and several (embeddings, retrieval queries, completion) via retrieval,
+    so the limit is charged per call rather than per letter. Embeddings served from the cache aren't charged.
+    """
+
+    def __init__(self, backend: LLMBackend, request_limiter: TokenBucket, max_retries: int) -> None:
+        self.backend = backend
+        self.name = backend.name
+        self.request_limiter = request_limiter
+        self.max_retries = max_retries
+
+    def chat_model(self):
+        return RateLimitedChatModel(
+            self.backend.chat_model(), self.request_limiter, self.max_retries
+        )
+
+    def embeddings(self) -> Embeddings:
+        return RateLimitedEmbeddings(
+            self.backend.embeddings(), self.request_limiter, self.max_retries
+        )
+
+
+def generate_within_limits(
+    job_id: str,
+    description: str,
+    backend: RateLimitedBackend,
+    token_limiter: TokenBucket,
+    estimated_tokens: int,
+    render_pool: PdfRenderPool,
+) -> str:
+    """
+    Generates one cover letter, holding its estimated tokens against the tokens-per-minute limit.
+    Requests per minute are charged by the backend, per API call.
+    """
+    token_limiter.acquire(estimated_tokens)
+
+    return generate_cover_letter(
+        description, job_id, config, render_pool, backend=backend
+    )
+
+
+def main():
+    """
+    Batch entry point. Generates cover letter PDFs for every record in the input file with bounded
+    concurrency, skipping jobs whose PDF already exists so an interrupted batch can be resumed.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate cover letters for a JSONL or CSV file of (job_id, description) records."
+    )
+    parser.add_argument("input", help="Path to a .jsonl or .csv file of jobs")
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="Maximum concurrent generations"
+    )
+    parser.add_argument(
+        "--rpm", type=float, default=60, help="Maximum API requests per minute"
+    )
+    parser.add_argument(
+        "--tpm", type=float, default=200000, help="Maximum tokens per minute"
+    )
+    parser.add_argument(
+        "--max-retries", type=int, default=5, help="Retries per API request on HTTP 429"
+    )
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Processes used to render PDFs",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate letters even if their PDF already exists",
+    )
+    args = parser.parse_args()
+
+    cover_letter_dir = config[const.COVER_LETTER_PATH]
+    if not cover_letter_dir or not config[const.RESUME_PATH]:
+        parser.error("RESUME_PATH and COVER_LETTER_PATH must be set in the environment")
+
+    records = read_jobs(args.input)
+
+    pending = []
+    for job_id, description in records:
+        if not args.force and os.path.isfile(
+            os.path.join(cover_letter_dir, f"{job_id}.pdf")
+        ):
+            continue
+        pending.append((job_id, description))
+
+    print(
+        f"{len(records)} job(s) in {args.input}, {len(records) - len(pending)} already generated, {len(pending)} to go"
+    )
+
+    if not pending:
+        return
+
+    backend = RateLimitedBackend(
+        get_backend(config), TokenBucket(args.rpm), args.max_retries
+    )
+    token_limiter = TokenBucket(args.tpm)
+
+    # Prompt + resume + description in, plus roughly a full letter out
+    base_tokens = (
+        count_tokens(const.COVER_LETTER_PROMPT)
+        + count_tokens(load_resume_text(config))
+        + const.ESTIMATED_COVER_LETTER_TOKENS
+    )
+
+    start = time.perf_counter()
+    failed = []
+    render_pool = PdfRenderPool(max_workers=args.render_workers)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = {
+            executor.submit(
+                generate_within_limits,
+                job_id,
+                description,
+                backend,
+                token_limiter,
+                base_tokens + count_tokens(description),
+                render_pool,
+            ): job_id
+            for job_id, description in pending
+        }
+
+        for done, future in enumerate(as_completed(futures), start=1):
+            job_id = futures[future]
+            try:
+                file_path = future.result()
+                print(f"[{done}/{len(pending)}] Generated {file_path}")
+            except Exception as e:
+                failed.append(job_id)
+                print(f"[{done}/{len(pending)}] Failed to generate job {job_id}: {e}")
+
+    render_pool.shutdown()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Generated {len(pending) - len(failed)} cover letter(s) in {elapsed:.1f}s "
+        f"({GENERATION_PATHS['direct']} direct, {GENERATION_PATHS['retrieval']} via retrieval)"
+    )
+    if EMBEDDING_CACHE_STATS:
+        print(embedding_cache_summary())
+    if failed:
+        print(f"Failed job IDs (re-run to retry): {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
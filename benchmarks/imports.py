@@ -0,0 +1,94 @@
+# Standard imports
+import argparse
+import os
+import subprocess
+import sys
+
+# Packages that must not be imported at startup; they load when the first cover letter is needed
+DEFERRED_PACKAGES = [
+    "langchain",
+    "langchain_core",
+    "langchain_community",
+    "langchain_classic",
+    "langchain_openai",
+    "chromadb",
+    "PyPDF2",
+    "fpdf",
+]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(module: str) -> dict:
+    """
+    Imports module in a fresh interpreter with -X importtime and returns {module name: cumulative microseconds}.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def best_of(module: str, runs: int) -> tuple:
+    """
+    Returns (best cumulative ms for module, modules it imported) over several runs, to smooth out disk cache noise.
+    """
+    best, modules = None, {}
+    for _ in range(runs):
+        modules = import_times(module)
+        ms = modules[module] / 1000
+        best = ms if best is None else min(best, ms)
+
+    return best, modules
+
+
+def main():
+    """
+    Reports the import time of main.py and of the cover letter stack it defers, and fails (exit code 1) if startup
+    imports any deferred package or takes longer than --max-ms.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark startup import time.")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement (best is reported)")
+    parser.add_argument("--max-ms", type=float, help="Fail if importing main takes longer than this")
+    args = parser.parse_args()
+
+    startup_ms, startup_modules = best_of("main", args.runs)
+    stack_ms, _ = best_of("cover_letter_generator", args.runs)
+
+    print(f"import main:                   {startup_ms:8.1f} ms")
+    print(f"import cover_letter_generator: {stack_ms:8.1f} ms (deferred until the first cover letter)")
+
+    heaviest = sorted(
+        ((name, us) for name, us in startup_modules.items() if "." not in name and name != "main"),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:5]
+    print("Heaviest startup imports (cumulative): " + ", ".join(f"{name} {us / 1000:.0f} ms" for name, us in heaviest))
+
+    failures = []
+    loaded = sorted({name.split(".")[0] for name in startup_modules} & set(DEFERRED_PACKAGES))
+    if loaded:
+        failures.append(f"startup imports deferred package(s): {', '.join(loaded)}")
+    if args.max_ms is not None and startup_ms > args.max_ms:
+        failures.append(f"startup import took {startup_ms:.1f} ms, over the {args.max_ms:.1f} ms limit")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# Local imports
+from cover_letter_generator import generate_cover_letter, _resume_cache
+import constants as const
+import resume_text
+
+# Standard imports
+import argparse
+import os
+import tempfile
+import time
+
+# External imports
+from fpdf import FPDF
+
+STAGES = ["load", "split", "embed", "retrieve", "generate", "render"]
+
+SAMPLE_JOB_DESCRIPTION = (
+    "Software Engineer Intern at Acme Corp. We're looking for a student who enjoys building "
+    "reliable backend services in Python, designing REST APIs and working closely with a small team. "
+    "Requirements: Python, REST APIs, SQL, testing, teamwork. Location: San Francisco, CA. "
+) * 8
+
+
+def write_sample_resume(file_path: str) -> None:
+    """
+    Writes a synthetic multi-section resume PDF so the benchmark doesn't depend on a real one.
+    """
+    pdf = FPDF()
+    pdf.set_margins(20, 20, 20)
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=10)
+    for section in ["Education", "Experience", "Projects", "Skills", "Leadership"]:
+        pdf.multi_cell(0, 5, section.upper(), new_x="LMARGIN", new_y="NEXT")
+        for i in range(6):
+            pdf.multi_cell(
+                0,
+                5,
+                f"- {section} item {i}: built and shipped Python services, REST APIs and data "
+                "pipelines; improved latency, wrote tests and mentored teammates.",
+                new_x="LMARGIN",
+                new_y="NEXT",
+            )
+    pdf.output(file_path)
+
+
+def run(letters: int, latency: float, resume_path: str, budget: int, resume_cache_dir: str) -> dict:
+    """
+    Generates letters with the fake backend and returns the mean seconds per letter for each stage.
+    The resume caches start empty, in memory and in resume_cache_dir on disk, so the first letter's load is cold.
+    """
+    const.RESUME_CACHE_DIR = resume_cache_dir
+    _resume_cache.clear()
+    resume_text._resume_texts.clear()
+
+    config = {
+        const.RESUME_PATH: resume_path,
+        const.LLM_BACKEND: "fake",
+        const.FAKE_LLM_LATENCY: latency,
+        const.DIRECT_PROMPT_TOKEN_BUDGET: budget,
+    }
+    totals = {}
+
+    for i in range(letters):
+        # Measure a cold resume load on the first letter only, like a real run
+        generate_cover_letter(SAMPLE_JOB_DESCRIPTION, f"bench_{i}", config, timings=totals)
+
+    return {stage: seconds / letters for stage, seconds in totals.items()}
+
+
+def main():
+    """
+    Reports per-stage pipeline time (load, split, embed, retrieve, generate, render) using the local
+    fake backend, with and without simulated API latency.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the cover letter pipeline offline.")
+    parser.add_argument("--letters", type=int, default=10, help="Letters per run")
+    parser.add_argument(
+        "--latency", type=float, default=0.5, help="Simulated seconds per API call"
+    )
+    parser.add_argument("--resume", help="Resume PDF to use (default: a synthetic one)")
+    parser.add_argument(
+        "--direct",
+        action="store_true",
+        help="Benchmark the direct-prompt path instead of retrieval",
+    )
+    args = parser.parse_args()
+
+    budget = const.DEFAULT_DIRECT_PROMPT_TOKEN_BUDGET if args.direct else 0
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        os.environ["COVER_LETTER_PATH"] = output_dir
+        resume_path = args.resume or os.path.join(output_dir, "resume.pdf")
+        if not args.resume:
+            write_sample_resume(resume_path)
+
+        results = {}
+        for latency in (0.0, args.latency):
+            # A fresh resume cache per run, rather than the one under .cache/ left by earlier runs
+            resume_cache_dir = os.path.join(output_dir, f"resume-cache-{latency}")
+            start = time.perf_counter()
+            results[latency] = run(args.letters, latency, resume_path, budget, resume_cache_dir)
+            results[latency]["total"] = (time.perf_counter() - start) / args.letters
+
+    print(f"Mean ms per letter over {args.letters} letters ({'direct' if args.direct else 'retrieval'} path)")
+    print(f"{'stage':<10}" + "".join(f"{f'latency={latency}s':>18}" for latency in results))
+    for stage in STAGES + ["total"]:
+        row = "".join(
+            f"{results[latency].get(stage, 0.0) * 1000:>18.1f}" for latency in results
+        )
+        print(f"{stage:<10}{row}")
+
+
+if __name__ == "__main__":
+    main()
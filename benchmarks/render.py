@@ -0,0 +1,50 @@
+# Local imports
+from pdf_renderer import PdfRenderPool, render_markdown_to_pdf
+import constants as const
+
+# Standard imports
+import argparse
+import os
+import tempfile
+import time
+
+
+def main():
+    """
+    Measures render-only throughput (letters per second) on the calling thread and in a process pool.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark cover letter PDF rendering.")
+    parser.add_argument("--letters", type=int, default=100, help="Letters to render per mode")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count(), help="Processes in the render pool"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        letters = [
+            (const.SAMPLE_COVER_LETTER, os.path.join(output_dir, f"{i}.pdf"))
+            for i in range(args.letters)
+        ]
+
+        # Serial, on the calling thread (first letter warms the converter, like a worker would)
+        render_markdown_to_pdf(*letters[0])
+        start = time.perf_counter()
+        for markdown_text, file_path in letters:
+            render_markdown_to_pdf(markdown_text, file_path)
+        serial = time.perf_counter() - start
+
+        # Process pool, excluding worker startup
+        pool = PdfRenderPool(max_workers=args.workers)
+        pool.render_many(letters[: args.workers])
+        start = time.perf_counter()
+        pool.render_many(letters)
+        pooled = time.perf_counter() - start
+        pool.shutdown()
+
+    print(f"Rendered {args.letters} letters per mode")
+    print(f"  serial:            {args.letters / serial:8.1f} letters/s ({serial * 1000 / args.letters:.1f} ms/letter)")
+    print(f"  pool ({args.workers} workers): {args.letters / pooled:8.1f} letters/s ({pooled * 1000 / args.letters:.1f} ms/letter)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# Local imports
+import constants as const
+
+# Standard imports
+import json
+import os
+import time
+
+# External imports
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+
+def build_chrome_options(config: dict, lean: bool) -> Options:
+    """
+    Returns Chrome options for the given profile. The lean profile returns from driver.get as soon as
+    the DOM is ready (pageLoadStrategy=eager) and doesn't download images. Both profiles keep their
+    cookies in CHROME_PROFILE_DIR when it is set.
+    """
+    options = Options()
+
+    # Persist cookies between runs so the Handshake session survives restarts
+    profile_dir = config.get(const.CHROME_PROFILE_DIR)
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+
+    if config.get(const.HEADLESS):
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+
+    if lean:
+        options.page_load_strategy = "eager"
+        # A command-line switch rather than a profile pref, so it doesn't stick to the persistent profile
+        options.add_argument("--blink-settings=imagesEnabled=false")
+
+    return options
+
+
+def block_resources(driver: webdriver.Chrome, config: dict) -> None:
+    """
+    Blocks media, fonts and third-party hosts for every request the browser makes, via the DevTools protocol.
+    """
+    hosts = config.get(const.BLOCKED_HOSTS) or const.DEFAULT_BLOCKED_HOSTS
+    patterns = list(const.BLOCKED_RESOURCE_PATTERNS) + [f"*{host}*" for host in hosts]
+
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        print(f"Warning: Could not enable resource blocking: {e}")
+
+
+def chrome_major_version():
+    """
+    Returns the installed Chrome's major version (e.g. "126") by asking the local binary, or None if it can't be found.
+    """
+    try:
+        version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+
+    return version.split(".")[0] if version else None
+
+
+def resolve_driver_path(cache_file: str = const.DRIVER_CACHE_FILE) -> str:
+    """
+    Returns the chromedriver path. The path resolved by ChromeDriverManager is pinned to the Chrome major version in
+    cache_file and reused without any network call until Chrome is upgraded. If resolving fails (e.g. offline),
+    the cached driver is used anyway.
+    """
+    start = time.perf_counter()
+    chrome_major = chrome_major_version()
+
+    cached = {}
+    if os.path.isfile(cache_file):
+        try:
+            with open(cache_file, mode="r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable chromedriver cache {cache_file}: {e}")
+
+    cached_path = cached.get("driver_path")
+    if cached_path and not os.path.isfile(cached_path):
+        cached_path = None
+
+    # Without a detectable Chrome version there is nothing to compare, so the pinned driver is trusted
+    if cached_path and chrome_major in (None, cached.get("chrome_major")):
+        print(
+            f"Using cached chromedriver for Chrome {cached.get('chrome_major')} in {time.perf_counter() - start:.2f}s "
+            f"(resolving it took {cached.get('resolve_seconds', 0):.2f}s)"
+        )
+        return cached_path
+
+    # This conveniently handles the annoying chrome driver logic for you
+    try:
+        driver_path = ChromeDriverManager().install()
+    except Exception as e:
+        if not cached_path:
+            raise
+        print(f"Warning: Could not resolve chromedriver ({e}), using cached {cached_path}")
+        return cached_path
+
+    resolve_seconds = time.perf_counter() - start
+    print(f"Resolved chromedriver for Chrome {chrome_major or 'unknown'} in {resolve_seconds:.2f}s")
+
+    # Only pin a driver to a known Chrome version, so an undetectable Chrome is re-resolved every time
+    if chrome_major is not None:
+        os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+        tmp_path = f"{cache_file}.tmp"
+        with open(tmp_path, mode="w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "chrome_major": chrome_major,
+                    "driver_path": driver_path,
+                    "resolve_seconds": resolve_seconds,
+                },
+                f,
+            )
+        os.replace(tmp_path, cache_file)
+
+    return driver_path
+
+
+def create_driver(config: dict, lean: bool = None) -> webdriver.Chrome:
+    """
+    Launches Chrome with the configured profile. lean defaults to the LEAN_BROWSER setting.
+    """
+    if lean is None:
+        lean = config.get(const.LEAN_BROWSER, True)
+
+    service = Service(resolve_driver_path())
+    driver = webdriver.Chrome(service=service, options=build_chrome_options(config, lean))
+
+    if lean:
+        block_resources(driver, config)
+
+    return driver
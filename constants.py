@@ -9,12 +9,36 @@ SEARCH_URL = "search_url"
 RESUME_PATH = "resume_path"
 TRANSCRIPT_PATH = "transcript_path"
 COVER_LETTER_PATH = "cover_letter_path"
+DIRECT_PROMPT_TOKEN_BUDGET = "direct_prompt_token_budget"
+RETRIEVAL_PROMPT_TOKEN_BUDGET = "retrieval_prompt_token_budget"
+EMBEDDING_CACHE_DIR = "embedding_cache_dir"
+COVER_LETTER_WORKERS = "cover_letter_workers"
+COVER_LETTER_QUEUE_DEPTH = "cover_letter_queue_depth"
+RENDER_WORKERS = "render_workers"
+LLM_BACKEND = "llm_backend"
+FAKE_LLM_LATENCY = "fake_llm_latency"
+PACE_ACTIONS_PER_MINUTE = "pace_actions_per_minute"
+PACE_BURST = "pace_burst"
+PACE_SLOW_SECONDS = "pace_slow_seconds"
+HEADLESS = "headless"
+LEAN_BROWSER = "lean_browser"
+BLOCKED_HOSTS = "blocked_hosts"
+CHROME_PROFILE_DIR = "chrome_profile_dir"
+PREFETCH_TABS = "prefetch_tabs"
+RELEVANCE_THRESHOLD = "relevance_threshold"
+COVER_LETTER_REUSE_THRESHOLD = "cover_letter_reuse_threshold"
+TRACE_FILE = "trace_file"
+CRAWL_CHECKPOINT_FILE = "crawl_checkpoint_file"
+JOB_QUEUE_FILE = "job_queue_file"
+SKIPPED_JOBS_FILE = "skipped_jobs_file"
 
 # Job application constants
 JOB_ID = "job_id"
 JOB_TITLE = "job_title"
 COMPANY_NAME = "company_name"
 JOB_DESCRIPTION = "job_description"
+APPLY_TYPE = "apply_type"
+RELEVANCE = "relevance"
 
 # CSV constants
 JOBS_CSV_FILE = "jobs.csv"
@@ -25,10 +49,89 @@ CSV_HEADER_RESUME = "Resume"
 CSV_HEADER_TRANSCRIPT = "Transcript"
 CSV_HEADER_COVER_LETTER = "Cover Letter"
 CSV_HEADER_DATE = "Date"
+CSV_HEADER_RELEVANCE = "Relevance"
+JOBS_CSV_HEADERS = [
+    CSV_HEADER_JOB_ID,
+    CSV_HEADER_COMPANY,
+    CSV_HEADER_POSITION,
+    CSV_HEADER_RESUME,
+    CSV_HEADER_TRANSCRIPT,
+    CSV_HEADER_COVER_LETTER,
+    CSV_HEADER_DATE,
+    CSV_HEADER_RELEVANCE,
+]
+
+# Relevance constants
+DEFAULT_RELEVANCE_THRESHOLD = 0.0
+
+# Crawl constants
+DEFAULT_CRAWL_CHECKPOINT_FILE = "crawl_checkpoint.json"
+DEFAULT_JOB_QUEUE_FILE = "job_queue.db"
+DEFAULT_SKIPPED_JOBS_FILE = "skipped_jobs.jsonl"
+
+# Tracing constants
+DEFAULT_TRACE_FILE = "trace.jsonl"
+
+# Pacing constants
+# About 3 paced actions per job (page load, Apply, Submit), so 40/min matches the ~4.5s per job of the old fixed sleep
+DEFAULT_PACE_ACTIONS_PER_MINUTE = 40
+DEFAULT_PACE_BURST = 3
+DEFAULT_PACE_SLOW_SECONDS = 5.0
+
+# Browser constants
+DEFAULT_CHROME_PROFILE_DIR = ".chrome-profile"
+DEFAULT_PREFETCH_TABS = 0
+DEFAULT_BLOCKED_HOSTS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "fullstory.com",
+    "segment.io",
+    "segment.com",
+    "intercom.io",
+    "intercomcdn.com",
+    "sentry.io",
+    "datadoghq.com",
+    "newrelic.com",
+    "nr-data.net",
+]
+# Anchored to the end of the URL path (with or without a query string), so e.g. "*.ico" doesn't catch icons.bundle.js
+BLOCKED_RESOURCE_PATTERNS = [
+    pattern
+    for extension in [
+        "png", "jpg", "jpeg", "gif", "webp", "ico",  # images (inline SVG icons are kept)
+        "woff", "woff2", "ttf", "otf",  # fonts
+        "mp4", "webm", "mp3", "ogg",  # media
+    ]
+    for pattern in (f"*.{extension}", f"*.{extension}?*")
+]
+
+# Cache constants
+CACHE_DIR = ".cache"
+RESUME_CACHE_DIR = ".cache/resume"
+DEFAULT_COVER_LETTER_CACHE_FILE = ".cache/cover_letters.jsonl"
+DRIVER_CACHE_FILE = ".cache/chromedriver.json"
+DEFAULT_EMBEDDING_CACHE_DIR = ".cache/embeddings"
+DEFAULT_COVER_LETTER_REUSE_THRESHOLD = 0.9
+COVER_LETTER_MINHASH_PERMUTATIONS = 64
+RESUME_CHUNKING_VERSION = "recursive-tokens-200-0"
 
 # CV constants
 TEMPERATURE = 0.7
 MODEL_NAME = "gpt-4.1-nano"
+DEFAULT_LLM_BACKEND = "openai"
+DEFAULT_DIRECT_PROMPT_TOKEN_BUDGET = 8000
+DEFAULT_RETRIEVAL_PROMPT_TOKEN_BUDGET = 2500
+RETRIEVAL_CHUNK_TOKENS = 200
+# No overlap: neighbouring chunks that are both retrieved would otherwise send (and spend budget on) the same text twice
+RETRIEVAL_CHUNK_OVERLAP_TOKENS = 0
+DEFAULT_COVER_LETTER_WORKERS = 2
+DEFAULT_COVER_LETTER_QUEUE_DEPTH = 3
+COVER_LETTER_LOOKAHEAD = 2
+ESTIMATED_COVER_LETTER_TOKENS = 800
+DEFAULT_RENDER_WORKERS = 1
 COVER_LETTER_PROMPT = """
 You are a professional career writer.
 
@@ -55,3 +158,44 @@ Requirements:
    - Sincerely,
    - **Candidate's full name** (bold)
 """
+
+DIRECT_PROMPT_TEMPLATE = """{prompt}
+
+CV:
+{resume}
+
+Job posting:
+{job_description}
+"""
+
+RETRIEVAL_PROMPT_TEMPLATE = """Use the following pieces of context to answer the user's question.
+If you don't know the answer, just say that you don't know, don't try to make up an answer.
+----------------
+{context}
+
+{question}
+"""
+
+# Representative cover letter, used for benchmarking and by the local fake backend
+SAMPLE_COVER_LETTER = """**Jordan Lee**
+
+jordan.lee@example.com | (555) 010-0199 | San Diego, CA
+
+February 12, 2026
+
+Dear Hiring Manager,
+
+I am excited to apply for the Software Engineer Intern position. As a computer science student who has spent the last two years building production web services, I'm drawn to your team's focus on reliable, well-tested software that real people depend on every day.
+
+In my most recent internship I built a REST API in Python that served over **two million requests per day**, cut p95 latency by 40% through query batching and caching, and wrote the integration tests that let the team ship it with confidence. That experience taught me to measure before optimizing and to treat observability as part of the feature.
+
+On campus I lead a team of four building a course-planning tool used by 3,000 students. Coordinating design reviews, splitting work into small pull requests and mentoring newer contributors has made me a better collaborator and a clearer communicator - skills I know matter just as much as code.
+
+I'm especially excited by your emphasis on teamwork and ownership. I enjoy working closely with product and design partners, asking questions early, and taking responsibility for a feature from the first sketch to monitoring it in production.
+
+Thank you for considering my application. I'd welcome the chance to discuss how I can contribute to your team this summer.
+
+Sincerely,
+
+**Jordan Lee**
+"""
@@ -0,0 +1,206 @@
+# Local imports
+import constants as const
+
+# Standard imports
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+
+# External imports
+import numpy as np
+
+# Universal hash functions h(x) = (a * x + b) mod p for the MinHash signature. a < 2^31 keeps a * x
+# inside uint64 for 32-bit shingle hashes, and the fixed seed keeps signatures comparable across runs.
+_PRIME = np.uint64(4294967311)
+_rng = np.random.default_rng(20240917)
+_A = _rng.integers(1, 2**31, size=const.COVER_LETTER_MINHASH_PERMUTATIONS, dtype=np.uint64)
+_B = _rng.integers(0, 2**31, size=const.COVER_LETTER_MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+COMPANY_SUFFIXES = {"inc", "llc", "ltd", "corp", "corporation", "co", "company", "plc", "lp", "gmbh"}
+
+# A letter date line such as "February 12, 2026"
+DATE_LINE = re.compile(
+    r"^(\**)(January|February|March|April|May|June|July|August|September|October|November|December)"
+    r" \d{1,2}, \d{4}(\**)\s*$",
+    re.MULTILINE,
+)
+
+
+def normalize_company(company: str) -> str:
+    """
+    Lowercases a company name and drops punctuation and legal suffixes, so "Acme, Inc." and "ACME" match.
+    """
+    words = re.findall(r"[a-z0-9]+", (company or "").lower())
+    while words and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+
+    return " ".join(words)
+
+
+def minhash_signature(description: str) -> np.ndarray:
+    """
+    Returns the MinHash signature of the description's word 3-grams. The fraction of equal positions in
+    two signatures estimates the Jaccard similarity of the two descriptions. None for empty descriptions.
+    """
+    words = re.findall(r"[a-z0-9]+", (description or "").lower())
+    if not words:
+        return None
+
+    shingles = {" ".join(words[i : i + 3]) for i in range(max(1, len(words) - 2))}
+    hashes = np.array(
+        [
+            int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=4).digest(), "little")
+            for shingle in shingles
+        ],
+        dtype=np.uint64,
+    )
+
+    return ((_A[:, None] * hashes[None, :] + _B[:, None]) % _PRIME).min(axis=1)
+
+
+def restamp_date(markdown: str, today: datetime = None) -> str:
+    """
+    Replaces the date line in a letter's header with today's date.
+    """
+    today = today or datetime.now()
+    date = f"{today:%B} {today.day}, {today.year}"
+
+    return DATE_LINE.sub(lambda match: f"{match.group(1)}{date}{match.group(3)}", markdown, count=1)
+
+
+class CoverLetterCache:
+    """
+    On-disk cache of generated cover letters, bucketed by normalized company name. A new posting whose
+    description is similar enough (MinHash Jaccard estimate at or above the threshold) to one already
+    written for the same company with the same resume reuses that letter's markdown with a fresh date,
+    which covers the same role posted in several locations or re-posted under a new job ID. Postings
+    without a company name are never cached. The file is a JSON Lines log that each letter and rendered
+    PDF is appended to, so an update never rewrites what is already stored.
+    """
+
+    def __init__(self, path: str = const.DEFAULT_COVER_LETTER_CACHE_FILE, threshold: float = 0.9) -> None:
+        self.path = path
+        self.threshold = threshold
+        self.lock = threading.Lock()
+        self.entries = {}  # normalized company -> [{job_id, signature, markdown, resume, created_at}]
+        self.pdfs = {}  # job ID -> resume key its rendered PDF was written with
+        self.hits = 0
+        self.pdf_hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.isfile(self.path):
+            return
+
+        skipped = 0
+        with open(self.path, mode="r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    if "pdf" in record:
+                        self.pdfs[record["pdf"]] = record["resume"]
+                    elif record["permutations"] == const.COVER_LETTER_MINHASH_PERMUTATIONS:
+                        record["signature"] = np.array(record["signature"], dtype=np.uint64)
+                        self.entries.setdefault(record.pop("company"), []).append(record)
+                except Exception:
+                    # e.g. a line cut short by a crash
+                    skipped += 1
+
+        if skipped:
+            print(f"Warning: Ignored {skipped} unreadable line(s) of cover letter cache {self.path}")
+
+    def _append(self, record: dict) -> None:
+        """
+        Appends one record to the cache file. Must be called with the lock held.
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, mode="a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def lookup(self, company: str, description: str, resume_key: str):
+        """
+        Returns the markdown of the most similar cached letter for this company written with the same resume,
+        re-dated to today, or None on a miss.
+        """
+        company = normalize_company(company)
+        signature = minhash_signature(description) if company else None
+
+        best, best_similarity = None, self.threshold
+        with self.lock:
+            if signature is not None:
+                for entry in self.entries.get(company, []):
+                    if entry["resume"] != resume_key:
+                        continue
+                    similarity = float(np.mean(entry["signature"] == signature))
+                    if similarity >= best_similarity:
+                        best, best_similarity = entry, similarity
+
+            if best is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        print(f"Reusing cover letter of job {best['job_id']} ({best_similarity:.0%} similar posting)")
+
+        return restamp_date(best["markdown"])
+
+    def add(self, job_id, company: str, description: str, markdown: str, resume_key: str) -> None:
+        """
+        Stores a newly generated letter.
+        """
+        company = normalize_company(company)
+        signature = minhash_signature(description)
+        if not company or signature is None:
+            return
+
+        entry = {
+            "job_id": str(job_id),
+            "signature": signature,
+            "markdown": markdown,
+            "resume": resume_key,
+            "created_at": time.time(),
+        }
+        with self.lock:
+            self.entries.setdefault(company, []).append(entry)
+            self._append(
+                {
+                    **entry,
+                    "company": company,
+                    "signature": signature.tolist(),
+                    "permutations": const.COVER_LETTER_MINHASH_PERMUTATIONS,
+                }
+            )
+
+    def pdf_is_current(self, job_id, resume_key: str) -> bool:
+        """
+        Returns True if the job's rendered PDF was written with this resume, so it can be sent again as is.
+        """
+        with self.lock:
+            return self.pdfs.get(str(job_id)) == resume_key
+
+    def record_pdf(self, job_id, resume_key: str) -> None:
+        """
+        Records which resume the job's newly rendered PDF was written with.
+        """
+        with self.lock:
+            self.pdfs[str(job_id)] = resume_key
+            self._append({"pdf": str(job_id), "resume": resume_key})
+
+    def record_pdf_reuse(self) -> None:
+        with self.lock:
+            self.pdf_hits += 1
+
+    def summary(self) -> str:
+        total = self.hits + self.pdf_hits + self.misses
+        rate = (self.hits + self.pdf_hits) / total if total else 0.0
+
+        return (
+            f"Cover letter reuse: {self.pdf_hits} existing PDF(s), {self.hits} similar letter(s) reused, "
+            f"{self.misses} generated ({rate:.0%} hit rate)"
+        )
@@ -1,106 +1,402 @@
 # Local Imports
 import constants as const
+from llm_backends import get_backend, LLMBackend
+from embedding_cache import CachedEmbeddings
+from pdf_renderer import render_markdown_to_pdf
+from resume_text import load_resume_text, resume_file_hash
 
 # Standard imports
+import hashlib
+import json
 import os
+import time
+from collections import Counter
+from contextlib import contextmanager
 
 # External imports
-from PyPDF2 import PdfReader
-import markdown
-from fpdf import FPDF
-from langchain_openai import OpenAIEmbeddings, ChatOpenAI
 from langchain_community.vectorstores import Chroma
-from langchain_classic.chains import RetrievalQA
-from langchain_classic.text_splitter import (
-    CharacterTextSplitter,
-    RecursiveCharacterTextSplitter,
-)
+from langchain_classic.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
 
+# Resume text and chunks keyed by content hash, shared by every cover letter in this process
+_resume_cache = {}
 
-def generate_cover_letter(job_desc: str, job_id: int, config: dict) -> str:
+# Lazily loaded tiktoken encoder (False when tiktoken is unavailable)
+_token_encoder = None
+
+# Number of cover letters generated via each path ("direct" or "retrieval")
+GENERATION_PATHS = Counter()
+
+# (job_id, path, prompt tokens, generation seconds) for every letter generated in this process
+PROMPT_STATS = []
+
+
+def generate_cover_letter(
+    job_desc: str,
+    job_id: int,
+    config: dict,
+    render_pool=None,
+    timings: dict = None,
+    company: str = None,
+    letter_cache=None,
+    backend: LLMBackend = None,
+) -> str:
+    """
+    Generates a custom cover letter based on the job description and returns the file path.
+    If a timings dict is given, the seconds spent in each stage are added to it. The backend defaults
+    to the one selected by the config.
+    With a letter_cache, an existing {job_id}.pdf (e.g. from a failed attempt) is returned as is, and a
+    letter written for a near-identical posting from the same company is reused instead of generating one,
+    as long as either was written with the current resume.
+    """
+    result = None
+    resume_key = None
+    if letter_cache is not None:
+        resume_key = resume_cache_key(config[const.RESUME_PATH])
+        file_path = cover_letter_file_path(job_id)
+        if os.path.isfile(file_path) and letter_cache.pdf_is_current(job_id, resume_key):
+            letter_cache.record_pdf_reuse()
+            print(f"Reusing existing cover letter {file_path}")
+            return file_path
+
+        with stage_timer(timings, "reuse"):
+            result = letter_cache.lookup(company, job_desc, resume_key)
+
+    if result is None:
+        result = generate_cover_letter_markdown(job_desc, job_id, config, timings, backend)
+        if letter_cache is not None:
+            letter_cache.add(job_id, company, job_desc, result, resume_key)
+
+    with stage_timer(timings, "render"):
+        file_path = render_cover_letter(result, job_id, render_pool)
+
+    if letter_cache is not None:
+        letter_cache.record_pdf(job_id, resume_key)
+
+    return file_path
+
+
+def generate_cover_letter_markdown(
+    job_desc: str,
+    job_id: int,
+    config: dict,
+    timings: dict = None,
+    backend: LLMBackend = None,
+) -> str:
+    """
+    Generates the markdown body of a cover letter. When the resume and job description fit in the
+    direct prompt token budget they are sent straight to the chat model; otherwise the relevant
+    chunks are retrieved from a vector store first.
+    """
+    backend = backend or get_backend(config)
+
+    with stage_timer(timings, "load"):
+        resume_text = load_resume_text(config)
+
+    token_budget = config.get(
+        const.DIRECT_PROMPT_TOKEN_BUDGET, const.DEFAULT_DIRECT_PROMPT_TOKEN_BUDGET
+    )
+    prompt_tokens = (
+        count_tokens(const.COVER_LETTER_PROMPT)
+        + count_tokens(resume_text)
+        + count_tokens(job_desc)
+    )
+
+    if prompt_tokens <= token_budget:
+        GENERATION_PATHS["direct"] += 1
+        print(f"Generating cover letter via direct prompt ({prompt_tokens} tokens)")
+        return generate_direct(resume_text, job_desc, job_id, backend, timings)
+
+    GENERATION_PATHS["retrieval"] += 1
+    print(
+        f"Generating cover letter via retrieval ({prompt_tokens} tokens exceeds budget of {token_budget})"
+    )
+    return generate_with_retrieval(job_desc, job_id, config, backend, timings)
+
+
+def generate_direct(
+    resume_text: str,
+    job_desc: str,
+    job_id: int,
+    backend: LLMBackend,
+    timings: dict = None,
+) -> str:
+    """
+    Sends the prompt, full resume and job description to the chat model in a single request
+    """
+    message = const.DIRECT_PROMPT_TEMPLATE.format(
+        prompt=const.COVER_LETTER_PROMPT,
+        resume=resume_text,
+        job_description=job_desc,
+    )
+
+    return invoke_model(message, job_id, "direct", backend, timings)
+
+
+def invoke_model(
+    message: str, job_id: int, path: str, backend: LLMBackend, timings: dict = None
+) -> str:
+    """
+    Sends the final prompt to the chat model, logging its size in tokens and how long generation took
+    """
+    prompt_tokens = count_tokens(message)
+
+    generation = {}
+    with stage_timer(generation, "generate"):
+        result = backend.chat_model().invoke(message).content
+
+    seconds = generation["generate"]
+    if timings is not None:
+        timings["generate"] = timings.get("generate", 0.0) + seconds
+    PROMPT_STATS.append((job_id, path, prompt_tokens, seconds))
+    print(
+        f"Cover letter for job {job_id}: {prompt_tokens} prompt tokens, generated in {seconds:.1f}s ({path})"
+    )
+
+    return result
+
+
+def generate_with_retrieval(
+    job_desc: str,
+    job_id: int,
+    config: dict,
+    backend: LLMBackend,
+    timings: dict = None,
+) -> str:
     """
-    Generates a custom cover letter based on the job description and returns the file path
+    Embeds the resume and job description chunks into a temporary Chroma collection, then fills the
+    retrieval prompt budget with the best-ranked chunks of each: resume chunks ranked by similarity to
+    the job description, and job chunks ranked by similarity to the cover letter prompt
     """
-    resume_doc = load_resume(config)
-    resume_doc.extend(text_to_doc_splitter(job_desc))
+    # Resume chunks are cached, so only the job description needs splitting per letter
+    with stage_timer(timings, "load"):
+        resume_docs = load_resume(config)
 
-    documents = split_text_documents(resume_doc)
+    with stage_timer(timings, "split"):
+        job_docs = split_text(job_desc, "job")
+
+    # Chunks embedded before (the resume, a retried job) come from the on-disk cache instead of the API
+    embeddings = backend.embeddings()
+    if config.get(const.EMBEDDING_CACHE_DIR):
+        embeddings = CachedEmbeddings(embeddings, config[const.EMBEDDING_CACHE_DIR])
 
     collection_name = f"job_{job_id}"
-    vectordb = Chroma.from_documents(
-        documents,
-        embedding=OpenAIEmbeddings(openai_api_key=os.getenv("OPENAI_API_KEY")),
-        collection_name=collection_name,
+    with stage_timer(timings, "embed"):
+        vectordb = Chroma.from_documents(
+            resume_docs + job_docs,
+            embedding=embeddings,
+            collection_name=collection_name,
+        )
+
+    try:
+        with stage_timer(timings, "retrieve"):
+            ranked_resume = vectordb.similarity_search(
+                job_desc, k=len(resume_docs), filter={"source": "resume"}
+            )
+            ranked_job = vectordb.similarity_search(
+                const.COVER_LETTER_PROMPT, k=len(job_docs), filter={"source": "job"}
+            )
+    finally:
+        vectordb.delete_collection()
+
+    # Whatever the template and question don't use of the budget goes to context chunks
+    prompt_budget = config.get(
+        const.RETRIEVAL_PROMPT_TOKEN_BUDGET, const.DEFAULT_RETRIEVAL_PROMPT_TOKEN_BUDGET
     )
+    context_budget = prompt_budget - count_tokens(
+        const.RETRIEVAL_PROMPT_TEMPLATE.format(context="", question=const.COVER_LETTER_PROMPT)
+    )
+    context_docs = select_chunks([ranked_resume, ranked_job], context_budget)
 
-    pdf_qa = RetrievalQA.from_chain_type(
-        ChatOpenAI(
-            temperature=0.7,
-            model_name="gpt-4.1-nano",
-            openai_api_key=os.getenv("OPENAI_API_KEY"),
-        ),
-        retriever=vectordb.as_retriever(search_kwargs={"k": 6}),
-        chain_type="stuff",
+    # Same "stuff" prompt RetrievalQA builds, sent directly so retrieval and generation can be timed apart
+    message = const.RETRIEVAL_PROMPT_TEMPLATE.format(
+        context="\n\n".join(doc.page_content for doc in context_docs),
+        question=const.COVER_LETTER_PROMPT,
     )
 
-    result = pdf_qa.run(const.COVER_LETTER_PROMPT)
+    return invoke_model(message, job_id, "retrieval", backend, timings)
 
-    vectordb.delete_collection()
 
-    cover_letter_dir = os.getenv("COVER_LETTER_PATH")
-    os.makedirs(cover_letter_dir, exist_ok=True)
-    file_path = os.path.join(cover_letter_dir, f"{job_id}.pdf")
+def select_chunks(ranked_lists: list, token_budget: int) -> list:
+    """
+    Picks chunks from several best-first lists in turns (best of each list, then second best, ...), skipping
+    chunks that no longer fit, until token_budget is spent. Returns them grouped by list, in document order.
+    """
+    selected = [[] for _ in ranked_lists]
+    remaining = token_budget
 
-    # Normalize Unicode characters that Helvetica (latin-1) can't render
-    replacements = {
-        "\u2018": "'", "\u2019": "'",   # smart single quotes
-        "\u201c": '"', "\u201d": '"',   # smart double quotes
-        "\u2013": "-", "\u2014": "--",  # en-dash, em-dash
-        "\u2026": "...",                # ellipsis
-        "\u00a0": " ",                  # non-breaking space
-    }
-    for orig, repl in replacements.items():
-        result = result.replace(orig, repl)
-    result = result.encode("latin-1", "replace").decode("latin-1")
+    for rank in range(max((len(ranked) for ranked in ranked_lists), default=0)):
+        for index, ranked in enumerate(ranked_lists):
+            if rank >= len(ranked):
+                continue
+            doc = ranked[rank]
+            tokens = doc.metadata.get("tokens") or count_tokens(doc.page_content)
+            if tokens <= remaining:
+                selected[index].append(doc)
+                remaining -= tokens
 
-    html_body = markdown.markdown(result)
+    return [
+        doc
+        for docs in selected
+        for doc in sorted(docs, key=lambda doc: doc.metadata.get("start_index", 0))
+    ]
 
-    pdf = FPDF()
-    pdf.set_margins(25, 25, 25)
-    pdf.add_page()
-    pdf.set_font("Helvetica", size=11)
-    pdf.write_html(html_body)
-    pdf.output(file_path)
 
-    return file_path
+@contextmanager
+def stage_timer(timings: dict, stage: str):
+    """
+    Adds the seconds spent in the with-block to timings[stage] (no-op when timings is None)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+
+
+def count_tokens(text: str) -> int:
+    """
+    Counts the tokens in text using the model's tiktoken encoding, falling back to a
+    4-characters-per-token estimate when the encoding isn't available.
+    """
+    global _token_encoder
+
+    if not text:
+        return 0
+
+    if _token_encoder is None:
+        try:
+            import tiktoken
+
+            try:
+                _token_encoder = tiktoken.encoding_for_model(const.MODEL_NAME)
+            except KeyError:
+                _token_encoder = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            # tiktoken missing, or its encoding couldn't be downloaded (e.g. offline)
+            print(f"Warning: Estimating token counts without tiktoken: {e}")
+            _token_encoder = False
 
+    if _token_encoder is False:
+        return len(text) // 4 + 1
 
-def load_resume(config: dict) -> list[str]:
+    return len(_token_encoder.encode(text))
+
+
+def render_cover_letter(result: str, job_id: int, render_pool=None) -> str:
+    """
+    Renders the cover letter markdown to {job_id}.pdf in COVER_LETTER_PATH and returns the file path.
+    Rendering happens in render_pool's worker processes when one is given.
+    """
+    file_path = cover_letter_file_path(job_id)
+
+    if render_pool is not None:
+        return render_pool.render(result, file_path)
+
+    return render_markdown_to_pdf(result, file_path)
+
+
+def cover_letter_file_path(job_id: int) -> str:
+    """
+    Returns the path a job's cover letter PDF is rendered to
+    """
+    return os.path.join(os.getenv("COVER_LETTER_PATH"), f"{job_id}.pdf")
+
+
+def load_resume(config: dict) -> list:
     """
     Loads the resume file from the specified path and returns the text content in chunks
     """
-    pdf_reader = PdfReader(config[const.RESUME_PATH])
-    text = ""
-    for page in pdf_reader.pages:
-        text += page.extract_text()
+    return list(load_cached_resume(config)[1])
+
+
+def load_cached_resume(config: dict) -> tuple:
+    """
+    Returns (text, chunks) for the resume. Extraction and chunking are cached by the hash of the
+    resume file, in memory for the process and on disk across runs, so a new or edited resume is
+    picked up automatically.
+    """
+    resume_path = config[const.RESUME_PATH]
+    cache_key = resume_cache_key(resume_path)
 
-    document = text_to_doc_splitter(text)
+    if cache_key in _resume_cache:
+        return _resume_cache[cache_key]
 
-    return document
+    cache_file = os.path.join(const.RESUME_CACHE_DIR, f"{cache_key}.json")
+    cached_resume = None
 
+    if os.path.isfile(cache_file):
+        try:
+            with open(cache_file, mode="r", encoding="utf-8") as f:
+                cached = json.load(f)
+            documents = [
+                Document(page_content=chunk["page_content"], metadata=chunk["metadata"])
+                for chunk in cached["chunks"]
+            ]
+            cached_resume = (cached["text"], documents)
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable resume cache {cache_file}: {e}")
+            cached_resume = None
 
-def split_text_documents(docs: list):
-    text_splitter = CharacterTextSplitter(chunk_size=1000, chunk_overlap=20)
-    documents = text_splitter.split_documents(docs)
-    return documents
+    if cached_resume is None:
+        text = load_resume_text(config)
+        documents = split_text(text, "resume")
+        write_resume_cache(cache_file, text, documents)
+        cached_resume = (text, documents)
 
+    _resume_cache[cache_key] = cached_resume
+
+    return cached_resume
+
+
+def resume_cache_key(resume_path: str) -> str:
+    """
+    Returns the cache key for a resume: a hash of the file contents and the chunking parameters,
+    so changing either one invalidates the cached chunks.
+    """
+    digest = hashlib.sha256(resume_file_hash(resume_path).encode("utf-8"))
+    digest.update(const.RESUME_CHUNKING_VERSION.encode("utf-8"))
 
-def text_to_doc_splitter(text: str):
-    spliiter = RecursiveCharacterTextSplitter(
-        chunk_size=10000,
-        chunk_overlap=0,
-        length_function=len,
+    return digest.hexdigest()
+
+
+def write_resume_cache(cache_file: str, text: str, documents: list) -> None:
+    """
+    Atomically writes the extracted resume text and chunks to the on-disk cache
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_file = f"{cache_file}.tmp"
+        with open(tmp_file, mode="w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "text": text,
+                    "chunks": [
+                        {"page_content": doc.page_content, "metadata": doc.metadata}
+                        for doc in documents
+                    ],
+                },
+                f,
+            )
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        print(f"Warning: Could not write resume cache {cache_file}: {e}")
+
+
+def split_text(text: str, source: str) -> list:
+    """
+    Splits text into chunks of at most RETRIEVAL_CHUNK_TOKENS tokens. Each chunk's metadata records its
+    source ("resume" or "job"), where it starts in the text and its token count.
+    """
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=const.RETRIEVAL_CHUNK_TOKENS,
+        chunk_overlap=const.RETRIEVAL_CHUNK_OVERLAP_TOKENS,
+        length_function=count_tokens,
         add_start_index=True,
     )
-    document = spliiter.create_documents([text])
-    return document
+    documents = splitter.create_documents([text], metadatas=[{"source": source}])
+    for document in documents:
+        document.metadata["tokens"] = count_tokens(document.page_content)
+
+    return documents
@@ -0,0 +1,162 @@
+# Local imports
+import constants as const
+
+# Standard imports
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+
+class CoverLetterPrefetcher:
+    """
+    Generates cover letters on a background thread pool so the apply modal never waits on the LLM.
+    Jobs are submitted as soon as their description is known, and the upload step waits on the
+    job's future, which is usually already done by the time the modal asks for a cover letter.
+    """
+
+    def __init__(
+        self,
+        config: dict,
+        max_workers: int = 2,
+        max_pending: int = 3,
+        render_pool=None,
+        tracer=None,
+        letter_cache=None,
+    ) -> None:
+        """
+        Initializes the prefetcher. At most max_pending letters are queued or in flight at once;
+        jobs submitted beyond that are generated synchronously when they are needed.
+        PDFs are rendered in render_pool's processes when one is given, and per-stage timings are
+        recorded as cover_letter.* spans on tracer when one is given. letter_cache, if given, lets
+        near-identical postings reuse an earlier letter.
+        """
+        self.config = config
+        self.render_pool = render_pool
+        self.tracer = tracer
+        self.letter_cache = letter_cache
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cover-letter"
+        )
+        self.futures = {}
+        self.lock = threading.Lock()
+
+        # Background letters that were used, and ones discarded after they'd already started (paid for but unused)
+        self.used = 0
+        self.wasted = 0
+
+    def generate(self, job_details: dict) -> str:
+        """
+        Generates one cover letter and records its stage timings. Returns the file path.
+        """
+        # Imported on first use so creating a prefetcher doesn't load LangChain
+        from cover_letter_generator import generate_cover_letter
+
+        job_id = job_details[const.JOB_ID]
+        timings = {}
+        file_path = generate_cover_letter(
+            job_details[const.JOB_DESCRIPTION],
+            job_id,
+            self.config,
+            self.render_pool,
+            timings,
+            company=job_details.get(const.COMPANY_NAME),
+            letter_cache=self.letter_cache,
+        )
+
+        if self.tracer:
+            self.tracer.record_stages("cover_letter", timings, job_id=job_id)
+
+        return file_path
+
+    def pending(self) -> int:
+        """
+        Returns the number of letters that are queued or still being generated.
+        """
+        with self.lock:
+            return sum(1 for future in self.futures.values() if not future.done())
+
+    def submit(self, job_details: dict) -> bool:
+        """
+        Starts generating the cover letter for a job in the background.
+        Returns True if the job is queued (or already was), False if the queue is full or the job has no description.
+        """
+        job_id = job_details.get(const.JOB_ID)
+        job_desc = job_details.get(const.JOB_DESCRIPTION)
+        if not job_id or not job_desc:
+            return False
+
+        with self.lock:
+            if job_id in self.futures:
+                return True
+
+            in_flight = sum(1 for future in self.futures.values() if not future.done())
+            if in_flight >= self.max_pending:
+                return False
+
+            self.futures[job_id] = self.executor.submit(self.generate, job_details)
+
+        print(f"Started background cover letter generation for job {job_id}")
+
+        return True
+
+    def result(self, job_details: dict, timeout: float = None) -> str:
+        """
+        Returns the cover letter file path for a job, waiting on its background generation if one was
+        started and generating it on the calling thread otherwise.
+        """
+        job_id = job_details[const.JOB_ID]
+
+        with self.lock:
+            future = self.futures.pop(job_id, None)
+
+        if future is None or future.cancelled():
+            return self.generate(job_details)
+
+        with self.lock:
+            self.used += 1
+
+        if not future.done():
+            print(f"Waiting for background cover letter for job {job_id}...")
+
+        return future.result(timeout=timeout)
+
+    def discard(self, job_id: str) -> None:
+        """
+        Drops a job that turned out to be skipped, cancelling its generation if it hasn't started yet.
+        A generation that already started or finished can't be taken back and counts as wasted.
+        """
+        with self.lock:
+            future = self.futures.pop(job_id, None)
+
+        if future is None:
+            return
+
+        if future.cancel():
+            print(f"Cancelled background cover letter for skipped job {job_id}")
+        else:
+            with self.lock:
+                self.wasted += 1
+
+    def summary(self) -> str:
+        """
+        Returns a one-line summary of background cover letters for the run.
+        """
+        with self.lock:
+            return (
+                f"Background cover letters: {self.used} used, {self.wasted} generated for jobs that "
+                f"didn't need one (lower COVER_LETTER_WORKERS/COVER_LETTER_QUEUE_DEPTH if this is high)"
+            )
+
+    def shutdown(self) -> None:
+        """
+        Cancels queued work and waits for running generations to finish.
+        The render pool is owned by the caller and left running.
+        """
+        with self.lock:
+            futures = list(self.futures.values())
+            self.futures.clear()
+
+        for future in futures:
+            future.cancel()
+
+        self.executor.shutdown(wait=True)
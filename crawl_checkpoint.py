@@ -0,0 +1,95 @@
+# Standard imports
+import json
+import os
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+def page_url(search_url: str, page: int) -> str:
+    """
+    Returns the search URL with its page= query parameter set to page (1-based).
+    """
+    parts = urlsplit(search_url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != "page"]
+    query.append(("page", str(page)))
+
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def job_id_from_url(url: str):
+    """
+    Extracts the job ID from a /jobs/<id> or /job-search/<id> URL. Returns None if the URL has no job ID.
+    """
+    if not url:
+        return None
+
+    # Handle both /jobs/ and /job-search/ URL patterns
+    for marker in ("/jobs/", "/job-search/"):
+        if marker in url:
+            return url.split(marker)[1].split("?")[0].split("#")[0].strip("/") or None
+
+    return None
+
+
+class CrawlCheckpoint:
+    """
+    Remembers where the listing crawl got to (page, job index and the last completed job ID) so a
+    restarted run can resume there. The checkpoint is tied to the search URL and the phase
+    (interleaved crawl-and-apply, or crawl only) it was made for.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def load(self, search_url: str, phase: str = "interleaved"):
+        """
+        Returns the saved {page, job_index, job_id} for this search and phase, or None if there is nothing to resume.
+        """
+        if not self.path or not os.path.isfile(self.path):
+            return None
+
+        try:
+            with open(self.path, mode="r", encoding="utf-8") as f:
+                state = json.load(f)
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable checkpoint {self.path}: {e}")
+            return None
+
+        if state.get("search_url") != search_url or state.get("phase", phase) != phase:
+            return None
+
+        return state
+
+    def save(
+        self,
+        search_url: str,
+        page: int,
+        job_index: int,
+        job_id: str = None,
+        phase: str = "interleaved",
+    ) -> None:
+        """
+        Atomically records that jobs up to job_index (and job_id) on page are done.
+        """
+        if not self.path:
+            return
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, mode="w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "search_url": search_url,
+                    "page": page,
+                    "job_index": job_index,
+                    "job_id": job_id,
+                    "phase": phase,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        """
+        Removes the checkpoint once the crawl has finished.
+        """
+        if self.path and os.path.isfile(self.path):
+            os.remove(self.path)
@@ -1,9 +1,20 @@
 # Local imports
-from cover_letter_generator import generate_cover_letter
+from applied_jobs_store import AppliedJobsStore
+from cover_letter_prefetcher import CoverLetterPrefetcher
+from pacer import Pacer
+from tracing import Tracer
+from crawl_checkpoint import job_id_from_url, page_url
+from job_queue import APPLY_TYPE_NONE, APPLY_TYPE_QUICK
+from tab_prefetcher import TabPrefetcher
+from relevance import RelevanceScorer
+from resume_text import load_resume_text
+from cover_letter_cache import CoverLetterCache
+from skipped_jobs import SkippedJobsCache
 
 # Imports
-import csv
 import os
+import threading
+from collections import Counter
 from datetime import datetime
 import constants as const
 import time
@@ -13,6 +24,69 @@ from selenium import webdriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
+
+
+# Returns the job page fields parse_job_details needs; missing elements come back as null
+JOB_DETAILS_SCRIPT = """
+const byXPath = (xpath) => document.evaluate(
+    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+const text = (element) => (element ? element.innerText.trim() : null);
+
+const companyLink = byXPath("//a[contains(@href, '/e/')][@aria-label][@data-size='xlarge']");
+const title = byXPath("//h1[contains(@class, 'sc-')]");
+const viewMore = document.querySelector("button.view-more-button");
+
+let applyType = "none";
+if (document.querySelector("button[aria-label='Apply']")) {
+    applyType = "apply";
+} else if (document.querySelector("button[aria-label='Apply externally']")) {
+    applyType = "external";
+}
+
+return {
+    url: window.location.href,
+    apply_type: applyType,
+    company_name: companyLink ? companyLink.getAttribute("aria-label") : null,
+    job_title: text(title),
+    job_description: viewMore ? text(viewMore.parentElement) : null,
+};
+"""
+
+# Returns the absolute href of every job link inside the job result cards
+JOB_LINKS_SCRIPT = """
+const links = document.evaluate(
+    "//div[contains(@data-hook, 'job-result-card')]//a[contains(@href, '/job-search/')]",
+    document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+);
+const urls = [];
+for (let i = 0; i < links.snapshotLength; i++) {
+    urls.push(links.snapshotItem(i).href);
+}
+return urls;
+"""
+
+# Returns the apply modal's text and, per fieldset, its legend, full text, element and file input (null if the modal isn't open)
+MODAL_SNAPSHOT_SCRIPT = """
+const modal = document.querySelector("div[data-hook='apply-modal-content']");
+if (!modal) {
+    return null;
+}
+
+return {
+    text: modal.innerText,
+    fieldsets: Array.from(modal.querySelectorAll("fieldset")).map((fieldset) => {
+        const legend = fieldset.querySelector("legend");
+        return {
+            legend: legend ? legend.innerText.trim() : "",
+            text: fieldset.innerText,
+            element: fieldset,
+            file_input: fieldset.querySelector("input[type='file']"),
+        };
+    }),
+};
+"""
 
 
 class DriverHandler:
@@ -29,6 +103,88 @@ class DriverHandler:
         self.driver = driver
         self.config = config
         self.default_timeout = default_timeout
+        self.command_count = 0
+        self._count_driver_commands()
+        self.applied_jobs = AppliedJobsStore()
+        skipped_jobs_file = config.get(const.SKIPPED_JOBS_FILE)
+        self.skipped_jobs = (
+            SkippedJobsCache(skipped_jobs_file, config) if skipped_jobs_file else None
+        )
+        self.page_ready_times = []
+        self.tracer = Tracer(config.get(const.TRACE_FILE))
+        self.pacer = Pacer(
+            actions_per_minute=config.get(
+                const.PACE_ACTIONS_PER_MINUTE, const.DEFAULT_PACE_ACTIONS_PER_MINUTE
+            ),
+            burst=config.get(const.PACE_BURST, const.DEFAULT_PACE_BURST),
+            slow_seconds=config.get(
+                const.PACE_SLOW_SECONDS, const.DEFAULT_PACE_SLOW_SECONDS
+            ),
+        )
+
+        # Reuse of letters written for near-identical postings (disabled when the threshold is 0)
+        self.letter_cache = None
+        reuse_threshold = config.get(
+            const.COVER_LETTER_REUSE_THRESHOLD,
+            const.DEFAULT_COVER_LETTER_REUSE_THRESHOLD,
+        )
+        if config[const.INCLUDE_COVER_LETTER] and reuse_threshold:
+            self.letter_cache = CoverLetterCache(threshold=reuse_threshold)
+
+        # Background cover letter generation (disabled when no workers are configured)
+        self.cover_letters = None
+        self.render_pool = None
+        if config[const.INCLUDE_COVER_LETTER] and config.get(
+            const.COVER_LETTER_WORKERS, const.DEFAULT_COVER_LETTER_WORKERS
+        ):
+            render_workers = config.get(
+                const.RENDER_WORKERS, const.DEFAULT_RENDER_WORKERS
+            )
+            if render_workers:
+                # Imported here so runs without cover letters never load fpdf
+                from pdf_renderer import PdfRenderPool
+
+                self.render_pool = PdfRenderPool(max_workers=render_workers)
+
+            self.cover_letters = CoverLetterPrefetcher(
+                config,
+                max_workers=config.get(
+                    const.COVER_LETTER_WORKERS, const.DEFAULT_COVER_LETTER_WORKERS
+                ),
+                max_pending=config.get(
+                    const.COVER_LETTER_QUEUE_DEPTH,
+                    const.DEFAULT_COVER_LETTER_QUEUE_DEPTH,
+                ),
+                render_pool=self.render_pool,
+                tracer=self.tracer,
+                letter_cache=self.letter_cache,
+            )
+
+        # Local resume/description relevance scoring (jobs below a positive threshold are skipped).
+        # The scorer is built on first use and scoring is turned off if the resume can't be read.
+        self.relevance_threshold = config.get(
+            const.RELEVANCE_THRESHOLD, const.DEFAULT_RELEVANCE_THRESHOLD
+        )
+        self.relevance_enabled = True
+        self.relevance_scorer = None
+
+        # Background tabs that load upcoming job pages (disabled when no tabs are configured)
+        self.tabs = None
+        prefetch_tabs = config.get(const.PREFETCH_TABS, const.DEFAULT_PREFETCH_TABS)
+        if prefetch_tabs:
+            self.tabs = TabPrefetcher(self, prefetch_tabs)
+
+    def _count_driver_commands(self) -> None:
+        """
+        Wraps the driver's execute method so every WebDriver command (each HTTP call to chromedriver) is counted in command_count.
+        """
+        execute = self.driver.execute
+
+        def counted_execute(driver_command, params=None):
+            self.command_count += 1
+            return execute(driver_command, params)
+
+        self.driver.execute = counted_execute
 
     def get_driver(self) -> webdriver.Chrome:
         """
@@ -36,10 +192,92 @@ class DriverHandler:
         """
         return self.driver
 
+    def navigate(self, url: str) -> float:
+        """
+        Paced driver.get. The page load time is reported to the pacer so it can back off when the site is slow.
+        Returns the seconds spent waiting on the pacer before the load started.
+        """
+        waited = self.pacer.wait()
+        start = time.perf_counter()
+        try:
+            with self.tracer.span("navigate"):
+                self.driver.get(url)
+        except TimeoutException:
+            self.pacer.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.pacer.record(time.perf_counter() - start)
+
+        return waited
+
+    def click(self, element) -> None:
+        """
+        Paced click for elements that trigger a request to the server.
+        """
+        self.pacer.wait()
+        element.click()
+
+    def wait_until(self, condition, timeout: int = None, timeout_is_slowness: bool = True):
+        """
+        WebDriverWait(...).until(condition) that reports how long the wait took (or that it timed out) to the pacer.
+        Pass timeout_is_slowness=False for waits on elements that may legitimately never appear, so their timeouts
+        don't make the pacer back off.
+        """
+        start = time.perf_counter()
+        try:
+            result = WebDriverWait(self.driver, timeout or self.default_timeout).until(
+                condition
+            )
+        except TimeoutException:
+            if timeout_is_slowness:
+                self.pacer.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.pacer.record(time.perf_counter() - start)
+
+        return result
+
+    def close(self) -> None:
+        """
+        Stops background work owned by the handler.
+        """
+        if self.cover_letters:
+            self.cover_letters.shutdown()
+        if self.render_pool:
+            self.render_pool.shutdown()
+        self.tracer.close()
+
+    def warm_cover_letter_stack(self) -> threading.Thread:
+        """
+        Reads the resume, and imports the cover letter stack (LangChain, Chroma) when cover letters are enabled, on a
+        background thread, so both are ready by the first application without delaying startup. Call it before login,
+        which mostly waits anyway. Returns the thread.
+        """
+
+        def warm():
+            try:
+                if self.config[const.INCLUDE_COVER_LETTER]:
+                    from cover_letter_generator import load_resume
+
+                    load_resume(self.config)
+                else:
+                    load_resume_text(self.config)
+            except Exception as e:
+                print(f"Warning: Could not preload the cover letter stack: {e}")
+
+        thread = threading.Thread(target=warm, name="warm-cover-letters", daemon=True)
+        thread.start()
+
+        return thread
+
     def login(self, user_timeout: int = 300) -> None:
         """
         Logs in to Handshake using the provided credentials and login URL. This method handles the entire authentication flow, including SSO and Duo authentication.
+        The flow is skipped when the persistent browser profile already holds a valid session.
         """
+        # With a persistent Chrome profile the previous run's session is usually still valid
+        if self.config.get(const.CHROME_PROFILE_DIR) and self.session_is_valid():
+            print("Reusing saved Handshake session, skipping login")
+            return
+
         print("Authenticating to Handshake...")
 
         try:
@@ -84,12 +322,29 @@ class DriverHandler:
 
         print("Successfully logged in to Handshake!")
 
+    def session_is_valid(self, timeout: int = 5) -> bool:
+        """
+        Returns True if the browser is already logged in to Handshake, i.e. the search page loads job cards instead of redirecting to login.
+        Leaves the driver on the search page when it is, so go_to_page(1) doesn't load it again.
+        """
+        try:
+            self.navigate(self.config[const.SEARCH_URL])
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "div[data-hook^='job-result-card']")
+                )
+            )
+        except Exception:
+            return False
+
+        return "/login" not in self.driver.current_url
+
     def get_total_pages(self) -> int:
         """
         Assumes the driver is at the listing page. Returns the total number of pages of listings.
         """
         # Wait for the pagination element to load
-        pagination = WebDriverWait(self.driver, self.default_timeout).until(
+        pagination = self.wait_until(
             EC.presence_of_element_located(
                 (By.XPATH, "//nav[@data-hook='job-search-pagination']")
             )
@@ -107,57 +362,181 @@ class DriverHandler:
 
     def get_job_postings(self) -> list:
         """
-        Assumes the driver is at the job listings page. Returns a list of job URLs (as strings) on the current page.
+        Assumes the driver is at the job listings page. Returns a list of job URLs (as strings) on the current page,
+        excluding jobs that have already been applied to.
         """
         # Wait for job cards to be present and visible
-        WebDriverWait(self.driver, self.default_timeout).until(
-            EC.presence_of_all_elements_located(
-                (By.CSS_SELECTOR, "div[data-hook^='job-result-card']")
+        with self.tracer.span("listing"):
+            self.wait_until(
+                EC.presence_of_all_elements_located(
+                    (By.CSS_SELECTOR, "div[data-hook^='job-result-card']")
+                )
             )
-        )
 
-        # Find all job links directly on the page
+        # Collect the href of every job link in one round trip instead of one get_attribute per card
         # These are the clickable links inside job cards with aria-label="View [Job Title]"
-        job_links = self.driver.find_elements(
-            By.XPATH,
-            "//div[contains(@data-hook, 'job-result-card')]//a[contains(@href, '/job-search/')]",
-        )
-
-        # Extract href attributes to get absolute URLs
-        job_urls = []
-        for job_link in job_links:
-            try:
-                url = job_link.get_attribute("href")
-                if url:  # Only add non-empty URLs
-                    job_urls.append(url)
-            except Exception as e:
-                print(f"Warning: Could not extract URL from job link: {e}")
-                continue
+        try:
+            job_urls = [url for url in self.driver.execute_script(JOB_LINKS_SCRIPT) if url]
+        except Exception as e:
+            print(f"Warning: Could not extract job URLs: {e}")
+            job_urls = []
 
         print(f"Found {len(job_urls)} job postings on this page")
 
-        return job_urls
+        # Drop jobs we've already applied to before any page navigation happens
+        new_job_urls = [
+            url for url in job_urls if not self.job_already_applied(job_id_from_url(url))
+        ]
+        skipped = len(job_urls) - len(new_job_urls)
+        if skipped:
+            print(
+                f"Skipping {skipped} already-applied job(s) ({skipped} navigation(s) avoided)"
+            )
+            self.tracer.event(
+                "skip", reason="Already applied (listing)", count=skipped
+            )
+
+        # Drop jobs an earlier visit found we can't apply to, while that result still holds
+        if self.skipped_jobs:
+            skip_reasons = Counter()
+            unskipped_job_urls = []
+            for url in new_job_urls:
+                reason = self.skipped_jobs.reason(job_id_from_url(url))
+                if reason:
+                    skip_reasons[reason] += 1
+                else:
+                    unskipped_job_urls.append(url)
+            new_job_urls = unskipped_job_urls
+
+            if skip_reasons:
+                print(
+                    f"Skipping {sum(skip_reasons.values())} previously skipped job(s) "
+                    f"({', '.join(f'{count} {reason}' for reason, count in skip_reasons.items())})"
+                )
+                for reason, count in skip_reasons.items():
+                    self.tracer.event("skip", reason=f"{reason} (cached)", count=count)
+
+        return new_job_urls
+
+    def remember_skip(self, job_id: str, reason: str) -> None:
+        """
+        Records that a job couldn't be applied to, so get_job_postings can leave it out in later runs.
+        """
+        if self.skipped_jobs:
+            self.skipped_jobs.add(job_id, reason)
+
+    def set_upcoming_jobs(self, job_urls: list, start_cover_letters: bool = True) -> None:
+        """
+        Tells the tab prefetcher which job pages will be opened next, in order. No-op without prefetch tabs.
+        """
+        if self.tabs:
+            self.tabs.set_upcoming(job_urls, start_cover_letters)
+
+    def open_job_page(self, job_url: str) -> float:
+        """
+        Navigates to a job details page (or switches to the background tab already loading it) and waits until it's
+        ready (the "Share" button is clickable). Returns the page-ready time in seconds, which is also recorded in page_ready_times.
+        Time spent waiting on the pacer isn't part of the page-ready time.
+        """
+        start = time.perf_counter()
+        paced = 0.0
+
+        # Navigate to the job details page using the URL, unless a background tab already did
+        if self.tabs and self.tabs.open(job_url):
+            self.tracer.event("tab_prefetch_hit")
+        else:
+            paced = self.navigate(job_url)
+
+        # Wait for the job details page to load by waiting for the presence of the "Share" button. A reused
+        # background tab keeps showing its previous job (Share button included) until the new page commits
+        job_id = job_id_from_url(job_url)
+        with self.tracer.span("page_ready"):
+            self.wait_until(
+                EC.all_of(
+                    EC.url_contains(job_id or ""),
+                    EC.element_to_be_clickable(
+                        (By.XPATH, "//button[text()='Share' or contains(text(), 'Share')]")
+                    ),
+                )
+            )
+
+        page_ready = time.perf_counter() - start - paced
+        self.page_ready_times.append(page_ready)
+
+        # Start loading the next jobs while this one is worked on
+        if self.tabs:
+            with self.tracer.span("tab_prefetch"):
+                self.tabs.refill()
+
+        return page_ready
+
+    def job_details(self, job_url: str) -> dict:
+        """
+        Returns the details of the open job page, reusing those parsed in its background tab if there are any.
+        """
+        job_details = self.tabs.details(job_url) if self.tabs else None
+
+        return job_details or self.parse_job_details()
 
     def apply_to_job(self, job_url: str) -> (bool, str):
         """
         Given a job URL string, navigates to the job details page, and then clicks the "Apply" button if it's present.
         Return true if success, false if failure with failure message
         """
+        self.tracer.context = {const.JOB_ID: job_id_from_url(job_url)}
+
         # Navigate to the job details page using the URL
-        self.driver.get(job_url)
+        self.open_job_page(job_url)
 
-        # Wait for the job details page to load by waiting for the presence of the "Share" button
-        WebDriverWait(self.driver, self.default_timeout).until(
-            EC.element_to_be_clickable(
-                (By.XPATH, "//button[text()='Share' or contains(text(), 'Share')]")
-            )
-        )
+        with self.tracer.span("parse"):
+            job_details = self.job_details(job_url)
 
-        job_details = self.parse_job_details()
+        return self.apply_with_details(job_details)
+
+    def apply_to_queued_job(self, job_url: str, job_details: dict) -> (bool, str):
+        """
+        Applies to a job whose details were already parsed during the crawl phase, so the page is only loaded, not parsed again.
+        Return true if success, false if failure with failure message
+        """
+        self.tracer.context = {const.JOB_ID: job_details[const.JOB_ID]}
+
+        self.open_job_page(job_url)
+
+        return self.apply_with_details(job_details)
+
+    def apply_with_details(self, job_details: dict) -> (bool, str):
+        """
+        Assumes the driver is on the job details page described by job_details. Starts its cover letter in the background and applies.
+        Return true if success, false if failure with failure message
+        """
         print(
             f"Applying to job: {job_details[const.JOB_TITLE]} at {job_details[const.COMPANY_NAME]} (ID: {job_details[const.JOB_ID]})"
         )
 
+        # Skip postings unrelated to the resume before any cover letter or Apply click is spent on them
+        if not self.is_relevant(job_details):
+            print(
+                f"Relevance score {job_details[const.RELEVANCE]:.3f} is below the threshold of {self.relevance_threshold}. Skipping this job."
+            )
+            return False, "Low relevance"
+
+        # Start the cover letter now so it's generated while the apply modal loads. External and
+        # apply-less postings never open a modal, so they never get one
+        if self.cover_letters and job_details[const.APPLY_TYPE] == APPLY_TYPE_QUICK:
+            self.cover_letters.submit(job_details)
+
+        try:
+            return self.submit_application(job_details)
+        finally:
+            # No-op if the letter was used; cancels it if the job was skipped
+            if self.cover_letters:
+                self.cover_letters.discard(job_details[const.JOB_ID])
+
+    def submit_application(self, job_details: dict) -> (bool, str):
+        """
+        Assumes the driver is on the job details page. Opens the apply modal, validates it, uploads documents and submits.
+        Return true if success, false if failure with failure message
+        """
         apply_button = None
         # Try to find the Apply button. Deals with external application cases
         try:
@@ -182,18 +561,24 @@ class DriverHandler:
                 return False, "Apply button not found"
 
         # Click the "Apply" button
-        apply_button.click()
-
-        # Wait for the application form to load by waiting for the "Submit Application" button
-        submit_button = WebDriverWait(self.driver, self.default_timeout).until(
-            EC.element_to_be_clickable(
-                (By.XPATH, "//button[text()='Submit Application']")
+        with self.tracer.span("modal_open"):
+            self.click(apply_button)
+
+            # Wait for the application form to load by waiting for the "Submit Application" button.
+            # Some Apply buttons lead elsewhere and never show one, which says nothing about server speed
+            submit_button = self.wait_until(
+                EC.element_to_be_clickable(
+                    (By.XPATH, "//button[text()='Submit Application']")
+                ),
+                timeout_is_slowness=False,
             )
-        )
 
-        valid_application = self.valid_application(
-            job_details[const.JOB_ID]
-        )  # returns (success, message)
+        with self.tracer.span("validate"):
+            # One traversal of the modal serves both validation and upload routing
+            modal = self.snapshot_modal()
+            valid_application = self.valid_application(
+                job_details[const.JOB_ID], modal
+            )  # returns (success, message)
 
         if not valid_application[0]:
             print(f"Invalid application: {valid_application[1]}. Skipping this job.")
@@ -201,15 +586,20 @@ class DriverHandler:
 
         # Upload required documents
         try:
-            self.add_documents(job_details)
+            self.add_documents(job_details, modal)
         except FileNotFoundError as e:
             print(f"Critical error - required document missing: {e}")
             return False, f"Document not found: {e}"
+        except TimeoutException as e:
+            # Submitting now would send the application without the document
+            print(f"Error uploading documents: {e.msg}. Skipping this job.")
+            return False, "Upload not confirmed"
         except Exception as e:
             print(f"Error uploading documents: {e}")
             # Log but don't fail - continue with submission
 
-        submit_button.click()
+        with self.tracer.span("submit"):
+            self.click(submit_button)
 
         print("Applied to job successfully!")
 
@@ -223,187 +613,278 @@ class DriverHandler:
 
         return True, "Applied successfully"
 
-    def add_documents(self, job_details) -> None:
+    def snapshot_modal(self):
+        """
+        Reads the open apply modal in a single script call. Returns a dict with the modal's text, the documents it asks
+        for ("resume", "transcript", "cover letter") and a list of fieldsets ({legend, text, element, file_input}),
+        or None if the modal isn't open.
+        """
+        try:
+            modal = self.driver.execute_script(MODAL_SNAPSHOT_SCRIPT)
+        except Exception as e:
+            print(f"Error reading application modal: {e}")
+            return None
+
+        if modal is not None:
+            modal_text = modal["text"].lower()
+            modal["required_documents"] = {
+                document
+                for document in ("resume", "transcript", "cover letter")
+                if f"attach your {document}" in modal_text
+            }
+
+        return modal
+
+    def add_documents(self, job_details, modal: dict = None) -> None:
         """
         Uploads documents (transcript, cover letter) to the application modal if required.
-        Should be called after the application modal is open but before submission.
+        Should be called after the application modal is open but before submission. modal is the snapshot_modal()
+        result, which is taken now if it isn't given.
+        All uploads are started together and then waited on as one: each upload counts as done once the SVGs
+        inside its own fieldset change (the checkmark appears). Raises TimeoutException if any upload isn't confirmed.
         """
         print("Checking for document upload requirements...")
 
         # Get current working directory for absolute paths
         cwd = os.getcwd()
 
-        try:
-            # Find the application modal
-            modal = WebDriverWait(self.driver, self.default_timeout).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//div[@data-hook='apply-modal-content']")
-                )
-            )
-        except Exception as e:
-            print(f"Warning: Could not find application modal: {e}")
-            return
-
-        # Find all fieldsets in the modal (each represents a form field)
-        try:
-            fieldsets = modal.find_elements(By.TAG_NAME, "fieldset")
-        except Exception as e:
-            print(f"No fieldsets found in modal: {e}")
+        if modal is None:
+            modal = self.snapshot_modal()
+        if modal is None:
+            print("Warning: Could not find application modal")
             return
 
+        # Each fieldset in the modal represents a form field
+        fieldsets = modal["fieldsets"]
         if not fieldsets:
             print("No document upload fields found in this application")
             return
 
         print(f"Found {len(fieldsets)} fieldset(s) in application modal")
 
+        # Work out every upload first, so no upload waits on another document being prepared
+        uploads = []  # (document type, absolute path, fieldset, file input)
         for fieldset in fieldsets:
-            try:
-                # Get the legend text to identify document type
-                legend_text = fieldset.text.lower()
-
-                # Determine document type and path based on legend text
-                document_path = None
-                document_type = None
-
-                if "transcript" in legend_text:
-                    if self.config[const.INCLUDE_TRANSCRIPT]:
-                        document_path = self.config[const.TRANSCRIPT_PATH]
-                        document_type = "Transcript"
-                    else:
-                        print("Skipping transcript upload (disabled in config)")
-                        continue
-
-                elif "cover letter" in legend_text:
-                    if self.config[const.INCLUDE_COVER_LETTER]:
-                        document_path = generate_cover_letter(
-                            job_details[const.JOB_DESCRIPTION],
-                            job_details[const.JOB_ID],
-                            self.config,
-                        )
-                        document_type = "Cover Letter"
-                    else:
-                        print("Skipping cover letter upload (disabled in config)")
-                        continue
+            # Identify the document type from the legend and field text
+            legend_text = f"{fieldset['legend']} {fieldset['text']}".lower()
+
+            # Determine document type and path based on legend text
+            document_path = None
+            document_type = None
+
+            if "transcript" in legend_text:
+                if self.config[const.INCLUDE_TRANSCRIPT]:
+                    document_path = self.config[const.TRANSCRIPT_PATH]
+                    document_type = "Transcript"
                 else:
-                    # Not a document we handle, skip this fieldset
+                    print("Skipping transcript upload (disabled in config)")
                     continue
 
-                # Convert to absolute path if needed
-                if document_path and not os.path.isabs(document_path):
-                    absolute_path = os.path.join(cwd, document_path)
+            elif "cover letter" in legend_text:
+                if self.config[const.INCLUDE_COVER_LETTER]:
+                    document_path = self.get_cover_letter(job_details)
+                    document_type = "Cover Letter"
                 else:
-                    absolute_path = document_path
-
-                # Verify file exists
-                if not os.path.isfile(absolute_path):
-                    raise FileNotFoundError(
-                        f"{document_type} file not found at: {absolute_path}"
-                    )
-
-                # Find the file input within this fieldset
-                try:
-                    file_input = fieldset.find_element(
-                        By.XPATH, ".//input[@type='file']"
-                    )
-                except Exception as e:
-                    print(f"Could not find file input in {document_type} fieldset: {e}")
+                    print("Skipping cover letter upload (disabled in config)")
                     continue
+            else:
+                # Not a document we handle, skip this fieldset
+                continue
 
-                print(f"Uploading {document_type}: {absolute_path}")
+            # Convert to absolute path if needed
+            if document_path and not os.path.isabs(document_path):
+                absolute_path = os.path.join(cwd, document_path)
+            else:
+                absolute_path = document_path
 
-                # Upload the file using send_keys
-                file_input.send_keys(absolute_path)
+            # Verify file exists
+            if not absolute_path or not os.path.isfile(absolute_path):
+                raise FileNotFoundError(
+                    f"{document_type} file not found at: {absolute_path}"
+                )
 
-                # Wait for upload completion (SVG checkmark appears in fieldset)
-                try:
-                    WebDriverWait(self.driver, self.default_timeout).until(
-                        EC.presence_of_element_located((By.XPATH, ".//svg"))
-                    )
-                    print(f"{document_type} uploaded successfully!")
-                except Exception as e:
-                    print(f"Warning: Could not confirm {document_type} upload: {e}")
-
-            except FileNotFoundError as e:
-                raise e
-            except Exception as e:
-                print(f"Error processing {document_type} fieldset: {e}")
+            if fieldset["file_input"] is None:
+                print(f"Could not find file input in {document_type} fieldset")
                 continue
 
+            uploads.append(
+                (document_type, absolute_path, fieldset["element"], fieldset["file_input"])
+            )
+
+        if uploads:
+            self.upload_documents(uploads)
+
         print("Document upload check complete")
 
-    def go_to_next_page(self) -> None:
+    def upload_documents(self, uploads: list) -> None:
         """
-        Navigates to the next page of job listings by clicking the "Next" button in the pagination.
-        Assumes that the driver is currently on a job listings page.
+        Starts every (document type, path, fieldset, file input) upload at once, then waits on a single condition
+        until the SVG markup of each fieldset differs from what it was before its upload started.
         """
-        next_button = WebDriverWait(self.driver, self.default_timeout).until(
-            EC.element_to_be_clickable(
-                (
-                    By.XPATH,
-                    "//nav[@data-hook='job-search-pagination']//button[@aria-label='next page']",
+        fieldsets = [fieldset for _, _, fieldset, _ in uploads]
+        svg_markup = (
+            "return arguments[0].map((fieldset) => "
+            "Array.from(fieldset.querySelectorAll('svg'), (svg) => svg.outerHTML).join(''));"
+        )
+
+        # Fieldsets may already hold icons, and the checkmark may replace one rather than be added,
+        # so completion is any change from each fieldset's own baseline
+        baselines = self.driver.execute_script(svg_markup, fieldsets)
+
+        with self.tracer.span(
+            "upload", document=", ".join(document_type for document_type, _, _, _ in uploads)
+        ):
+            for document_type, absolute_path, _, file_input in uploads:
+                print(f"Uploading {document_type}: {absolute_path}")
+                # Upload the file using send_keys
+                file_input.send_keys(absolute_path)
+
+            confirmed = [False] * len(uploads)
+
+            def all_uploads_confirmed(driver):
+                markup = driver.execute_script(svg_markup, fieldsets)
+                for index, (current, baseline) in enumerate(zip(markup, baselines)):
+                    if current != baseline and not confirmed[index]:
+                        confirmed[index] = True
+                        print(f"{uploads[index][0]} uploaded successfully!")
+                return all(confirmed)
+
+            try:
+                WebDriverWait(self.driver, self.default_timeout).until(
+                    all_uploads_confirmed
                 )
-            )
+            except TimeoutException:
+                pending = [
+                    document_type
+                    for (document_type, _, _, _), done in zip(uploads, confirmed)
+                    if not done
+                ]
+                raise TimeoutException(
+                    f"Could not confirm upload of {', '.join(pending)}"
+                )
+
+    def prefetch_cover_letters(self, upcoming_job_details: list) -> None:
+        """
+        Starts background cover letters for upcoming jobs whose descriptions are already known, up to the prefetcher's queue depth.
+        Jobs that aren't quick-apply or will be skipped for low relevance are left out.
+        """
+        if not self.cover_letters:
+            return
+
+        for job_details in upcoming_job_details:
+            if job_details[const.APPLY_TYPE] == APPLY_TYPE_QUICK and self.is_relevant(job_details):
+                self.cover_letters.submit(job_details)
+
+    def score_jobs(self, jobs: list) -> None:
+        """
+        Scores a batch of jobs against the resume in one pass, storing each score in job_details[RELEVANCE].
+        Jobs that already have a score are left as they are. Scoring is disabled if the resume can't be read.
+        """
+        unscored = [job_details for job_details in jobs if job_details.get(const.RELEVANCE) is None]
+        if not unscored or not self.relevance_enabled:
+            return
+
+        if self.relevance_scorer is None:
+            try:
+                self.relevance_scorer = RelevanceScorer(load_resume_text(self.config))
+            except Exception as e:
+                print(f"Warning: Relevance scoring disabled, could not read the resume: {e}")
+                self.relevance_enabled = False
+                return
+
+        scores = self.relevance_scorer.score_many(
+            [job_details.get(const.JOB_DESCRIPTION) for job_details in unscored]
         )
-        next_button.click()
+        for job_details, score in zip(unscored, scores):
+            job_details[const.RELEVANCE] = round(float(score), 3)
 
-    def parse_job_details(self) -> dict:
+    def is_relevant(self, job_details: dict) -> bool:
         """
-        Parses job details from the current job details page.
-        Returns a dict with job_id, company_name, job description and job_title.
+        Returns False if the job's relevance score is below RELEVANCE_THRESHOLD. Always True when the threshold isn't set.
         """
-        # Extract job ID from the current URL
-        current_url = self.driver.current_url
+        self.score_jobs([job_details])
 
-        # Handle both /jobs/ and /job-search/ URL patterns
-        if "/jobs/" in current_url:
-            job_id = current_url.split("/jobs/")[1].split("?")[0]
-        elif "/job-search/" in current_url:
-            job_id = current_url.split("/job-search/")[1].split("?")[0]
-        else:
-            job_id = None
+        score = job_details.get(const.RELEVANCE)
+        return not self.relevance_threshold or score is None or score >= self.relevance_threshold
 
-        # Extract company name - use aria-label from the employer link
-        try:
-            company_link = self.driver.find_element(
-                By.XPATH,
-                "//a[contains(@href, '/e/')][@aria-label][@data-size='xlarge']",
+    def get_cover_letter(self, job_details: dict) -> str:
+        """
+        Returns the cover letter path for a job, using the background generation if one was started.
+        Time spent blocked on it is traced as cover_letter.wait.
+        """
+        with self.tracer.span("cover_letter.wait"):
+            if self.cover_letters:
+                return self.cover_letters.result(job_details)
+
+            from cover_letter_generator import generate_cover_letter
+
+            timings = {}
+            file_path = generate_cover_letter(
+                job_details[const.JOB_DESCRIPTION],
+                job_details[const.JOB_ID],
+                self.config,
+                timings=timings,
+                company=job_details.get(const.COMPANY_NAME),
+                letter_cache=self.letter_cache,
             )
-            company_name = company_link.get_attribute("aria-label")
-        except Exception as e:
-            print(f"Error extracting company name: {e}")
-            company_name = None
+            self.tracer.record_stages("cover_letter", timings)
+
+            return file_path
+
+    def go_to_page(self, page: int) -> None:
+        """
+        Navigates directly to a page (1-based) of the job listings by setting the page= parameter of the search URL.
+        Nothing is loaded if the driver is already there, e.g. on the search page the session check at login left it on.
+        """
+        search_url = self.config[const.SEARCH_URL]
+        url = page_url(search_url, page)
 
-        # Extract job title - use h1 tag
+        if self.driver.current_url in ({url, search_url} if page == 1 else {url}):
+            return
+
+        self.navigate(url)
+
+    def parse_job_details(self) -> dict:
+        """
+        Parses job details from the current job details page.
+        Returns a dict with job_id, company_name, job description, job_title and apply_type ("apply", "external" or "none").
+        """
+        # Extract everything in a single script call instead of a find/get round trip per field
         try:
-            job_title_element = self.driver.find_element(
-                By.XPATH, "//h1[contains(@class, 'sc-')]"
-            )
-            job_title = job_title_element.text
+            details = self.driver.execute_script(JOB_DETAILS_SCRIPT)
         except Exception as e:
-            print(f"Error extracting job title: {e}")
-            job_title = None
+            print(f"Error extracting job details: {e}")
+            details = {}
 
-        # Extract job description - find the container div of the "view more" button
-        try:
-            view_more_button = self.driver.find_element(
-                By.CSS_SELECTOR, "button.view-more-button"
-            )
-            description_container = view_more_button.find_element(By.XPATH, "./..")
-            job_description = description_container.text
+        # Extract job ID from the current URL
+        job_id = job_id_from_url(details.get("url"))
+
+        # Company name comes from the aria-label of the employer link
+        company_name = details.get("company_name")
+        if company_name is None:
+            print("Error extracting company name: employer link not found")
+
+        # Job title comes from the h1 tag
+        job_title = details.get("job_title")
+        if job_title is None:
+            print("Error extracting job title: h1 not found")
+
+        # Job description is the text of the container div of the "view more" button
+        job_description = details.get("job_description")
+        if job_description is None:
+            print("Error extracting job description: view more button not found")
+        else:
             # Remove trailing button text (e.g. "Less" or "View More") if present
             for suffix in ["Less", "View More", "View more"]:
                 if job_description.endswith(suffix):
                     job_description = job_description[: -len(suffix)].rstrip()
-        except Exception as e:
-            print(f"Error extracting job description: {e}")
-            job_description = None
 
         return {
             const.JOB_ID: job_id,
             const.JOB_TITLE: job_title,
             const.COMPANY_NAME: company_name,
             const.JOB_DESCRIPTION: job_description,
+            const.APPLY_TYPE: details.get("apply_type", APPLY_TYPE_NONE),
         }
 
     def job_already_applied(self, job_id: str) -> bool:
@@ -416,22 +897,7 @@ class DriverHandler:
         Returns:
             True if the job ID exists in jobs.csv, False otherwise
         """
-        # If CSV doesn't exist, job hasn't been applied to
-        if not os.path.isfile(const.JOBS_CSV_FILE):
-            return False
-
-        # Read CSV and check if job_id exists
-        try:
-            with open(const.JOBS_CSV_FILE, mode="r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get(const.CSV_HEADER_JOB_ID) == job_id:
-                        return True
-        except Exception as e:
-            print(f"Warning: Error reading {const.JOBS_CSV_FILE}: {e}")
-            return False
-
-        return False
+        return job_id in self.applied_jobs
 
     def log_job(self, job_details: dict, documents_used: dict) -> None:
         """
@@ -441,8 +907,6 @@ class DriverHandler:
             job_details: Dict containing job_id, company_name, and job_title
             documents_used: Dict with keys 'resume', 'transcript', 'cover_letter' (True/False)
         """
-        file_exists = os.path.isfile(const.JOBS_CSV_FILE)
-
         # Get current date as MM/DD
         current_date = datetime.now().strftime("%m/%d")
 
@@ -455,36 +919,21 @@ class DriverHandler:
             "Yes" if documents_used.get("transcript", False) else "No",
             "Yes" if documents_used.get("cover_letter", False) else "No",
             current_date,
+            "" if job_details.get(const.RELEVANCE) is None else f"{job_details[const.RELEVANCE]:.3f}",
         ]
 
-        # Write to CSV
-        with open(const.JOBS_CSV_FILE, mode="a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-
-            # Write header if file is new
-            if not file_exists:
-                writer.writerow(
-                    [
-                        const.CSV_HEADER_JOB_ID,
-                        const.CSV_HEADER_COMPANY,
-                        const.CSV_HEADER_POSITION,
-                        const.CSV_HEADER_RESUME,
-                        const.CSV_HEADER_TRANSCRIPT,
-                        const.CSV_HEADER_COVER_LETTER,
-                        const.CSV_HEADER_DATE,
-                    ]
-                )
-
-            writer.writerow(row)
+        # Append to the CSV log (also updates the in-memory applied index)
+        self.applied_jobs.append(row)
 
         print(f"Logged job application to {const.JOBS_CSV_FILE}")
 
-    def valid_application(self, job_id: str) -> (bool, str):
+    def valid_application(self, job_id: str, modal: dict = None) -> (bool, str):
         """
         Checks if the current application is valid based on the presence of required fields and the configuration settings.
 
         Args:
             job_id: The job ID to check for duplicates
+            modal: The snapshot_modal() result; taken now if not given
 
         Returns (True, "") if valid, (False, "error message") if invalid.
         """
@@ -494,37 +943,27 @@ class DriverHandler:
             return False, "Already applied to this job"
 
         # Get the entire modal content to search for required fields
-        try:
-            modal = self.driver.find_element(
-                By.XPATH, "//div[@data-hook='apply-modal-content']"
-            )
-            modal_text = modal.text
-        except Exception as e:
-            print(f"Error finding application modal: {e}")
+        if modal is None:
+            modal = self.snapshot_modal()
+        if modal is None:
+            print("Error finding application modal")
             return False, "Could not find application modal"
 
+        required_documents = modal["required_documents"]
+
         # Check if job requires a resume and user doesn't want to provide one
         if not self.config[const.INCLUDE_RESUME]:
-            if (
-                "Attach your resume" in modal_text
-                or "attach your resume" in modal_text.lower()
-            ):
+            if "resume" in required_documents:
                 return False, "Job requires resume but config excludes it"
 
         # Check if job requires a transcript and user doesn't want to provide one
         if not self.config[const.INCLUDE_TRANSCRIPT]:
-            if (
-                "Attach your transcript" in modal_text
-                or "attach your transcript" in modal_text.lower()
-            ):
+            if "transcript" in required_documents:
                 return False, "Job requires transcript but config excludes it"
 
         # Check if job requires a cover letter and user doesn't want to provide one
         if not self.config[const.INCLUDE_COVER_LETTER]:
-            if (
-                "Attach your cover letter" in modal_text
-                or "attach your cover letter" in modal_text.lower()
-            ):
+            if "cover letter" in required_documents:
                 return False, "Job requires cover letter but config excludes it"
 
         return True, ""
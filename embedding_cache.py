@@ -0,0 +1,238 @@
+# Standard imports
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import Counter
+
+# External imports
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+# Hits and misses of every embedding cache in this process (query_hits/query_misses for embed_query)
+EMBEDDING_CACHE_STATS = Counter()
+_stats_lock = threading.Lock()
+
+# One store per (directory, model), shared by every cover letter in this process
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def text_key(text: str) -> str:
+    """
+    Content address of a chunk of text.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+class EmbeddingStore:
+    """
+    Append-only on-disk store of one model's embeddings: a raw float32 matrix read through a memory map,
+    plus a JSON Lines index from text hash to row that each batch of rows appends one line to. Rows are
+    written before the index line that points at them, so a crash can leave unreferenced rows but never
+    an index entry without its vector.
+    """
+
+    def __init__(self, directory: str, model: str) -> None:
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model)
+        self.data_path = os.path.join(directory, f"{slug}.f32")
+        self.index_path = os.path.join(directory, f"{slug}.jsonl")
+        self.lock = threading.Lock()
+        self.dimensions = None
+        self.rows = {}
+        self.vectors = None
+        self.in_flight = {}  # key -> Event set once the thread embedding it is done
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.isfile(self.index_path) or not os.path.isfile(self.data_path):
+            return
+
+        try:
+            with open(self.index_path, mode="r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            self.dimensions = json.loads(lines[0])["dimensions"]
+            for line in lines[1:]:
+                try:
+                    self.rows.update(json.loads(line))
+                except ValueError:
+                    # A batch whose index line was cut short by a crash; its rows are simply unreferenced
+                    continue
+            self._map()
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable embedding cache {self.index_path}: {e}")
+            self.dimensions, self.rows, self.vectors = None, {}, None
+
+    def _map(self) -> None:
+        row_count = os.path.getsize(self.data_path) // (self.dimensions * 4)
+        self.vectors = (
+            np.memmap(self.data_path, dtype=np.float32, mode="r", shape=(row_count, self.dimensions))
+            if row_count
+            else None
+        )
+
+    def _cached(self, key: str) -> bool:
+        return key in self.rows and self.vectors is not None and self.rows[key] < len(self.vectors)
+
+    def get_many(self, keys: list) -> dict:
+        """
+        Returns {key: vector} for the keys that are cached.
+        """
+        with self.lock:
+            return {key: np.array(self.vectors[self.rows[key]]) for key in keys if self._cached(key)}
+
+    def claim(self, keys: list) -> tuple:
+        """
+        Splits uncached keys into those the caller must embed (now marked in flight) and {key: Event} for
+        those another thread is already embedding or has stored since the caller looked (Event is None).
+        Every claimed key must be passed to release().
+        """
+        claimed, others = [], {}
+        with self.lock:
+            for key in keys:
+                if self._cached(key):
+                    others[key] = None
+                elif key in self.in_flight:
+                    others[key] = self.in_flight[key]
+                else:
+                    self.in_flight[key] = threading.Event()
+                    claimed.append(key)
+
+        return claimed, others
+
+    def release(self, keys: list) -> None:
+        """
+        Ends the claim on keys, waking threads waiting for them.
+        """
+        with self.lock:
+            for key in keys:
+                self.in_flight.pop(key).set()
+
+    def put_many(self, vectors: dict) -> None:
+        """
+        Appends {key: vector} to the store.
+        """
+        if not vectors:
+            return
+
+        keys = list(vectors)
+        matrix = np.asarray([vectors[key] for key in keys], dtype=np.float32)
+
+        with self.lock:
+            new_index = self.dimensions is None
+            if new_index:
+                self.dimensions = matrix.shape[1]
+            elif matrix.shape[1] != self.dimensions:
+                print(
+                    f"Warning: Not caching {matrix.shape[1]}-dimensional embeddings "
+                    f"in a {self.dimensions}-dimensional store"
+                )
+                return
+
+            os.makedirs(os.path.dirname(self.data_path) or ".", exist_ok=True)
+            with open(self.data_path, mode="ab") as f:
+                first_row = f.tell() // (self.dimensions * 4)
+                f.write(matrix.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+            rows = {key: first_row + offset for offset, key in enumerate(keys)}
+            with open(self.index_path, mode="w" if new_index else "a", encoding="utf-8") as f:
+                if new_index:
+                    f.write(json.dumps({"dimensions": self.dimensions}) + "\n")
+                f.write(json.dumps(rows) + "\n")
+            self.rows.update(rows)
+
+            self._map()
+
+
+def get_store(directory: str, model: str) -> EmbeddingStore:
+    """
+    Returns the process-wide store for a model in directory.
+    """
+    with _stores_lock:
+        if (directory, model) not in _stores:
+            _stores[(directory, model)] = EmbeddingStore(directory, model)
+        return _stores[(directory, model)]
+
+
+def model_name(embeddings: Embeddings) -> str:
+    """
+    Identifies the embedding model, so vectors from different models never mix.
+    """
+    name = getattr(embeddings, "model", None) or type(embeddings).__name__
+    dimensions = getattr(embeddings, "dimensions", None)
+
+    return f"{name}-{dimensions}" if dimensions else name
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that serves previously seen texts from an EmbeddingStore and sends only the
+    misses to the wrapped model, in one batched request. A text another thread is already embedding
+    is waited for instead of being embedded (and paid for) twice. Document and query lookups are
+    counted separately, so the reported hit rate reflects the chunks.
+    """
+
+    def __init__(self, embeddings: Embeddings, directory: str) -> None:
+        self.embeddings = embeddings
+        self.store = get_store(directory, model_name(embeddings))
+
+    def embed_documents(self, texts: list) -> list:
+        return self._embed(texts, "")
+
+    def embed_query(self, text: str) -> list:
+        return self._embed([text], "query_")[0]
+
+    def _embed(self, texts: list, stat_prefix: str) -> list:
+        keys = [text_key(text) for text in texts]
+        cached = self.store.get_many(keys)
+
+        # Each distinct uncached text is embedded once, however often it appears
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+
+        claimed, others = self.store.claim(list(missing))
+        if claimed:
+            try:
+                fresh = dict(zip(claimed, self.embeddings.embed_documents([missing[key] for key in claimed])))
+                self.store.put_many(fresh)
+            finally:
+                self.store.release(claimed)
+            cached.update({key: np.asarray(vector, dtype=np.float32) for key, vector in fresh.items()})
+
+        for event in others.values():
+            if event is not None:
+                event.wait()
+        cached.update(self.store.get_many(list(others)))
+
+        # Texts whose other thread failed (or whose vectors the store refused) are embedded here after all
+        leftover = [key for key in others if key not in cached]
+        if leftover:
+            vectors = self.embeddings.embed_documents([missing[key] for key in leftover])
+            cached.update({key: np.asarray(vector, dtype=np.float32) for key, vector in zip(leftover, vectors)})
+
+        embedded = set(claimed) | set(leftover)
+        misses = sum(1 for key in keys if key in embedded)
+        with _stats_lock:
+            EMBEDDING_CACHE_STATS[f"{stat_prefix}hits"] += len(keys) - misses
+            EMBEDDING_CACHE_STATS[f"{stat_prefix}misses"] += misses
+
+        return [cached[key].tolist() for key in keys]
+
+
+def summary() -> str:
+    """
+    Returns a one-line hit rate report for this process, for document chunks and queries separately.
+    """
+    reports = []
+    for label, prefix in (("chunk", ""), ("query", "query_")):
+        hits = EMBEDDING_CACHE_STATS[f"{prefix}hits"]
+        misses = EMBEDDING_CACHE_STATS[f"{prefix}misses"]
+        if hits + misses:
+            reports.append(f"{label} {hits} hit(s), {misses} miss(es) ({hits / (hits + misses):.0%} hit rate)")
+
+    return "Embedding cache: " + ("; ".join(reports) or "unused")
@@ -0,0 +1,151 @@
+# Local imports
+import constants as const
+
+# Standard imports
+import sqlite3
+import threading
+import time
+
+# Queue item statuses
+PENDING = "pending"
+APPLIED = "applied"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+# How a job can be applied to, as detected on its details page
+APPLY_TYPE_QUICK = "apply"
+APPLY_TYPE_EXTERNAL = "external"
+APPLY_TYPE_NONE = "none"
+
+
+class JobQueue:
+    """
+    Persistent SQLite queue of parsed job details. The crawl phase fills it from listing and detail
+    pages, and the apply phase drains it and records each job's status, so either phase can be
+    restarted and details parsed once are never fetched again.
+    """
+
+    def __init__(self, path: str = const.DEFAULT_JOB_QUEUE_FILE) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    title TEXT,
+                    company TEXT,
+                    description TEXT,
+                    apply_type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    reason TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+
+    def __contains__(self, job_id) -> bool:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT 1 FROM jobs WHERE job_id = ?", (str(job_id),)
+            ).fetchone()
+
+        return row is not None
+
+    def add(self, job_url: str, job_details: dict, apply_type: str) -> bool:
+        """
+        Stores a crawled job. Jobs that can't be quick-applied are stored as skipped right away.
+        Returns False if the job was already queued.
+        """
+        now = time.time()
+        status, reason = PENDING, None
+        if apply_type == APPLY_TYPE_EXTERNAL:
+            status, reason = SKIPPED, "External application"
+        elif apply_type == APPLY_TYPE_NONE:
+            status, reason = SKIPPED, "Apply button not found"
+
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                """
+                INSERT OR IGNORE INTO jobs
+                    (job_id, url, title, company, description, apply_type, status, reason, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    str(job_details[const.JOB_ID]),
+                    job_url,
+                    job_details.get(const.JOB_TITLE),
+                    job_details.get(const.COMPANY_NAME),
+                    job_details.get(const.JOB_DESCRIPTION),
+                    apply_type,
+                    status,
+                    reason,
+                    now,
+                    now,
+                ),
+            )
+
+        return cursor.rowcount > 0
+
+    def pending(self, max_attempts: int = 3) -> list:
+        """
+        Returns the jobs still to apply to (pending, or failed fewer than max_attempts times) in crawl order,
+        as (url, job_details) pairs.
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                """
+                SELECT * FROM jobs
+                WHERE status = ? OR (status = ? AND attempts < ?)
+                ORDER BY created_at, rowid
+                """,
+                (PENDING, FAILED, max_attempts),
+            ).fetchall()
+
+        return [
+            (
+                row["url"],
+                {
+                    const.JOB_ID: row["job_id"],
+                    const.JOB_TITLE: row["title"],
+                    const.COMPANY_NAME: row["company"],
+                    const.JOB_DESCRIPTION: row["description"],
+                    const.APPLY_TYPE: row["apply_type"],
+                },
+            )
+            for row in rows
+        ]
+
+    def mark(self, job_id: str, status: str, reason: str = None) -> None:
+        """
+        Records the outcome of an apply attempt.
+        """
+        with self.lock, self.connection:
+            self.connection.execute(
+                """
+                UPDATE jobs SET status = ?, reason = ?, attempts = attempts + 1, updated_at = ?
+                WHERE job_id = ?
+                """,
+                (status, reason, time.time(), str(job_id)),
+            )
+
+    def counts(self) -> dict:
+        """
+        Returns the number of jobs in each status.
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"
+            ).fetchall()
+
+        return {row["status"]: row["n"] for row in rows}
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
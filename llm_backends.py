@@ -0,0 +1,125 @@
+# Local imports
+import constants as const
+
+# Standard imports
+import hashlib
+import math
+import os
+import re
+import time
+from abc import ABC, abstractmethod
+
+# External imports
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+
+class LLMBackend(ABC):
+    """
+    Source of the chat model and embeddings used to write cover letters.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def chat_model(self):
+        """
+        Returns a LangChain chat model.
+        """
+
+    @abstractmethod
+    def embeddings(self) -> Embeddings:
+        """
+        Returns a LangChain embeddings model.
+        """
+
+
+class OpenAIBackend(LLMBackend):
+    """
+    OpenAI chat model and embeddings, authenticated with OPENAI_API_KEY.
+    """
+
+    name = "openai"
+
+    def chat_model(self):
+        from langchain_openai import ChatOpenAI
+
+        return ChatOpenAI(
+            temperature=const.TEMPERATURE,
+            model_name=const.MODEL_NAME,
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+        )
+
+    def embeddings(self) -> Embeddings:
+        from langchain_openai import OpenAIEmbeddings
+
+        return OpenAIEmbeddings(openai_api_key=os.getenv("OPENAI_API_KEY"))
+
+
+class FakeEmbeddings(Embeddings):
+    """
+    Deterministic, offline embeddings: words are hashed into a fixed number of buckets and the counts
+    are L2-normalized, so texts that share words are similar. Each call sleeps for latency seconds
+    to simulate an API round trip.
+    """
+
+    def __init__(self, dimensions: int = 256, latency: float = 0.0) -> None:
+        self.dimensions = dimensions
+        self.latency = latency
+
+    def embed_text(self, text: str) -> list:
+        vector = [0.0] * self.dimensions
+        for word in re.findall(r"\w+", text.lower()):
+            bucket = int.from_bytes(
+                hashlib.blake2b(word.encode("utf-8"), digest_size=4).digest(), "little"
+            )
+            vector[bucket % self.dimensions] += 1.0
+
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+
+        return [value / norm for value in vector]
+
+    def embed_documents(self, texts: list) -> list:
+        if self.latency:
+            time.sleep(self.latency)
+
+        return [self.embed_text(text) for text in texts]
+
+    def embed_query(self, text: str) -> list:
+        if self.latency:
+            time.sleep(self.latency)
+
+        return self.embed_text(text)
+
+
+class FakeBackend(LLMBackend):
+    """
+    Local stand-in for benchmarking and offline tests: deterministic embeddings and a canned
+    markdown cover letter, with configurable injected latency per call.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency: float = 0.0, response: str = const.SAMPLE_COVER_LETTER) -> None:
+        self.latency = latency
+        self.response = response
+
+    def chat_model(self):
+        return FakeListChatModel(responses=[self.response], sleep=self.latency or None)
+
+    def embeddings(self) -> Embeddings:
+        return FakeEmbeddings(latency=self.latency)
+
+
+def get_backend(config: dict) -> LLMBackend:
+    """
+    Returns the backend selected by the config (OpenAI unless LLM_BACKEND says otherwise).
+    """
+    backend = config.get(const.LLM_BACKEND) or const.DEFAULT_LLM_BACKEND
+
+    if backend == OpenAIBackend.name:
+        return OpenAIBackend()
+    if backend == FakeBackend.name:
+        return FakeBackend(latency=config.get(const.FAKE_LLM_LATENCY, 0.0))
+
+    raise ValueError(f"Unknown LLM backend: {backend}")
@@ -1,18 +1,25 @@
 # Local imports
+from browser import create_driver
+from crawl_checkpoint import CrawlCheckpoint, job_id_from_url
 from driver_handler import DriverHandler
+from job_queue import (
+    JobQueue,
+    APPLIED,
+    SKIPPED,
+    FAILED,
+    APPLY_TYPE_EXTERNAL,
+    APPLY_TYPE_NONE,
+)
 import constants as const
 
 # Standard imports
+import argparse
 import os
-import time
-import random
+import shutil
+import sys
+import tempfile
 
 # External imports
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-
-
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -29,6 +36,63 @@ config = {
     const.RESUME_PATH: os.getenv("RESUME_PATH"),
     const.TRANSCRIPT_PATH: os.getenv("TRANSCRIPT_PATH"),
     const.COVER_LETTER_PATH: os.getenv("COVER_LETTER_PATH"),
+    const.DIRECT_PROMPT_TOKEN_BUDGET: int(
+        os.getenv(
+            "DIRECT_PROMPT_TOKEN_BUDGET", const.DEFAULT_DIRECT_PROMPT_TOKEN_BUDGET
+        )
+    ),
+    const.RETRIEVAL_PROMPT_TOKEN_BUDGET: int(
+        os.getenv(
+            "RETRIEVAL_PROMPT_TOKEN_BUDGET",
+            const.DEFAULT_RETRIEVAL_PROMPT_TOKEN_BUDGET,
+        )
+    ),
+    const.EMBEDDING_CACHE_DIR: os.getenv(
+        "EMBEDDING_CACHE_DIR", const.DEFAULT_EMBEDDING_CACHE_DIR
+    ),
+    const.COVER_LETTER_WORKERS: int(
+        os.getenv("COVER_LETTER_WORKERS", const.DEFAULT_COVER_LETTER_WORKERS)
+    ),
+    const.COVER_LETTER_QUEUE_DEPTH: int(
+        os.getenv("COVER_LETTER_QUEUE_DEPTH", const.DEFAULT_COVER_LETTER_QUEUE_DEPTH)
+    ),
+    const.RENDER_WORKERS: int(
+        os.getenv("RENDER_WORKERS", const.DEFAULT_RENDER_WORKERS)
+    ),
+    const.LLM_BACKEND: os.getenv("LLM_BACKEND", const.DEFAULT_LLM_BACKEND),
+    const.FAKE_LLM_LATENCY: float(os.getenv("FAKE_LLM_LATENCY", 0)),
+    const.PACE_ACTIONS_PER_MINUTE: float(
+        os.getenv("PACE_ACTIONS_PER_MINUTE", const.DEFAULT_PACE_ACTIONS_PER_MINUTE)
+    ),
+    const.PACE_BURST: float(os.getenv("PACE_BURST", const.DEFAULT_PACE_BURST)),
+    const.PACE_SLOW_SECONDS: float(
+        os.getenv("PACE_SLOW_SECONDS", const.DEFAULT_PACE_SLOW_SECONDS)
+    ),
+    const.HEADLESS: bool(os.getenv("HEADLESS") == "True"),
+    const.LEAN_BROWSER: bool(os.getenv("LEAN_BROWSER", "True") == "True"),
+    const.TRACE_FILE: os.getenv("TRACE_FILE", const.DEFAULT_TRACE_FILE) or None,
+    const.CRAWL_CHECKPOINT_FILE: os.getenv(
+        "CRAWL_CHECKPOINT_FILE", const.DEFAULT_CRAWL_CHECKPOINT_FILE
+    ),
+    const.JOB_QUEUE_FILE: os.getenv("JOB_QUEUE_FILE", const.DEFAULT_JOB_QUEUE_FILE),
+    const.SKIPPED_JOBS_FILE: os.getenv(
+        "SKIPPED_JOBS_FILE", const.DEFAULT_SKIPPED_JOBS_FILE
+    ),
+    const.CHROME_PROFILE_DIR: os.getenv(
+        "CHROME_PROFILE_DIR", const.DEFAULT_CHROME_PROFILE_DIR
+    ),
+    const.RELEVANCE_THRESHOLD: float(
+        os.getenv("RELEVANCE_THRESHOLD", const.DEFAULT_RELEVANCE_THRESHOLD)
+    ),
+    const.COVER_LETTER_REUSE_THRESHOLD: float(
+        os.getenv(
+            "COVER_LETTER_REUSE_THRESHOLD", const.DEFAULT_COVER_LETTER_REUSE_THRESHOLD
+        )
+    ),
+    const.PREFETCH_TABS: int(os.getenv("PREFETCH_TABS", const.DEFAULT_PREFETCH_TABS)),
+    const.BLOCKED_HOSTS: [
+        host.strip() for host in os.getenv("BLOCKED_HOSTS", "").split(",") if host.strip()
+    ],
 }
 
 
@@ -36,52 +100,324 @@ def main():
     """
     Main entry point for the program. Initializes the webdriver and mass applies to jobs
     """
+    parser = argparse.ArgumentParser(description="Handshake job application bot.")
+    parser.add_argument(
+        "--compare-profiles",
+        type=int,
+        metavar="N",
+        help="Instead of applying, compare average page-ready time of the lean and default browser profiles over N job pages",
+    )
+    parser.add_argument(
+        "--start-page",
+        type=int,
+        help="First listing page to process (1-based); ranged runs neither resume from nor update the checkpoint",
+    )
+    parser.add_argument(
+        "--end-page",
+        type=int,
+        help="Last listing page to process (inclusive); ranged runs neither resume from nor update the checkpoint",
+    )
+    parser.add_argument(
+        "--phase",
+        choices=["interleaved", "crawl", "apply", "both"],
+        default="interleaved",
+        help="interleaved: apply to each page's jobs as they are found (default). "
+        "crawl: only store parsed job details in the job queue. "
+        "apply: only apply to jobs waiting in the job queue. "
+        "both: crawl, then apply",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore the saved checkpoint and start from page 1",
+    )
+    args = parser.parse_args()
+
+    if args.compare_profiles:
+        compare_profiles(args.compare_profiles)
+        return
+
     print("Starting Handshake Job Application Bot...")
 
-    # This conveniently handles the annoying chrome driver logic for you
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
+    driver = create_driver(config)
 
     # Initializes driver handler object, which wraps around the webdriver
     driver_handler = DriverHandler(driver, config)
 
+    # Load the cover letter stack in the background while the login runs
+    driver_handler.warm_cover_letter_stack()
+
     # Login
     try:
-        driver_handler.login()
+        with driver_handler.tracer.span("login"):
+            driver_handler.login()
     except Exception as e:
         print(f"Error during login: {e}")
+        driver_handler.close()
         driver.quit()
         return
 
-    # Navigates to the job postings page
-    driver_handler.get_driver().get(config[const.SEARCH_URL])
+    if args.phase == "interleaved":
+        crawl_listings(
+            driver_handler,
+            args,
+            "interleaved",
+            lambda job_url: apply_job(driver_handler, job_url),
+        )
+    else:
+        job_queue = JobQueue(config[const.JOB_QUEUE_FILE])
+
+        if args.phase in ("crawl", "both"):
+            crawl_listings(
+                driver_handler,
+                args,
+                "crawl",
+                lambda job_url: crawl_job(driver_handler, job_queue, job_url),
+                already_done=lambda job_id: job_id in job_queue,
+            )
+        if args.phase in ("apply", "both"):
+            apply_queued_jobs(driver_handler, job_queue)
+
+        print(f"Job queue: {job_queue.counts()}")
+        job_queue.close()
+
+    print(driver_handler.tracer.summary())
+    print(driver_handler.pacer.summary())
+    if driver_handler.tabs:
+        print(driver_handler.tabs.summary())
+    if driver_handler.letter_cache:
+        print(driver_handler.letter_cache.summary())
+    if driver_handler.cover_letters:
+        print(driver_handler.cover_letters.summary())
+
+    driver_handler.close()
+
+    # The cover letter stack is only imported once a letter (or the resume) was needed
+    generator = sys.modules.get("cover_letter_generator")
+    if generator and generator.GENERATION_PATHS:
+        print(
+            f"Cover letters generated: {generator.GENERATION_PATHS['direct']} direct, "
+            f"{generator.GENERATION_PATHS['retrieval']} via retrieval"
+        )
+    if generator and generator.PROMPT_STATS:
+        tokens = [prompt_tokens for _, _, prompt_tokens, _ in generator.PROMPT_STATS]
+        seconds = [generation_seconds for _, _, _, generation_seconds in generator.PROMPT_STATS]
+        print(
+            f"Cover letter prompts: {sum(tokens) / len(tokens):.0f} tokens and "
+            f"{sum(seconds) / len(seconds):.1f}s generation on average"
+        )
+
+    embedding_cache = sys.modules.get("embedding_cache")
+    if embedding_cache and embedding_cache.EMBEDDING_CACHE_STATS:
+        print(embedding_cache.summary())
+
+    print("Finished processing all pages. Closing the browser :)")
+
+
+def crawl_listings(
+    driver_handler: DriverHandler, args, phase: str, process_job, already_done=None
+) -> None:
+    """
+    Walks the listing pages (an explicit --start-page/--end-page range, or resuming from the checkpoint) and calls
+    process_job(job_url) for every job, checkpointing after each one. Ranged runs leave the checkpoint alone, so
+    the next plain run doesn't resume after the range and skip the pages before it.
+    Jobs for which already_done(job_id) is True (e.g. already in the job queue) are never prefetched in background tabs.
+    """
+    search_url = config[const.SEARCH_URL]
+    ranged = bool(args.start_page or args.end_page)
+    checkpoint = CrawlCheckpoint(None if ranged else config[const.CRAWL_CHECKPOINT_FILE])
+
+    # Work out where to start: an explicit page range, the saved checkpoint, or page 1
+    start_page, resume_job_id = args.start_page or 1, None
+    if not ranged and not args.fresh:
+        state = checkpoint.load(search_url, phase)
+        if state:
+            start_page, resume_job_id = state["page"], state.get("job_id")
+            print(
+                f"Resuming from checkpoint: page {start_page}"
+                + (f", after job {state['job_index'] + 1}" if state["job_index"] >= 0 else "")
+            )
+
+    # Navigates straight to the first page to process
+    driver_handler.go_to_page(start_page)
 
     # Get the total amount of pages to scrape
     total_pages = driver_handler.get_total_pages()
+    end_page = min(args.end_page or total_pages, total_pages)
+
+    # Iterate through the requested pages
+    for page in range(start_page, end_page + 1):
+        print(f"Processing page {page} of {total_pages}...")
 
-    # Iterate through all pages
-    for page in range(total_pages):  # range(total_pages):
-        print(f"Processing page {page + 1} of {total_pages}...")
+        if page != start_page:
+            driver_handler.go_to_page(page)
+
+        commands_at_page_start = driver_handler.command_count
 
         # Get all job posting URLs on the current page
         job_urls = driver_handler.get_job_postings()
+        listing_commands = driver_handler.command_count - commands_at_page_start
 
-        for job_url in job_urls:
-            try:
-                driver_handler.apply_to_job(job_url)
-            except Exception as e:
-                print(f"Error applying to job: {e}")
-                continue
+        # Skip the jobs this page already got through before the restart
+        start_index = 0
+        if resume_job_id:
+            job_ids = [job_id_from_url(job_url) for job_url in job_urls]
+            if resume_job_id in job_ids:
+                start_index = job_ids.index(resume_job_id) + 1
+            resume_job_id = None
 
-            time.sleep(
-                random.randint(2, 7)
-            )  # Sleep for a few seconds to avoid overwhelming the server and to mimic human behavior
+        # Background tabs (if any) load these while earlier ones are processed; only applying needs cover letters
+        upcoming = job_urls[start_index:]
+        if already_done:
+            upcoming = [job_url for job_url in upcoming if not already_done(job_id_from_url(job_url))]
+        driver_handler.set_upcoming_jobs(upcoming, start_cover_letters=phase == "interleaved")
 
-        # Navigate to the next page
-        if page < total_pages - 1:
-            driver_handler.go_to_next_page()
+        for job_index in range(start_index, len(job_urls)):
+            job_url = job_urls[job_index]
+            process_job(job_url)
+            checkpoint.save(search_url, page, job_index, job_id_from_url(job_url), phase)
 
-    print("Finished processing all pages. Closing the browser :)")
+        print(
+            f"Page {page} used {driver_handler.command_count - commands_at_page_start} driver command(s) "
+            f"({listing_commands} for the listing, {len(job_urls)} job(s))"
+        )
+
+        # The whole page is done, so a restart should begin on the next one
+        checkpoint.save(search_url, page + 1, -1, phase=phase)
+
+    if end_page == total_pages:
+        checkpoint.clear()
+
+
+def apply_job(driver_handler: DriverHandler, job_url: str) -> None:
+    """
+    Interleaved mode: loads, parses and applies to a job straight from the listing
+    """
+    try:
+        applied, message = driver_handler.apply_to_job(job_url)
+    except Exception as e:
+        print(f"Error applying to job: {e}")
+        applied, message = False, f"Error: {type(e).__name__}"
+
+    if not applied:
+        driver_handler.remember_skip(job_id_from_url(job_url), message)
+    driver_handler.tracer.event("job", applied=applied, reason=message)
+
+
+def crawl_job(driver_handler: DriverHandler, job_queue: JobQueue, job_url: str) -> None:
+    """
+    Crawl phase: loads and parses a job details page and stores it in the job queue. Jobs already in the queue are not fetched again.
+    """
+    job_id = job_id_from_url(job_url)
+    if job_id in job_queue:
+        driver_handler.tracer.event("skip", reason="Already queued")
+        return
+
+    driver_handler.tracer.context = {const.JOB_ID: job_id}
+
+    try:
+        driver_handler.open_job_page(job_url)
+        with driver_handler.tracer.span("parse"):
+            job_details = driver_handler.job_details(job_url)
+    except Exception as e:
+        print(f"Error crawling job: {e}")
+        return
+
+    if not job_details[const.JOB_ID]:
+        print(f"Could not determine the job ID of {job_url}, not queueing it")
+        return
+
+    if job_queue.add(job_url, job_details, job_details[const.APPLY_TYPE]):
+        if job_details[const.APPLY_TYPE] == APPLY_TYPE_EXTERNAL:
+            driver_handler.remember_skip(job_details[const.JOB_ID], "External application")
+        elif job_details[const.APPLY_TYPE] == APPLY_TYPE_NONE:
+            driver_handler.remember_skip(job_details[const.JOB_ID], "Apply button not found")
+
+    print(
+        f"Queued job: {job_details[const.JOB_TITLE]} at {job_details[const.COMPANY_NAME]} "
+        f"(ID: {job_details[const.JOB_ID]}, {job_details[const.APPLY_TYPE]})"
+    )
+
+
+def apply_queued_jobs(driver_handler: DriverHandler, job_queue: JobQueue) -> None:
+    """
+    Apply phase: drains the job queue, applying to each pending job from its stored details and recording the outcome
+    """
+    pending = job_queue.pending()
+    print(f"Applying to {len(pending)} queued job(s)...")
+
+    # Score every queued description against the resume in one batch
+    driver_handler.score_jobs([job_details for _, job_details in pending])
+
+    driver_handler.set_upcoming_jobs(
+        [job_url for job_url, job_details in pending if not driver_handler.job_already_applied(job_details[const.JOB_ID])]
+    )
+
+    for index, (job_url, job_details) in enumerate(pending):
+        job_id = job_details[const.JOB_ID]
+
+        if driver_handler.job_already_applied(job_id):
+            job_queue.mark(job_id, APPLIED, "Already applied")
+            continue
+
+        # Descriptions are already known, so upcoming cover letters can be generated ahead of time
+        driver_handler.prefetch_cover_letters(
+            [details for _, details in pending[index : index + 1 + const.COVER_LETTER_LOOKAHEAD]]
+        )
+
+        try:
+            applied, message = driver_handler.apply_to_queued_job(job_url, job_details)
+            status = APPLIED if applied else SKIPPED
+        except Exception as e:
+            print(f"Error applying to job: {e}")
+            applied, message = False, f"Error: {type(e).__name__}"
+            status = FAILED
+
+        job_queue.mark(job_id, status, message)
+        if not applied:
+            driver_handler.remember_skip(job_id, message)
+        driver_handler.tracer.event("job", applied=applied, reason=message)
+
+
+def compare_profiles(sample_size: int) -> None:
+    """
+    Loads the same job pages with the lean and the default browser profile and prints the average page-ready time of each.
+    Each profile starts from its own empty Chrome profile directory, so the second one doesn't get the first one's HTTP cache
+    (and both have to log in).
+    """
+    averages = {}
+
+    for name, lean in (("lean", True), ("default", False)):
+        print(f"Measuring {name} browser profile...")
+        profile_dir = tempfile.mkdtemp(prefix=f"chrome-profile-{name}-")
+        profile_config = {**config, const.CHROME_PROFILE_DIR: profile_dir}
+        driver = create_driver(profile_config, lean=lean)
+        driver_handler = DriverHandler(driver, profile_config)
+
+        try:
+            driver_handler.login()
+            driver_handler.go_to_page(1)
+
+            for job_url in driver_handler.get_job_postings()[:sample_size]:
+                try:
+                    driver_handler.open_job_page(job_url)
+                except Exception as e:
+                    print(f"Error loading job page: {e}")
+        finally:
+            driver_handler.close()
+            driver.quit()
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+        times = driver_handler.page_ready_times
+        if times:
+            averages[name] = sum(times) / len(times)
+            print(f"{name}: {averages[name]:.2f}s average page-ready time over {len(times)} job(s)")
+
+    if len(averages) == 2:
+        print(
+            f"Lean profile saves {averages['default'] - averages['lean']:.2f}s per job page "
+            f"({(1 - averages['lean'] / averages['default']) * 100:.0f}%)"
+        )
 
 
 if __name__ == "__main__":
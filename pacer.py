@@ -0,0 +1,91 @@
+# Local imports
+from rate_limiter import TokenBucket
+
+# Standard imports
+import random
+import threading
+import time
+
+
+class Pacer:
+    """
+    Paces server-facing browser actions (page loads, Apply/Submit clicks, pagination) with a token
+    bucket instead of a fixed sleep per job. The rate backs off multiplicatively when page loads or
+    waits are slow or time out, and recovers additively toward the target rate while they're fast.
+    """
+
+    def __init__(
+        self,
+        actions_per_minute: float = 40,
+        burst: float = 3,
+        slow_seconds: float = 5.0,
+        min_actions_per_minute: float = 2,
+        jitter: float = 0.0,
+    ) -> None:
+        """
+        Initializes the pacer.
+
+        Args:
+            actions_per_minute: Target rate of server-facing actions
+            burst: Actions that may run back-to-back before pacing kicks in
+            slow_seconds: Page loads or waits slower than this count as server slowness
+            min_actions_per_minute: Floor the rate never backs off below
+            jitter: Maximum extra random delay (seconds) added before each action
+        """
+        self.target_rate = actions_per_minute
+        self.min_rate = min(min_actions_per_minute, actions_per_minute)
+        self.rate = actions_per_minute
+        self.slow_seconds = slow_seconds
+        self.jitter = jitter
+        self.bucket = TokenBucket(actions_per_minute, capacity=burst)
+        self.lock = threading.Lock()
+
+        self.actions = 0
+        self.waited = 0.0
+        self.backoffs = 0
+
+    def wait(self) -> float:
+        """
+        Blocks until the next server-facing action is allowed. Returns the seconds spent waiting.
+        """
+        waited = self.bucket.acquire()
+        if self.jitter:
+            extra = random.uniform(0, self.jitter)
+            time.sleep(extra)
+            waited += extra
+
+        with self.lock:
+            self.actions += 1
+            self.waited += waited
+
+        return waited
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        """
+        Reports how long a page load or wait took so the rate can adapt to server speed.
+        """
+        with self.lock:
+            if timed_out or seconds > self.slow_seconds:
+                new_rate = max(self.min_rate, self.rate / 2)
+                if new_rate < self.rate:
+                    self.backoffs += 1
+                    print(
+                        f"Server looks slow ({'timeout' if timed_out else f'{seconds:.1f}s'}), "
+                        f"backing off to {new_rate:.1f} actions/min"
+                    )
+            else:
+                new_rate = min(self.target_rate, self.rate + 1)
+
+            if new_rate != self.rate:
+                self.rate = new_rate
+                self.bucket.set_rate(new_rate)
+
+    def summary(self) -> str:
+        """
+        Returns a one-line summary of pacing for the run.
+        """
+        with self.lock:
+            return (
+                f"Paced {self.actions} server action(s), waited {self.waited:.1f}s in total, "
+                f"backed off {self.backoffs} time(s), final rate {self.rate:.1f} actions/min"
+            )
@@ -0,0 +1,128 @@
+# Standard imports
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+# External imports
+import markdown
+from fpdf import FPDF
+
+# Normalize Unicode characters that Helvetica (latin-1) can't render
+LATIN1_REPLACEMENTS = str.maketrans(
+    {
+        "\u2018": "'", "\u2019": "'",   # smart single quotes
+        "\u201c": '"', "\u201d": '"',   # smart double quotes
+        "\u2013": "-", "\u2014": "--",  # en-dash, em-dash
+        "\u2026": "...",                # ellipsis
+        "\u00a0": " ",                  # non-breaking space
+    }
+)
+
+# Markdown converter per process (and per thread), built once and reset between letters
+_local = threading.local()
+
+
+def init_worker() -> None:
+    """
+    One-time setup for a render process (or thread): builds the markdown converter and renders a throwaway
+    page so fpdf's font metrics and HTML parser are loaded before the first real letter.
+    """
+    _local.markdown_converter = markdown.Markdown()
+    pdf = new_pdf()
+    pdf.write_html("<p>warm up</p>")
+
+
+def new_pdf() -> FPDF:
+    """
+    Returns a blank letter-formatted FPDF document (margins, first page and body font).
+    """
+    pdf = FPDF()
+    pdf.set_margins(25, 25, 25)
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=11)
+
+    return pdf
+
+
+def normalize_for_latin1(text: str) -> str:
+    """
+    Replaces typographic characters with latin-1 equivalents and drops anything else Helvetica can't render
+    """
+    text = text.translate(LATIN1_REPLACEMENTS)
+
+    return text.encode("latin-1", "replace").decode("latin-1")
+
+
+def render_markdown_to_pdf(markdown_text: str, file_path: str) -> str:
+    """
+    Renders cover letter markdown to a PDF at file_path and returns the file path. The PDF is written to a
+    temporary file and moved into place, so an interrupted render never leaves a truncated letter behind
+    (which a resumed batch would skip as already generated).
+    """
+    if getattr(_local, "markdown_converter", None) is None:
+        init_worker()
+
+    html_body = _local.markdown_converter.reset().convert(
+        normalize_for_latin1(markdown_text)
+    )
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    pdf = new_pdf()
+    pdf.write_html(html_body)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory or ".", suffix=".pdf.tmp")
+    os.close(fd)
+    try:
+        pdf.output(tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    return file_path
+
+
+class PdfRenderPool:
+    """
+    Renders cover letters in worker processes so HTML layout isn't bound by the GIL of the
+    threads that generate them. Each worker does its markdown and font setup once.
+    """
+
+    def __init__(self, max_workers: int = None) -> None:
+        """
+        Initializes the pool. max_workers defaults to the number of CPUs.
+        Workers are spawned rather than forked since the pool is used from threaded code.
+        """
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+        )
+
+    def submit(self, markdown_text: str, file_path: str):
+        """
+        Queues a letter for rendering and returns a future that resolves to its file path.
+        """
+        return self.executor.submit(render_markdown_to_pdf, markdown_text, file_path)
+
+    def render(self, markdown_text: str, file_path: str) -> str:
+        """
+        Renders a letter in the pool and waits for its file path.
+        """
+        return self.submit(markdown_text, file_path).result()
+
+    def render_many(self, letters: list) -> list:
+        """
+        Renders a list of (markdown_text, file_path) pairs and returns their file paths in order.
+        """
+        futures = [self.submit(text, path) for text, path in letters]
+
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,58 @@
+# Standard imports
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Tokens refill continuously at rate_per_minute up to capacity, and
+    acquire() blocks until the requested amount is available. Requests larger than the bucket are
+    allowed but put it into debt, so the long-run rate still holds.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float = None) -> None:
+        """
+        Initializes a full bucket. Capacity defaults to one minute's worth of tokens.
+        """
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def set_rate(self, rate_per_minute: float) -> None:
+        """
+        Changes the refill rate, keeping the tokens accumulated so far.
+        """
+        with self.lock:
+            self._refill()
+            self.rate = rate_per_minute / 60.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self, amount: float = 1) -> float:
+        """
+        Takes amount tokens from the bucket and returns how many seconds the caller must wait before using them.
+        """
+        with self.lock:
+            self._refill()
+            self.tokens -= amount
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self, amount: float = 1) -> float:
+        """
+        Blocks until amount tokens are available. Returns the number of seconds spent waiting.
+        """
+        wait = self.reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
@@ -0,0 +1,121 @@
+# Standard imports
+import re
+from collections import Counter
+
+# External imports
+import numpy as np
+
+# Changes whenever scores for the same resume and description would change, e.g. a new reference set
+SCORER_VERSION = "tfidf-reference-1"
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+# Words too common in resumes and postings to say anything about fit
+STOP_WORDS = frozenset(
+    """
+    a about all also an and any are as at be been by can do for from has have how if in into is it its
+    more most must not of on or our over per so such than that the their them then there these they this
+    to up us was we were what when where which while who will with within without you your
+    """.split()
+)
+
+# A fixed spread of generic postings from different fields. IDF is fitted on these plus the resume once,
+# so boilerplate every posting uses (e.g. "intern", "team", "skills") weighs little, and a description's
+# score doesn't depend on which other descriptions it happens to be scored with.
+REFERENCE_POSTINGS = [
+    "Software engineering intern to build backend services and web applications with the team. "
+    "Requirements: pursuing a degree in computer science, programming skills, problem solving.",
+    "Data analyst intern to clean data, build dashboards and present insights to stakeholders. "
+    "Skills: SQL, Excel, statistics, strong communication and attention to detail.",
+    "Marketing intern to plan social media campaigns, write content and track engagement. "
+    "Looking for creative students with excellent written and verbal communication skills.",
+    "Finance intern supporting financial analysis, budgeting, forecasting and reporting. "
+    "Requirements: pursuing a degree in finance, accounting or economics, proficiency in Excel.",
+    "Mechanical engineering intern to design, prototype and test parts using CAD. "
+    "Hands-on experience with manufacturing and testing is a plus. Team player.",
+    "Research assistant in a biology lab running experiments, preparing samples and recording results. "
+    "Coursework in biology or chemistry and lab experience required.",
+    "Graphic design intern creating visual assets for web, print and social media. "
+    "Portfolio required; experience with Adobe Creative Suite and Figma preferred.",
+    "Sales development intern to research leads, reach out to prospects and support account executives. "
+    "Strong communication, motivated, customer focused.",
+    "Human resources intern assisting with recruiting, onboarding and employee engagement programs. "
+    "Organized, detail oriented, comfortable with confidential information.",
+    "Operations intern improving processes, coordinating projects and analyzing performance metrics "
+    "across teams. Analytical, organized and able to manage multiple priorities.",
+    "Healthcare administration intern supporting patient services, scheduling and records in a clinic. "
+    "Interest in healthcare and excellent interpersonal skills.",
+    "Product management intern working with engineering and design to define requirements, "
+    "run user research and prioritize features. Full-time summer internship, paid, hybrid.",
+]
+
+
+def tokenize(text: str) -> list:
+    """
+    Lowercases text and splits it into word tokens (keeping terms like c++, c#, node.js), minus stop words.
+    """
+    return [
+        token
+        for token in TOKEN_PATTERN.findall((text or "").lower())
+        if token not in STOP_WORDS
+    ]
+
+
+class RelevanceScorer:
+    """
+    Scores job descriptions against the resume with TF-IDF cosine similarity, entirely locally.
+    Scores range from 0 (no terms in common) to 1. IDF is fitted once, on the resume plus
+    REFERENCE_POSTINGS, so a description always gets the same score for the same resume, and a
+    batch of descriptions is scored with one matrix product.
+    """
+
+    def __init__(self, resume_text: str, reference: list = REFERENCE_POSTINGS) -> None:
+        self.resume_counts = Counter(tokenize(resume_text))
+
+        documents = [self.resume_counts] + [Counter(tokenize(text)) for text in reference]
+        self.document_count = len(documents)
+        self.document_frequency = Counter(term for counts in documents for term in counts)
+
+    def idf(self, terms: list) -> np.ndarray:
+        """
+        Smoothed IDF of each term, as in scikit-learn's TfidfVectorizer. Terms outside the fitted documents get the maximum.
+        """
+        document_frequency = np.array(
+            [self.document_frequency.get(term, 0) for term in terms], dtype=np.float32
+        )
+
+        return np.log((1 + self.document_count) / (1 + document_frequency)) + 1
+
+    def score(self, description: str) -> float:
+        """
+        Scores a single job description.
+        """
+        return float(self.score_many([description])[0])
+
+    def score_many(self, descriptions: list) -> np.ndarray:
+        """
+        Scores a batch of job descriptions. Missing descriptions score 0.
+        """
+        documents = [self.resume_counts] + [Counter(tokenize(text)) for text in descriptions]
+
+        vocabulary = {}
+        for counts in documents:
+            for term in counts:
+                vocabulary.setdefault(term, len(vocabulary))
+
+        if not vocabulary:
+            return np.zeros(len(descriptions))
+
+        tf = np.zeros((len(documents), len(vocabulary)), dtype=np.float32)
+        for row, counts in enumerate(documents):
+            if counts:
+                columns = [vocabulary[term] for term in counts]
+                tf[row, columns] = list(counts.values())
+
+        # Sublinear term frequency; each row is normalized on its own, so rows don't affect each other
+        weights = np.where(tf > 0, 1 + np.log(np.maximum(tf, 1)), 0) * self.idf(list(vocabulary))
+
+        norms = np.linalg.norm(weights, axis=1, keepdims=True)
+        weights /= np.where(norms > 0, norms, 1)
+
+        return weights[1:] @ weights[0]
@@ -0,0 +1,72 @@
+# Local imports
+import constants as const
+
+# Standard imports
+import hashlib
+import os
+
+# Resume text keyed by file hash, shared by relevance scoring and cover letters in this process
+_resume_texts = {}
+
+
+def resume_file_hash(resume_path: str) -> str:
+    """
+    Returns the SHA-256 of the resume file's contents
+    """
+    digest = hashlib.sha256()
+    with open(resume_path, mode="rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def extract_resume_text(resume_path: str) -> str:
+    """
+    Extracts the raw text of every page of the resume PDF
+    """
+    # Imported here so startup doesn't load PyPDF2
+    from PyPDF2 import PdfReader
+
+    pdf_reader = PdfReader(resume_path)
+    text = ""
+    for page in pdf_reader.pages:
+        text += page.extract_text()
+
+    return text
+
+
+def load_resume_text(config: dict) -> str:
+    """
+    Returns the full text of the resume. Extraction is cached by the hash of the resume file, in memory
+    for the process and on disk across runs, so a new or edited resume is picked up automatically.
+    Only needs PyPDF2, so relevance scoring can read the resume without loading the cover letter stack.
+    """
+    file_hash = resume_file_hash(config[const.RESUME_PATH])
+    if file_hash in _resume_texts:
+        return _resume_texts[file_hash]
+
+    cache_file = os.path.join(const.RESUME_CACHE_DIR, f"{file_hash}.txt")
+    text = None
+
+    if os.path.isfile(cache_file):
+        try:
+            with open(cache_file, mode="r", encoding="utf-8") as f:
+                text = f.read()
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable resume text cache {cache_file}: {e}")
+
+    if text is None:
+        text = extract_resume_text(config[const.RESUME_PATH])
+        try:
+            os.makedirs(const.RESUME_CACHE_DIR, exist_ok=True)
+            tmp_file = f"{cache_file}.tmp"
+            with open(tmp_file, mode="w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            print(f"Warning: Could not write resume text cache {cache_file}: {e}")
+
+    _resume_texts[file_hash] = text
+
+    return text
@@ -0,0 +1,147 @@
+# Local imports
+from relevance import SCORER_VERSION
+import constants as const
+
+# Standard imports
+import hashlib
+import json
+import os
+import time
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# How long each skip reason is remembered (None = for good) and whether it depends on the configuration.
+# Reasons that aren't listed (e.g. "Document not found", a local problem) are not remembered at all.
+REASON_POLICIES = {
+    "External application": (None, False),
+    "Apply button not found": (3 * DAY, False),
+    "Job requires resume but config excludes it": (30 * DAY, True),
+    "Job requires transcript but config excludes it": (30 * DAY, True),
+    "Job requires cover letter but config excludes it": (30 * DAY, True),
+    "Low relevance": (30 * DAY, True),
+    "Could not find application modal": (HOUR, False),
+    "Upload not confirmed": (HOUR, False),
+}
+ERROR_REASON_PREFIX = "Error:"
+ERROR_TTL = HOUR
+
+# Settings that config-dependent reasons were decided under
+FINGERPRINT_KEYS = [
+    const.INCLUDE_RESUME,
+    const.INCLUDE_TRANSCRIPT,
+    const.INCLUDE_COVER_LETTER,
+    const.RELEVANCE_THRESHOLD,
+    const.RESUME_PATH,
+]
+
+
+def policy_for(reason: str):
+    """
+    Returns (ttl in seconds or None for permanent, config dependent) for a skip reason, or None if it shouldn't be remembered.
+    """
+    if reason in REASON_POLICIES:
+        return REASON_POLICIES[reason]
+    if reason and reason.startswith(ERROR_REASON_PREFIX):
+        return ERROR_TTL, False
+
+    return None
+
+
+def config_fingerprint(config: dict) -> str:
+    """
+    Hashes the settings config-dependent skip reasons depend on. The resume's modification time and the relevance
+    scorer's version are included, so an updated resume or scorer gets low-relevance jobs another look.
+    """
+    values = [config.get(key) for key in FINGERPRINT_KEYS] + [SCORER_VERSION]
+    resume_path = config.get(const.RESUME_PATH)
+    values.append(os.path.getmtime(resume_path) if resume_path and os.path.isfile(resume_path) else None)
+
+    return hashlib.sha256(json.dumps(values, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+class SkippedJobsCache:
+    """
+    Remembers jobs that were visited but couldn't be applied to, with the reason, so later runs skip them on the
+    listing page without navigating to them. Each reason has its own lifetime: external applications are
+    remembered for good, transient errors for an hour, and reasons that depend on the configuration (e.g. a
+    required transcript with INCLUDE_TRANSCRIPT off) only until those settings change. The file is a JSON Lines
+    log each skip is appended to; expired and superseded lines are dropped when it is loaded.
+    """
+
+    def __init__(self, path: str, config: dict) -> None:
+        self.path = path
+        self.fingerprint = config_fingerprint(config)
+        self.entries = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.isfile(self.path):
+            return
+
+        entries, lines = {}, 0
+        with open(self.path, mode="r", encoding="utf-8") as f:
+            for line in f:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                    entries[entry.pop("job_id")] = entry
+                except Exception:
+                    # e.g. a line cut short by a crash
+                    continue
+
+        now = time.time()
+        self.entries = {
+            job_id: entry for job_id, entry in entries.items() if self._is_current(entry, now)
+        }
+        dropped = len(entries) - len(self.entries)
+
+        # Rewrite the log once here, rather than on every add, when it holds lines that no longer count
+        if lines > len(self.entries):
+            self._compact()
+
+        print(
+            f"Loaded {len(self.entries)} skipped job(s) from {self.path}"
+            + (f" ({dropped} expired or invalidated by a config change)" if dropped else "")
+        )
+
+    def _is_current(self, entry: dict, now: float) -> bool:
+        if entry.get("expires") is not None and entry["expires"] <= now:
+            return False
+
+        return entry.get("fingerprint") in (None, self.fingerprint)
+
+    def _compact(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, mode="w", encoding="utf-8") as f:
+            for job_id, entry in self.entries.items():
+                f.write(json.dumps({"job_id": job_id, **entry}) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def reason(self, job_id):
+        """
+        Returns why the job was skipped before, or None if it should be visited.
+        """
+        entry = self.entries.get(str(job_id))
+        if entry is None or not self._is_current(entry, time.time()):
+            return None
+
+        return entry["reason"]
+
+    def add(self, job_id, reason: str) -> None:
+        """
+        Remembers a skipped job, if its reason is one worth remembering.
+        """
+        policy = policy_for(reason)
+        if not job_id or policy is None:
+            return
+
+        ttl, config_dependent = policy
+        entry = {
+            "reason": reason,
+            "expires": time.time() + ttl if ttl is not None else None,
+            "fingerprint": self.fingerprint if config_dependent else None,
+        }
+        self.entries[str(job_id)] = entry
+        with open(self.path, mode="a", encoding="utf-8") as f:
+            f.write(json.dumps({"job_id": str(job_id), **entry}) + "\n")
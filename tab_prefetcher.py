@@ -0,0 +1,149 @@
+# Local imports
+from crawl_checkpoint import job_id_from_url
+from job_queue import APPLY_TYPE_QUICK
+import constants as const
+
+# Returns True once the job details page for job ID arguments[0] is ready (its "Share" button is present).
+# A reused tab keeps the previous job's page, Share button included, until the new one commits, hence the URL check.
+PAGE_READY_SCRIPT = """
+return window.location.href.indexOf(arguments[0]) !== -1 && document.evaluate(
+    "//button[text()='Share' or contains(text(), 'Share')]",
+    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue !== null;
+"""
+
+
+class TabPrefetcher:
+    """
+    Hides job page load latency behind the apply modal by loading the next job detail pages in a few
+    background tabs of the same browser session. When the bot moves on to a job that was prefetched
+    it just switches to that tab. Every background load goes through the handler's pacer, so the
+    request rate stays under the same global cap as single-tab mode.
+    """
+
+    def __init__(self, driver_handler, tabs: int) -> None:
+        """
+        Opens the background tabs, leaving the driver on the tab it started on.
+        """
+        self.handler = driver_handler
+        self.driver = driver_handler.get_driver()
+        self.current = self.driver.current_window_handle
+        self.handles = [self.current]
+
+        for _ in range(tabs):
+            self.driver.switch_to.new_window("tab")
+            self.handles.append(self.driver.current_window_handle)
+        self.driver.switch_to.window(self.current)
+
+        self.upcoming = []
+        self.start_cover_letters = True
+        self.loading = {}  # job URL -> tab handle
+        self.parsed = {}  # job URL -> job details parsed in the background
+        self.hits = 0
+        self.misses = 0
+
+    def set_upcoming(self, job_urls: list, start_cover_letters: bool = True) -> None:
+        """
+        Sets the job URLs that will be opened next, in order. Prefetched tabs for jobs no longer upcoming are reused.
+        start_cover_letters=False keeps background-parsed jobs from queueing cover letters (e.g. in the crawl-only phase).
+        """
+        self.upcoming = list(job_urls)
+        self.start_cover_letters = start_cover_letters
+        for job_url in list(self.loading):
+            if job_url not in self.upcoming:
+                del self.loading[job_url]
+                self.parsed.pop(job_url, None)
+
+    def open(self, job_url: str) -> bool:
+        """
+        Switches to the tab holding job_url if it was prefetched. Returns False if it wasn't, in which case
+        the caller loads it in the current tab as usual. Tabs that weren't ready at the last refill have had
+        the whole previous job to load, so they are checked again first, letting this job's cover letter
+        start before its page-ready wait.
+        """
+        if job_url in self.upcoming:
+            self.upcoming = self.upcoming[self.upcoming.index(job_url) + 1 :]
+
+        if job_url in self.loading:
+            self.parse_ready_tabs()
+
+        handle = self.loading.pop(job_url, None)
+        if handle is None:
+            self.misses += 1
+            return False
+
+        self.driver.switch_to.window(handle)
+        self.current = handle
+        self.hits += 1
+
+        return True
+
+    def details(self, job_url: str):
+        """
+        Returns the job details parsed in the background for job_url, if any.
+        """
+        job_details = self.parsed.pop(job_url, None)
+        if job_details is None or job_details[const.JOB_ID] != job_id_from_url(job_url):
+            return None
+
+        return job_details
+
+    def refill(self) -> None:
+        """
+        Starts loading upcoming jobs in free background tabs and parses those that finished loading,
+        then switches back to the current tab.
+        """
+        busy = set(self.loading.values()) | {self.current}
+        free = [handle for handle in self.handles if handle not in busy]
+        to_load = [url for url in self.upcoming if url not in self.loading][: len(free)]
+
+        try:
+            for handle, job_url in zip(free, to_load):
+                # Background loads count against the same global rate cap as foreground ones
+                self.handler.pacer.wait()
+                self.driver.switch_to.window(handle)
+                self.driver.execute_script("window.location.href = arguments[0];", job_url)
+                self.loading[job_url] = handle
+        finally:
+            self.driver.switch_to.window(self.current)
+
+        self.parse_ready_tabs()
+
+    def parse_ready_tabs(self) -> None:
+        """
+        Parses the background tabs that finished loading since they were last checked, then switches back to
+        the current tab. Relevant quick-apply jobs among those parsed are handed to the background cover
+        letter generator.
+        """
+        newly_parsed = []
+        try:
+            for job_url, handle in self.loading.items():
+                if job_url in self.parsed:
+                    continue
+
+                job_id = job_id_from_url(job_url)
+                self.driver.switch_to.window(handle)
+                if job_id and self.driver.execute_script(PAGE_READY_SCRIPT, job_id):
+                    job_details = self.handler.parse_job_details()
+                    # Never cache another job's details under this URL
+                    if job_details[const.JOB_ID] == job_id:
+                        self.parsed[job_url] = job_details
+                        newly_parsed.append(job_details)
+        finally:
+            self.driver.switch_to.window(self.current)
+
+        if not newly_parsed or not self.start_cover_letters:
+            return
+
+        # Score the batch against the resume so only relevant jobs get a cover letter early
+        self.handler.score_jobs(newly_parsed)
+        quick_apply_jobs = [
+            job_details
+            for job_details in newly_parsed
+            if job_details[const.APPLY_TYPE] == APPLY_TYPE_QUICK
+        ]
+        self.handler.prefetch_cover_letters(quick_apply_jobs)
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        return f"Tab prefetch: {self.hits} of {total} job page(s) were already loading in a background tab"
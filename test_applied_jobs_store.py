@@ -0,0 +1,73 @@
+import csv
+
+import constants as const
+from applied_jobs_store import AppliedJobsStore
+
+
+def test_imports_existing_csv_and_appends(tmp_path):
+    """
+    Existing jobs.csv rows are indexed on load, and appended rows are both indexed and
+    written with the original column layout.
+    """
+    csv_path = tmp_path / "jobs.csv"
+    with open(csv_path, mode="w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(const.JOBS_CSV_HEADERS)
+        writer.writerow(["111", "Acme", "Intern", "Yes", "No", "No", "01/01"])
+
+    store = AppliedJobsStore(str(csv_path))
+    assert "111" in store
+    assert "222" not in store
+
+    store.append(["222", "Globex", "Engineer", "Yes", "Yes", "No", "01/02"])
+    assert "222" in store
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row[const.CSV_HEADER_JOB_ID] for row in rows] == ["111", "222"]
+    assert list(rows[1].keys()) == const.JOBS_CSV_HEADERS
+
+
+def test_recovers_from_partial_last_line(tmp_path):
+    """
+    A row appended after a crash that cut off the trailing newline starts on its own line.
+    """
+    csv_path = tmp_path / "jobs.csv"
+    csv_path.write_text(",".join(const.JOBS_CSV_HEADERS) + "\n333,Initech", encoding="utf-8")
+
+    store = AppliedJobsStore(str(csv_path))
+    store.append(["444", "Hooli", "Intern", "Yes", "No", "No", "01/03"])
+
+    reloaded = AppliedJobsStore(str(csv_path))
+    assert "333" in reloaded
+    assert "444" in reloaded
+
+
+def test_missing_csv_is_created_with_header(tmp_path):
+    csv_path = tmp_path / "jobs.csv"
+    store = AppliedJobsStore(str(csv_path))
+    assert len(store) == 0
+
+    store.append(["555", "Umbrella", "Intern", "No", "No", "No", "01/04"])
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        assert next(csv.reader(f)) == const.JOBS_CSV_HEADERS
+
+
+def test_upgrades_old_header(tmp_path):
+    """
+    A log written before the Relevance column existed gets the new header, and its rows are kept.
+    """
+    csv_path = tmp_path / "jobs.csv"
+    old_headers = const.JOBS_CSV_HEADERS[:-1]
+    csv_path.write_text(",".join(old_headers) + "\n555,Acme,Intern,Yes,No,No,01/04\n", encoding="utf-8")
+
+    store = AppliedJobsStore(str(csv_path))
+    assert "555" in store
+    store.append(["666", "Globex", "Intern", "Yes", "No", "No", "01/05", "0.412"])
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0].keys()) == const.JOBS_CSV_HEADERS
+    assert rows[0][const.CSV_HEADER_RELEVANCE] == ""
+    assert rows[1][const.CSV_HEADER_RELEVANCE] == "0.412"
@@ -0,0 +1,143 @@
+import os
+import sys
+
+import pytest
+
+import batch_cover_letters
+import constants as const
+from batch_cover_letters import RateLimitedBackend, read_jobs
+from llm_backends import FakeBackend
+from rate_limiter import TokenBucket
+from test_cover_letter_generator import write_resume
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class FlakyChatModel:
+    """
+    Answers like the fake backend's chat model, after failing the first `failures` calls with a 429.
+    """
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def invoke(self, message):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RateLimitError("Too many requests")
+        return FakeBackend().chat_model().invoke(message)
+
+
+class FlakyBackend(FakeBackend):
+    def __init__(self, failures):
+        super().__init__()
+        self.model = FlakyChatModel(failures)
+
+    def chat_model(self):
+        return self.model
+
+
+class CountingBucket(TokenBucket):
+    def __init__(self):
+        super().__init__(rate_per_minute=6000)
+        self.acquired = 0
+
+    def acquire(self, amount=1):
+        self.acquired += amount
+        return super().acquire(amount)
+
+
+def test_read_jobs_accepts_jsonl_and_csv(tmp_path):
+    jsonl = tmp_path / "jobs.jsonl"
+    jsonl.write_text(
+        '{"job_id": 1, "description": "Python intern"}\n'
+        "\n"
+        '{"job_id": "2", "job_description": "Data intern"}\n'
+        '{"job_id": "3"}\n',
+        encoding="utf-8",
+    )
+    assert read_jobs(str(jsonl)) == [("1", "Python intern"), ("2", "Data intern")]
+
+    csv_file = tmp_path / "jobs.csv"
+    csv_file.write_text(
+        'job_id,description\n4,"Backend intern, Python"\n,No ID\n', encoding="utf-8"
+    )
+    assert read_jobs(str(csv_file)) == [("4", "Backend intern, Python")]
+
+
+def test_rate_limited_request_is_retried_on_its_own(monkeypatch):
+    """
+    A 429 retries just the request that got it, after the Retry-After or backoff delay, and every
+    attempt is charged to the request limiter.
+    """
+    delays = []
+    monkeypatch.setattr(batch_cover_letters.time, "sleep", delays.append)
+    limiter = CountingBucket()
+    inner = FlakyBackend(failures=2)
+    backend = RateLimitedBackend(inner, limiter, max_retries=2)
+
+    assert backend.chat_model().invoke("Write a letter").content == const.SAMPLE_COVER_LETTER
+    assert inner.model.calls == 3
+    assert limiter.acquired == 3
+    assert len(delays) == 2
+    assert 1 <= delays[0] < 2 and 2 <= delays[1] < 3
+
+    # Out of retries, the 429 is raised
+    inner.model = FlakyChatModel(failures=5)
+    with pytest.raises(RateLimitError):
+        backend.chat_model().invoke("Write a letter")
+    assert inner.model.calls == 3
+
+
+def test_embedding_requests_are_charged_per_call():
+    limiter = CountingBucket()
+    embeddings = RateLimitedBackend(FakeBackend(), limiter, max_retries=0).embeddings()
+
+    embeddings.embed_documents(["a", "b", "c"])
+    embeddings.embed_query("d")
+
+    assert limiter.acquired == 2
+    assert embeddings.model == "FakeEmbeddings"
+
+
+def test_batch_skips_jobs_whose_pdf_exists(tmp_path, monkeypatch):
+    """
+    Re-running a batch only generates the letters that are missing, unless --force is given.
+    """
+    resume_path = str(tmp_path / "resume.pdf")
+    write_resume(resume_path)
+    letters = tmp_path / "letters"
+    letters.mkdir()
+    (letters / "1.pdf").write_bytes(b"existing")
+    jobs = tmp_path / "jobs.jsonl"
+    jobs.write_text(
+        '{"job_id": "1", "description": "Python intern at Acme."}\n'
+        '{"job_id": "2", "description": "Data intern at Acme."}\n',
+        encoding="utf-8",
+    )
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("COVER_LETTER_PATH", str(letters))
+    monkeypatch.setitem(batch_cover_letters.config, const.RESUME_PATH, resume_path)
+    monkeypatch.setitem(batch_cover_letters.config, const.COVER_LETTER_PATH, str(letters))
+    monkeypatch.setitem(batch_cover_letters.config, const.LLM_BACKEND, "fake")
+    monkeypatch.setitem(batch_cover_letters.config, const.EMBEDDING_CACHE_DIR, "")
+    monkeypatch.setattr(sys, "argv", ["batch_cover_letters.py", str(jobs), "--render-workers", "1"])
+
+    batch_cover_letters.main()
+
+    assert (letters / "1.pdf").read_bytes() == b"existing"
+    assert (letters / "2.pdf").read_bytes().startswith(b"%PDF")
+    assert sorted(os.listdir(letters)) == ["1.pdf", "2.pdf"]  # No temporary files left behind
+
+    # Nothing left to do on a re-run
+    modified = os.path.getmtime(letters / "2.pdf")
+    batch_cover_letters.main()
+    assert os.path.getmtime(letters / "2.pdf") == modified
+
+    monkeypatch.setattr(sys, "argv", sys.argv + ["--force"])
+    batch_cover_letters.main()
+    assert (letters / "1.pdf").read_bytes().startswith(b"%PDF")
@@ -0,0 +1,70 @@
+import re
+
+import browser
+import constants as const
+
+
+class FakeManager:
+    installs = 0
+
+    def __init__(self, driver_path):
+        self.driver_path = driver_path
+
+    def __call__(self):
+        return self
+
+    def install(self):
+        FakeManager.installs += 1
+        if self.driver_path is None:
+            raise ConnectionError("offline")
+        return self.driver_path
+
+
+def test_reuses_driver_until_chrome_major_changes(tmp_path, monkeypatch):
+    driver_path = tmp_path / "chromedriver"
+    driver_path.write_text("")
+    cache_file = str(tmp_path / "chromedriver.json")
+    FakeManager.installs = 0
+    monkeypatch.setattr(browser, "ChromeDriverManager", FakeManager(str(driver_path)))
+    monkeypatch.setattr(browser, "chrome_major_version", lambda: "126")
+
+    assert browser.resolve_driver_path(cache_file) == str(driver_path)
+    assert browser.resolve_driver_path(cache_file) == str(driver_path)
+    assert FakeManager.installs == 1
+
+    # A Chrome upgrade re-resolves the driver
+    monkeypatch.setattr(browser, "chrome_major_version", lambda: "127")
+    browser.resolve_driver_path(cache_file)
+    assert FakeManager.installs == 2
+
+
+def test_falls_back_to_cached_driver_when_offline(tmp_path, monkeypatch):
+    driver_path = tmp_path / "chromedriver"
+    driver_path.write_text("")
+    cache_file = str(tmp_path / "chromedriver.json")
+    monkeypatch.setattr(browser, "ChromeDriverManager", FakeManager(str(driver_path)))
+    monkeypatch.setattr(browser, "chrome_major_version", lambda: "126")
+    browser.resolve_driver_path(cache_file)
+
+    monkeypatch.setattr(browser, "ChromeDriverManager", FakeManager(None))
+    monkeypatch.setattr(browser, "chrome_major_version", lambda: "127")
+    assert browser.resolve_driver_path(cache_file) == str(driver_path)
+
+
+def blocked(url):
+    """
+    Matches url against the blocked patterns the way Network.setBlockedURLs does ("*" is the only wildcard).
+    """
+    return any(
+        re.fullmatch(".*".join(re.escape(part) for part in pattern.split("*")), url)
+        for pattern in const.BLOCKED_RESOURCE_PATTERNS
+    )
+
+
+def test_resource_patterns_only_match_the_file_extension():
+    assert blocked("https://cdn.example.com/logo.png")
+    assert blocked("https://cdn.example.com/favicon.ico?v=3")
+    assert blocked("https://fonts.example.com/inter.woff2")
+    assert not blocked("https://app.joinhandshake.com/assets/app.icons.bundle.js")
+    assert not blocked("https://app.joinhandshake.com/api/v1/fonts.ttfx/settings")
+    assert not blocked("https://app.joinhandshake.com/api/ogg.json")
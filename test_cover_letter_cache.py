@@ -0,0 +1,60 @@
+from datetime import datetime
+
+from cover_letter_cache import CoverLetterCache, normalize_company, restamp_date
+
+DESCRIPTION = (
+    "Acme is hiring a software engineering intern to build Python services, write tests, "
+    "review code and ship features with a small team in {city}. You will work with PostgreSQL and React."
+)
+LETTER = "**Jordan Lee**\n\njordan@example.com\n\nFebruary 12, 2026\n\nDear Hiring Manager,\n\nBody."
+
+
+def test_normalize_company():
+    assert normalize_company("Acme, Inc.") == normalize_company("ACME") == "acme"
+
+
+def test_restamp_date_only_touches_the_date_line():
+    restamped = restamp_date(LETTER, datetime(2027, 3, 5))
+    assert "March 5, 2027" in restamped
+    assert "February" not in restamped
+    assert restamped.startswith("**Jordan Lee**")
+
+
+def test_reuses_letters_for_similar_postings_of_the_same_company(tmp_path):
+    """
+    The same role posted for another city reuses the letter, also after a reload from disk.
+    A different company, an unrelated description or a different resume is a miss.
+    """
+    path = str(tmp_path / "letters.jsonl")
+    cache = CoverLetterCache(path, threshold=0.6)
+    assert cache.lookup("Acme", DESCRIPTION.format(city="San Diego"), "resume-1") is None
+    cache.add("1", "Acme", DESCRIPTION.format(city="San Diego"), LETTER, "resume-1")
+
+    reloaded = CoverLetterCache(path, threshold=0.6)
+    reused = reloaded.lookup("Acme Inc", DESCRIPTION.format(city="Austin"), "resume-1")
+    assert reused is not None and "Dear Hiring Manager" in reused
+    assert reloaded.lookup("Globex", DESCRIPTION.format(city="Austin"), "resume-1") is None
+    assert reloaded.lookup("Acme", "Marketing coordinator for social media campaigns.", "resume-1") is None
+    assert reloaded.lookup("Acme", DESCRIPTION.format(city="Austin"), "resume-2") is None
+
+    assert (reloaded.hits, reloaded.misses) == (1, 3)
+    assert "25% hit rate" in reloaded.summary()
+
+
+def test_postings_without_a_company_are_not_cached(tmp_path):
+    cache = CoverLetterCache(str(tmp_path / "letters.jsonl"), threshold=0.6)
+    cache.add("1", None, DESCRIPTION.format(city="San Diego"), LETTER, "resume-1")
+    cache.add("2", "Inc.", DESCRIPTION.format(city="San Diego"), LETTER, "resume-1")
+
+    assert cache.entries == {}
+    assert cache.lookup("", DESCRIPTION.format(city="San Diego"), "resume-1") is None
+
+
+def test_pdfs_are_tied_to_the_resume_they_were_written_with(tmp_path):
+    path = str(tmp_path / "letters.jsonl")
+    CoverLetterCache(path).record_pdf(7, "resume-1")
+
+    reloaded = CoverLetterCache(path)
+    assert reloaded.pdf_is_current("7", "resume-1")
+    assert not reloaded.pdf_is_current("7", "resume-2")
+    assert not reloaded.pdf_is_current("8", "resume-1")
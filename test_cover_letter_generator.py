@@ -1,10 +1,14 @@
 import os
 
 from dotenv import load_dotenv
+from fpdf import FPDF
 from PyPDF2 import PdfReader
 
 import constants as const
-from cover_letter_generator import generate_cover_letter
+import cover_letter_generator
+from cover_letter_cache import CoverLetterCache
+from cover_letter_generator import generate_cover_letter, select_chunks
+from langchain_core.documents import Document
 
 load_dotenv()
 
@@ -46,4 +50,99 @@ def test_generate_cover_letter_integration():
     print(f"\nGenerated cover letter ({len(text)} chars):\n{text[:500]}")
 
 
-test_generate_cover_letter_integration()
+def write_resume(file_path: str) -> None:
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=11)
+    pdf.multi_cell(
+        0,
+        5,
+        "Jordan Lee | jordan.lee@example.com | San Diego, CA. "
+        "Experience: built Python REST APIs and data pipelines. Skills: Python, SQL, testing.",
+    )
+    pdf.output(file_path)
+
+
+def test_generate_cover_letter_offline(tmp_path, monkeypatch):
+    """
+    Offline test with the fake backend: both the direct-prompt and retrieval paths produce a PDF
+    containing the canned letter, without touching the network.
+    """
+    resume_path = str(tmp_path / "resume.pdf")
+    write_resume(resume_path)
+    monkeypatch.setenv("COVER_LETTER_PATH", str(tmp_path / "letters"))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cover_letter_generator, "PROMPT_STATS", [])
+
+    for job_id, budget in [(1, const.DEFAULT_DIRECT_PROMPT_TOKEN_BUDGET), (2, 0)]:
+        config = {
+            const.RESUME_PATH: resume_path,
+            const.LLM_BACKEND: "fake",
+            const.DIRECT_PROMPT_TOKEN_BUDGET: budget,
+        }
+        timings = {}
+
+        result = generate_cover_letter("Python intern at Acme Corp.", job_id, config, timings=timings)
+
+        assert result == os.path.join(str(tmp_path / "letters"), f"{job_id}.pdf")
+        text = PdfReader(result).pages[0].extract_text()
+        assert "Dear Hiring Manager" in text
+        assert {"load", "generate", "render"} <= timings.keys()
+
+    assert {"split", "embed", "retrieve"} <= timings.keys()
+    assert [path for job_id, path, _, _ in cover_letter_generator.PROMPT_STATS] == ["direct", "retrieval"]
+
+
+def test_select_chunks_fills_budget_from_each_list_in_turns():
+    """
+    The best chunk of each list goes in first, chunks that don't fit are skipped for smaller ones,
+    and the selection comes back grouped by list in document order.
+    """
+
+    def chunk(name, start, tokens):
+        return Document(page_content=name, metadata={"start_index": start, "tokens": tokens})
+
+    resume = [chunk("r2", 200, 50), chunk("r1", 0, 50), chunk("r3", 400, 50)]
+    job = [chunk("j1", 0, 80), chunk("j2", 100, 10)]
+
+    selected = select_chunks([resume, job], 200)
+
+    assert [doc.page_content for doc in selected] == ["r1", "r2", "j1", "j2"]
+    assert sum(doc.metadata["tokens"] for doc in selected) <= 200
+
+
+def test_generate_cover_letter_reuses_cached_letters(tmp_path, monkeypatch):
+    """
+    With a letter cache, a job's existing PDF is returned as is and a repost of the same posting
+    is rendered from the cached markdown without calling the model, until the resume changes.
+    """
+    resume_path = str(tmp_path / "resume.pdf")
+    write_resume(resume_path)
+    monkeypatch.setenv("COVER_LETTER_PATH", str(tmp_path / "letters"))
+    monkeypatch.chdir(tmp_path)
+    config = {const.RESUME_PATH: resume_path, const.LLM_BACKEND: "fake"}
+    letter_cache = CoverLetterCache(str(tmp_path / "letters.jsonl"))
+    description = "Python intern at Acme Corp building REST APIs and data pipelines."
+
+    first = generate_cover_letter(description, 1, config, company="Acme", letter_cache=letter_cache)
+    assert generate_cover_letter(description, 1, config, company="Acme", letter_cache=letter_cache) == first
+
+    timings = {}
+    repost = generate_cover_letter(
+        description, 2, config, timings=timings, company="Acme Corp", letter_cache=letter_cache
+    )
+    assert os.path.isfile(repost)
+    assert "generate" not in timings
+    assert (letter_cache.pdf_hits, letter_cache.hits, letter_cache.misses) == (1, 1, 1)
+
+    # Letters written with the old resume are neither resent nor reused once it is edited
+    with open(resume_path, mode="ab") as f:
+        f.write(b"\n% edited\n")
+    timings = {}
+    generate_cover_letter(description, 2, config, timings=timings, company="Acme", letter_cache=letter_cache)
+    assert "generate" in timings
+    assert (letter_cache.pdf_hits, letter_cache.hits, letter_cache.misses) == (1, 1, 2)
+
+
+if __name__ == "__main__":
+    test_generate_cover_letter_integration()
@@ -0,0 +1,69 @@
+import os
+
+import constants as const
+from cover_letter_prefetcher import CoverLetterPrefetcher
+from test_cover_letter_generator import write_resume
+
+
+def job(job_id):
+    return {
+        const.JOB_ID: job_id,
+        const.JOB_DESCRIPTION: f"Python intern {job_id} at Acme Corp.",
+        const.COMPANY_NAME: "Acme",
+    }
+
+
+def make_prefetcher(tmp_path, monkeypatch, **kwargs):
+    resume_path = str(tmp_path / "resume.pdf")
+    write_resume(resume_path)
+    monkeypatch.setenv("COVER_LETTER_PATH", str(tmp_path / "letters"))
+    monkeypatch.chdir(tmp_path)
+    config = {
+        const.RESUME_PATH: resume_path,
+        const.LLM_BACKEND: "fake",
+        const.FAKE_LLM_LATENCY: 0.5,
+    }
+
+    return CoverLetterPrefetcher(config, **kwargs)
+
+
+def test_submitted_letters_are_generated_in_the_background(tmp_path, monkeypatch):
+    prefetcher = make_prefetcher(tmp_path, monkeypatch, max_workers=1, max_pending=1)
+    try:
+        assert prefetcher.submit(job("1"))
+        assert prefetcher.submit(job("1"))  # Already queued
+        assert not prefetcher.submit(job("2"))  # Queue full
+        assert not prefetcher.submit({const.JOB_ID: "3", const.JOB_DESCRIPTION: None})
+        assert prefetcher.pending() == 1
+
+        file_path = prefetcher.result(job("1"))
+        assert file_path == os.path.join(str(tmp_path / "letters"), "1.pdf")
+        assert os.path.isfile(file_path)
+        assert prefetcher.pending() == 0
+        assert prefetcher.used == 1
+
+        # A job that never made it into the queue is generated on the calling thread
+        assert os.path.isfile(prefetcher.result(job("2")))
+    finally:
+        prefetcher.shutdown()
+
+
+def test_discard_cancels_letters_that_have_not_started(tmp_path, monkeypatch):
+    prefetcher = make_prefetcher(tmp_path, monkeypatch, max_workers=1, max_pending=2)
+    try:
+        assert prefetcher.submit(job("1"))
+        assert prefetcher.submit(job("2"))
+        queued = prefetcher.futures["2"]
+
+        prefetcher.discard("2")
+        assert queued.cancelled()
+        assert "2" not in prefetcher.futures
+
+        # The running letter can't be cancelled, but it no longer counts once discarded
+        prefetcher.discard("1")
+        assert prefetcher.pending() == 0
+        assert prefetcher.wasted == 1
+    finally:
+        prefetcher.shutdown()
+
+    assert not os.path.exists(tmp_path / "letters" / "2.pdf")
@@ -0,0 +1,34 @@
+from crawl_checkpoint import CrawlCheckpoint, page_url
+
+SEARCH_URL = "https://app.joinhandshake.com/job-search/10736930?jobType=3&query=software+engineer+intern&per_page=25&page=1"
+
+
+def test_page_url_replaces_page_parameter():
+    url = page_url(SEARCH_URL, 30)
+    assert url.endswith("page=30")
+    assert url.count("page=") == 2  # per_page and page
+    assert "query=software+engineer+intern" in url
+    assert url.startswith("https://app.joinhandshake.com/job-search/10736930?")
+
+
+def test_page_url_adds_missing_page_parameter():
+    assert page_url("https://example.com/job-search?query=x", 2) == "https://example.com/job-search?query=x&page=2"
+
+
+def test_checkpoint_round_trip_is_tied_to_search(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.json"))
+    assert checkpoint.load(SEARCH_URL) is None
+
+    checkpoint.save(SEARCH_URL, page=30, job_index=4, job_id="123")
+    assert checkpoint.load(SEARCH_URL) == {
+        "search_url": SEARCH_URL,
+        "page": 30,
+        "job_index": 4,
+        "job_id": "123",
+        "phase": "interleaved",
+    }
+    assert checkpoint.load(SEARCH_URL + "&other=1") is None
+    assert checkpoint.load(SEARCH_URL, phase="crawl") is None
+
+    checkpoint.clear()
+    assert checkpoint.load(SEARCH_URL) is None
@@ -0,0 +1,205 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+import constants as const
+import main
+from driver_handler import MODAL_SNAPSHOT_SCRIPT, DriverHandler
+from job_queue import APPLY_TYPE_EXTERNAL, APPLY_TYPE_QUICK, JobQueue
+
+
+class FakeDriver:
+    """
+    Just enough of a WebDriver for a DriverHandler that never touches a page.
+    """
+
+    current_url = "about:blank"
+
+    def execute(self, driver_command, params=None):
+        return {"value": None}
+
+
+class ModalDriver(FakeDriver):
+    """
+    Serves a canned apply modal snapshot, and the SVG markup of fake fieldsets while uploads are waited on.
+    """
+
+    def __init__(self, modal=None):
+        self.modal = modal
+
+    def execute_script(self, script, *args):
+        if script == MODAL_SNAPSHOT_SCRIPT:
+            return dict(self.modal) if self.modal else None
+        return [fieldset.svg_markup() for fieldset in args[0]]
+
+
+class FakeFieldset:
+    """
+    A fieldset whose SVGs change to uploaded_svgs `checks` polls after a file is chosen, or never if uploaded_svgs is None.
+    """
+
+    def __init__(self, svgs="", uploaded_svgs=None, checks=1):
+        self.svgs = svgs
+        self.uploaded_svgs = uploaded_svgs
+        self.checks = checks
+        self.uploaded_path = None
+
+    def svg_markup(self):
+        if self.uploaded_path and self.uploaded_svgs is not None:
+            if self.checks <= 0:
+                return self.uploaded_svgs
+            self.checks -= 1
+        return self.svgs
+
+
+class FakeFileInput:
+    def __init__(self, fieldset):
+        self.fieldset = fieldset
+
+    def send_keys(self, path):
+        self.fieldset.uploaded_path = path
+
+
+class FakeCoverLetters:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, job_details):
+        # Like CoverLetterPrefetcher, a job already submitted isn't queued again
+        if job_details[const.JOB_ID] not in self.submitted:
+            self.submitted.append(job_details[const.JOB_ID])
+        return True
+
+    def discard(self, job_id):
+        pass
+
+    def shutdown(self):
+        pass
+
+
+def make_handler(tmp_path, monkeypatch, driver=None, **config):
+    monkeypatch.chdir(tmp_path)
+    handler = DriverHandler(
+        driver or FakeDriver(),
+        {
+            const.INCLUDE_RESUME: True,
+            const.INCLUDE_TRANSCRIPT: False,
+            const.INCLUDE_COVER_LETTER: True,
+            const.COVER_LETTER_WORKERS: 0,
+            const.COVER_LETTER_REUSE_THRESHOLD: 0,
+            **config,
+        },
+    )
+    handler.cover_letters = FakeCoverLetters()
+
+    return handler
+
+
+def test_apply_phase_prefetches_letters_for_queued_quick_apply_jobs(tmp_path, monkeypatch):
+    """
+    Job details coming out of the queue carry their apply type, so the apply phase can start their
+    cover letters ahead of time.
+    """
+    handler = make_handler(tmp_path, monkeypatch)
+    job_queue = JobQueue(str(tmp_path / "queue.db"))
+    for job_id, apply_type in (("1", APPLY_TYPE_QUICK), ("2", APPLY_TYPE_EXTERNAL), ("3", APPLY_TYPE_QUICK)):
+        job_queue.add(
+            f"https://x/job-search/{job_id}",
+            {
+                const.JOB_ID: job_id,
+                const.JOB_TITLE: f"Intern {job_id}",
+                const.COMPANY_NAME: "Acme",
+                const.JOB_DESCRIPTION: f"Python intern {job_id}",
+            },
+            apply_type,
+        )
+
+    attempted = []
+    monkeypatch.setattr(
+        handler,
+        "apply_to_queued_job",
+        lambda job_url, job_details: attempted.append(job_details[const.JOB_ID]) or (False, "Low relevance"),
+    )
+
+    main.apply_queued_jobs(handler, job_queue)
+
+    assert attempted == ["1", "3"]
+    assert handler.cover_letters.submitted == ["1", "3"]
+    job_queue.close()
+    handler.close()
+
+
+def upload(document_type, fieldset):
+    return document_type, f"/docs/{document_type}.pdf", fieldset, FakeFileInput(fieldset)
+
+
+def test_uploads_are_confirmed_against_each_fieldsets_own_icons(tmp_path, monkeypatch):
+    """
+    A fieldset that already shows an icon is confirmed when the checkmark replaces it, not only when one is added.
+    """
+    handler = make_handler(tmp_path, monkeypatch, driver=ModalDriver())
+    replaced = FakeFieldset(svgs="<svg>upload</svg>", uploaded_svgs="<svg>check</svg>")
+    added = FakeFieldset(svgs="", uploaded_svgs="<svg>check</svg>", checks=2)
+
+    handler.upload_documents([upload("Transcript", replaced), upload("Cover Letter", added)])
+
+    assert replaced.uploaded_path == "/docs/Transcript.pdf"
+    assert added.uploaded_path == "/docs/Cover Letter.pdf"
+    handler.close()
+
+
+def test_unconfirmed_upload_times_out_naming_only_that_document(tmp_path, monkeypatch):
+    handler = make_handler(tmp_path, monkeypatch, driver=ModalDriver())
+    handler.default_timeout = 1
+    confirmed = FakeFieldset(svgs="<svg>upload</svg>", uploaded_svgs="<svg>check</svg>")
+    stuck = FakeFieldset(svgs="<svg>upload</svg>")
+
+    with pytest.raises(TimeoutException) as error:
+        handler.upload_documents([upload("Transcript", confirmed), upload("Cover Letter", stuck)])
+
+    assert error.value.msg == "Could not confirm upload of Cover Letter"
+    handler.close()
+
+
+def test_one_modal_snapshot_drives_validation_and_upload_routing(tmp_path, monkeypatch):
+    """
+    Required documents are read from the snapshot's text, and its fieldsets route each upload to the right file.
+    """
+    transcript = tmp_path / "transcript.pdf"
+    transcript.write_bytes(b"%PDF")
+    letter = tmp_path / "letter.pdf"
+    letter.write_bytes(b"%PDF")
+    transcript_fieldset = FakeFieldset()
+    letter_fieldset = FakeFieldset()
+    other_fieldset = FakeFieldset()
+    driver = ModalDriver(
+        {
+            "text": "Attach your Transcript\nAttach your Cover Letter",
+            "fieldsets": [
+                {"legend": "Transcript", "text": "", "element": transcript_fieldset,
+                 "file_input": FakeFileInput(transcript_fieldset)},
+                {"legend": "Cover Letter", "text": "", "element": letter_fieldset,
+                 "file_input": FakeFileInput(letter_fieldset)},
+                {"legend": "Work authorization", "text": "", "element": other_fieldset,
+                 "file_input": FakeFileInput(other_fieldset)},
+            ],
+        }
+    )
+    handler = make_handler(tmp_path, monkeypatch, driver=driver, **{const.TRANSCRIPT_PATH: "transcript.pdf"})
+
+    modal = handler.snapshot_modal()
+    assert modal["required_documents"] == {"transcript", "cover letter"}
+    assert handler.valid_application("1", modal) == (False, "Job requires transcript but config excludes it")
+
+    handler.config[const.INCLUDE_TRANSCRIPT] = True
+    assert handler.valid_application("1", modal) == (True, "")
+
+    uploads = []
+    monkeypatch.setattr(handler, "get_cover_letter", lambda job_details: str(letter))
+    monkeypatch.setattr(handler, "upload_documents", uploads.extend)
+    handler.add_documents({const.JOB_ID: "1"}, modal)
+
+    assert [(document_type, path, fieldset) for document_type, path, fieldset, _ in uploads] == [
+        ("Transcript", str(transcript), transcript_fieldset),
+        ("Cover Letter", str(letter), letter_fieldset),
+    ]
+    handler.close()
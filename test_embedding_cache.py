@@ -0,0 +1,73 @@
+import threading
+
+from embedding_cache import CachedEmbeddings, EMBEDDING_CACHE_STATS, EmbeddingStore
+from llm_backends import FakeEmbeddings
+
+
+class CountingEmbeddings(FakeEmbeddings):
+    def __init__(self, latency=0.0):
+        super().__init__(dimensions=8, latency=latency)
+        self.batches = []
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        return super().embed_documents(texts)
+
+
+def test_only_misses_are_embedded_in_one_batch(tmp_path):
+    model = CountingEmbeddings()
+    cached = CachedEmbeddings(model, str(tmp_path / "first"))
+
+    first = cached.embed_documents(["python apis", "react", "python apis"])
+    assert model.batches == [["python apis", "react"]]
+    assert first[0] == first[2]
+
+    hits = EMBEDDING_CACHE_STATS["hits"]
+    again = cached.embed_documents(["react", "sql"])
+    assert model.batches[-1] == ["sql"]
+    assert again[0] == first[1]
+    assert EMBEDDING_CACHE_STATS["hits"] == hits + 1
+
+
+def test_vectors_persist_across_processes(tmp_path):
+    """
+    A fresh store (as in a later run) memory-maps the vectors written before.
+    """
+    directory = str(tmp_path / "second")
+    vector = CachedEmbeddings(CountingEmbeddings(), directory).embed_query("distributed systems")
+
+    store = EmbeddingStore(directory, "CountingEmbeddings-8")
+    (reloaded,) = store.get_many(list(store.rows)).values()
+    assert reloaded.tolist() == vector
+
+
+def test_concurrent_misses_are_embedded_once(tmp_path):
+    """
+    Two letters starting together on the same resume chunks embed them once; the second waits for the first.
+    """
+    model = CountingEmbeddings(latency=0.2)
+    cached = CachedEmbeddings(model, str(tmp_path / "third"))
+    texts = ["python apis", "react", "sql"]
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(cached.embed_documents(texts))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(text for batch in model.batches for text in batch) == sorted(texts)
+    assert results[0] == results[1]
+    assert len(cached.store.rows) == 3
+
+
+def test_queries_are_counted_apart_from_chunks(tmp_path):
+    cached = CachedEmbeddings(CountingEmbeddings(), str(tmp_path / "fourth"))
+    chunk_misses = EMBEDDING_CACHE_STATS["misses"]
+    query_hits = EMBEDDING_CACHE_STATS["query_hits"]
+
+    cached.embed_query("backend intern")
+    cached.embed_query("backend intern")
+
+    assert EMBEDDING_CACHE_STATS["misses"] == chunk_misses
+    assert EMBEDDING_CACHE_STATS["query_hits"] == query_hits + 1
@@ -0,0 +1,50 @@
+import constants as const
+from job_queue import (
+    APPLIED,
+    APPLY_TYPE_EXTERNAL,
+    APPLY_TYPE_QUICK,
+    FAILED,
+    PENDING,
+    SKIPPED,
+    JobQueue,
+)
+
+
+def job(job_id: str) -> dict:
+    return {
+        const.JOB_ID: job_id,
+        const.JOB_TITLE: f"Intern {job_id}",
+        const.COMPANY_NAME: "Acme",
+        const.JOB_DESCRIPTION: f"Description {job_id}",
+    }
+
+
+def test_crawled_jobs_persist_and_are_not_requeued(tmp_path):
+    path = str(tmp_path / "queue.db")
+    queue = JobQueue(path)
+
+    assert queue.add("https://x/job-search/1", job("1"), APPLY_TYPE_QUICK)
+    assert queue.add("https://x/job-search/2", job("2"), APPLY_TYPE_EXTERNAL)
+    assert not queue.add("https://x/job-search/1", job("1"), APPLY_TYPE_QUICK)
+    queue.close()
+
+    reopened = JobQueue(path)
+    assert "1" in reopened
+    assert "3" not in reopened
+    assert reopened.counts() == {PENDING: 1, SKIPPED: 1}
+    assert reopened.pending() == [
+        ("https://x/job-search/1", {**job("1"), const.APPLY_TYPE: APPLY_TYPE_QUICK})
+    ]
+
+
+def test_apply_outcomes_and_retries(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.db"))
+    for job_id in ("1", "2", "3"):
+        queue.add(f"https://x/job-search/{job_id}", job(job_id), APPLY_TYPE_QUICK)
+
+    queue.mark("1", APPLIED, "Applied successfully")
+    queue.mark("2", FAILED, "Error: TimeoutException")
+
+    # Failed jobs are retried until they run out of attempts
+    assert [details[const.JOB_ID] for _, details in queue.pending()] == ["2", "3"]
+    assert [details[const.JOB_ID] for _, details in queue.pending(max_attempts=1)] == ["3"]
@@ -0,0 +1,33 @@
+from pacer import Pacer
+
+
+def test_backs_off_on_slow_loads_and_timeouts():
+    """
+    Slow page loads and timeouts halve the rate, never below the floor.
+    """
+    pacer = Pacer(actions_per_minute=16, slow_seconds=5.0, min_actions_per_minute=3)
+
+    pacer.record(8.0)
+    assert pacer.rate == 8
+    pacer.record(0.5, timed_out=True)
+    assert pacer.rate == 4
+    pacer.record(9.0)
+    assert pacer.rate == 3
+    assert pacer.backoffs == 3
+
+
+def test_recovers_toward_target_when_fast():
+    pacer = Pacer(actions_per_minute=10, slow_seconds=5.0)
+    pacer.record(20.0)
+    assert pacer.rate == 5
+
+    for _ in range(10):
+        pacer.record(1.0)
+    assert pacer.rate == 10
+
+
+def test_burst_actions_do_not_wait():
+    pacer = Pacer(actions_per_minute=6, burst=3)
+    waits = [pacer.bucket.reserve() for _ in range(3)]
+    assert waits == [0.0, 0.0, 0.0]
+    assert pacer.bucket.reserve() > 0
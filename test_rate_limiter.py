@@ -0,0 +1,28 @@
+import pytest
+
+from rate_limiter import TokenBucket
+
+
+def test_full_bucket_does_not_wait():
+    bucket = TokenBucket(rate_per_minute=60)
+    assert bucket.reserve(60) == 0.0
+
+
+def test_empty_bucket_waits_for_refill():
+    """
+    Once the bucket is drained, the next reservation waits for its tokens to refill at the configured rate.
+    """
+    bucket = TokenBucket(rate_per_minute=60, capacity=1)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+    assert bucket.reserve() == pytest.approx(2.0, abs=0.05)
+
+
+def test_oversized_request_goes_into_debt():
+    bucket = TokenBucket(rate_per_minute=600, capacity=10)
+    assert bucket.reserve(40) == pytest.approx(3.0, abs=0.05)
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate_per_minute=0)
@@ -0,0 +1,48 @@
+import pytest
+
+from relevance import RelevanceScorer, tokenize
+
+
+def test_tokenize_keeps_tech_terms_and_drops_stop_words():
+    assert tokenize("Experience with C++, C# and Node.js for the team.") == [
+        "experience",
+        "c++",
+        "c#",
+        "node.js",
+        "team",
+    ]
+
+
+def test_related_postings_score_higher():
+    """
+    A batch is scored at once; the posting that shares the resume's distinctive terms ranks first,
+    and missing descriptions score 0.
+    """
+    scorer = RelevanceScorer(
+        "Software engineering intern. Python, Django, PostgreSQL, React and Docker projects."
+    )
+    scores = scorer.score_many(
+        [
+            "Backend intern building Python and Django services on PostgreSQL.",
+            "Marketing intern to plan social media campaigns and events.",
+            None,
+        ]
+    )
+
+    assert scores.shape == (3,)
+    assert scores[0] > scores[1]
+    assert scores[2] == 0
+    assert 0 <= scores.min() and scores.max() <= 1
+
+
+def test_empty_resume_scores_zero():
+    assert RelevanceScorer("").score("Python developer") == 0
+
+
+def test_scores_do_not_depend_on_the_batch():
+    scorer = RelevanceScorer("Software engineering intern. Python, Django, PostgreSQL and React projects.")
+    description = "Backend intern building Python services on PostgreSQL."
+
+    alone = scorer.score(description)
+    assert scorer.score_many([description, "Marketing intern for social media campaigns."])[0] == pytest.approx(alone)
+    assert scorer.score_many(["Python and React developer.", None, description])[2] == pytest.approx(alone)
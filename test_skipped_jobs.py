@@ -0,0 +1,65 @@
+import time
+
+import constants as const
+import skipped_jobs
+from skipped_jobs import SkippedJobsCache
+
+CONFIG = {
+    const.INCLUDE_RESUME: True,
+    const.INCLUDE_TRANSCRIPT: False,
+    const.INCLUDE_COVER_LETTER: True,
+}
+
+
+def test_remembers_skips_across_runs(tmp_path):
+    path = str(tmp_path / "skipped.jsonl")
+    cache = SkippedJobsCache(path, CONFIG)
+    cache.add("1", "External application")
+    cache.add("2", "Job requires transcript but config excludes it")
+    cache.add("3", "Document not found: resume.pdf")
+
+    reloaded = SkippedJobsCache(path, CONFIG)
+    assert reloaded.reason("1") == "External application"
+    assert reloaded.reason("2") == "Job requires transcript but config excludes it"
+    assert reloaded.reason("3") is None
+
+
+def test_config_change_only_invalidates_config_dependent_reasons(tmp_path):
+    path = str(tmp_path / "skipped.jsonl")
+    cache = SkippedJobsCache(path, CONFIG)
+    cache.add("1", "External application")
+    cache.add("2", "Job requires transcript but config excludes it")
+
+    reloaded = SkippedJobsCache(path, {**CONFIG, const.INCLUDE_TRANSCRIPT: True})
+    assert reloaded.reason("1") == "External application"
+    assert reloaded.reason("2") is None
+
+
+def test_transient_errors_expire(tmp_path, monkeypatch):
+    cache = SkippedJobsCache(str(tmp_path / "skipped.jsonl"), CONFIG)
+    cache.add("1", "Error: TimeoutException")
+    assert cache.reason("1") == "Error: TimeoutException"
+
+    later = time.time() + 2 * 3600
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert cache.reason("1") is None
+
+
+def test_low_relevance_is_forgotten_when_the_scorer_changes(tmp_path, monkeypatch):
+    path = str(tmp_path / "skipped.jsonl")
+    SkippedJobsCache(path, CONFIG).add("1", "Low relevance")
+    assert SkippedJobsCache(path, CONFIG).reason("1") == "Low relevance"
+
+    monkeypatch.setattr(skipped_jobs, "SCORER_VERSION", "tfidf-reference-next")
+    assert SkippedJobsCache(path, CONFIG).reason("1") is None
+
+
+def test_skips_are_appended_and_compacted_on_load(tmp_path):
+    path = tmp_path / "skipped.jsonl"
+    cache = SkippedJobsCache(str(path), CONFIG)
+    cache.add("1", "Error: TimeoutException")
+    cache.add("1", "External application")
+    assert len(path.read_text().splitlines()) == 2
+
+    assert SkippedJobsCache(str(path), CONFIG).reason("1") == "External application"
+    assert len(path.read_text().splitlines()) == 1
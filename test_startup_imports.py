@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+from benchmarks.imports import DEFERRED_PACKAGES
+from test_cover_letter_generator import write_resume
+
+
+def test_startup_does_not_import_cover_letter_stack():
+    """
+    Importing main must not load LangChain, Chroma, PyPDF2 or fpdf; they are imported when the first cover letter is needed.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", "import sys, main; print(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = {name.split(".")[0] for name in completed.stdout.split()}
+
+    assert not loaded & set(DEFERRED_PACKAGES)
+
+
+def test_reading_the_resume_does_not_import_langchain(tmp_path):
+    """
+    Relevance scoring reads the resume on every run, so resume text extraction must only need PyPDF2.
+    """
+    resume_path = str(tmp_path / "resume.pdf")
+    write_resume(resume_path)
+    script = (
+        "import sys, constants as const, resume_text; "
+        f"text = resume_text.load_resume_text({{const.RESUME_PATH: {resume_path!r}}}); "
+        "print(' '.join(sys.modules)) if 'Python' in text else sys.exit(1)"
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=str(tmp_path),
+        env={**os.environ, "PYTHONPATH": os.path.dirname(os.path.abspath(__file__))},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = {name.split(".")[0] for name in completed.stdout.split()}
+
+    assert "PyPDF2" in loaded
+    assert not loaded & {"langchain", "langchain_core", "langchain_community", "chromadb"}
@@ -0,0 +1,162 @@
+from crawl_checkpoint import job_id_from_url
+from tab_prefetcher import TabPrefetcher, PAGE_READY_SCRIPT
+import constants as const
+
+
+def url(job_id):
+    return f"https://x/job-search/{job_id}"
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def new_window(self, kind):
+        handle = f"tab-{len(self.driver.urls)}"
+        self.driver.urls[handle] = None
+        self.driver.current_window_handle = handle
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """
+    Just enough of a WebDriver to track which URL each tab has loaded. With stale_checks, a tab keeps
+    showing its previous page for that many readiness checks after being sent somewhere new.
+    """
+
+    def __init__(self):
+        self.current_window_handle = "main"
+        self.urls = {"main": None}
+        self.switch_to = FakeSwitchTo(self)
+        self.ready = True
+        self.stale_checks = 0
+        self.navigations = {}  # tab -> [URL not committed yet, checks left]
+
+    def execute_script(self, script, *args):
+        handle = self.current_window_handle
+        if script == PAGE_READY_SCRIPT:
+            pending = self.navigations.get(handle)
+            if pending and pending[1] > 0:
+                pending[1] -= 1
+            elif pending:
+                self.urls[handle] = self.navigations.pop(handle)[0]
+            return self.ready and args[0] in (self.urls[handle] or "")
+
+        if self.urls[handle] and self.stale_checks:
+            self.navigations[handle] = [args[0], self.stale_checks]
+        else:
+            self.urls[handle] = args[0]
+
+
+class FakeHandler:
+    def __init__(self, driver):
+        self.driver = driver
+        self.cover_letter_jobs = []
+        self.paced = 0
+        self.pacer = self
+
+    def wait(self):
+        self.paced += 1
+
+    def get_driver(self):
+        return self.driver
+
+    def score_jobs(self, jobs):
+        pass
+
+    def prefetch_cover_letters(self, jobs):
+        self.cover_letter_jobs.extend(job[const.JOB_ID] for job in jobs)
+
+    def parse_job_details(self):
+        page_url = self.driver.urls[self.driver.current_window_handle]
+        return {const.JOB_ID: job_id_from_url(page_url), const.APPLY_TYPE: "apply"}
+
+
+def test_loads_upcoming_jobs_in_background_tabs():
+    driver = FakeDriver()
+    handler = FakeHandler(driver)
+    tabs = TabPrefetcher(handler, 2)
+    tabs.set_upcoming([url("a"), url("b"), url("c"), url("d")])
+
+    # The first job isn't prefetched yet; the caller loads it in the current tab
+    assert not tabs.open(url("a"))
+    tabs.refill()
+    assert driver.current_window_handle == "main"
+    assert sorted(tabs.loading) == [url("b"), url("c")]
+    assert handler.paced == 2
+    assert handler.cover_letter_jobs == ["b", "c"]
+
+    # The next job is switched to, and the tab it leaves behind is reused
+    assert tabs.open(url("b"))
+    assert driver.current_window_handle == tabs.handles[1]
+    assert tabs.details(url("b")) == {const.JOB_ID: "b", const.APPLY_TYPE: "apply"}
+    tabs.refill()
+    assert driver.urls["main"] == url("d")
+    assert driver.current_window_handle == tabs.handles[1]
+    assert (tabs.hits, tabs.misses) == (1, 1)
+
+
+def test_drops_tabs_for_jobs_no_longer_upcoming():
+    driver = FakeDriver()
+    tabs = TabPrefetcher(FakeHandler(driver), 1)
+    tabs.set_upcoming([url("a"), url("b")])
+    tabs.refill()
+    assert list(tabs.loading) == [url("a")]
+
+    tabs.set_upcoming([url("c")])
+    assert not tabs.loading
+    assert not tabs.open(url("a"))
+
+
+def test_rechecks_tabs_that_were_still_loading_when_the_next_job_opens():
+    driver = FakeDriver()
+    handler = FakeHandler(driver)
+    tabs = TabPrefetcher(handler, 2)
+    tabs.set_upcoming([url("a"), url("b"), url("c")])
+
+    assert not tabs.open(url("a"))
+    driver.ready = False
+    tabs.refill()
+    assert not tabs.parsed and not handler.cover_letter_jobs
+
+    # By the time "a" is done the background tabs have loaded; their letters start before "b" is shown
+    driver.ready = True
+    assert tabs.open(url("b"))
+    assert handler.cover_letter_jobs == ["b", "c"]
+    assert tabs.details(url("b")) == {const.JOB_ID: "b", const.APPLY_TYPE: "apply"}
+    assert driver.current_window_handle == tabs.handles[1]
+
+
+def test_reused_tab_showing_the_previous_job_is_not_parsed_as_the_next_one():
+    """
+    A reused tab still shows the job it was left on (with its Share button) right after being sent to the
+    next one. That stale page must not be taken for the new job.
+    """
+    driver = FakeDriver()
+    handler = FakeHandler(driver)
+    tabs = TabPrefetcher(handler, 1)
+    tabs.set_upcoming([url("a"), url("b"), url("c")])
+
+    assert not tabs.open(url("a"))
+    driver.urls["main"] = url("a")  # The caller loads it in the current tab
+    tabs.refill()
+    assert tabs.open(url("b"))
+
+    # "main" still shows "a" for one check after being sent to "c"
+    driver.stale_checks = 1
+    tabs.refill()
+    assert driver.urls["main"] == url("a")
+    assert url("c") not in tabs.parsed and handler.cover_letter_jobs == ["b"]
+
+    assert tabs.open(url("c"))
+    assert tabs.details(url("c")) == {const.JOB_ID: "c", const.APPLY_TYPE: "apply"}
+    assert handler.cover_letter_jobs == ["b", "c"]
+
+
+def test_details_for_another_job_are_never_returned():
+    tabs = TabPrefetcher(FakeHandler(FakeDriver()), 1)
+    tabs.parsed[url("b")] = {const.JOB_ID: "a", const.APPLY_TYPE: "apply"}
+
+    assert tabs.details(url("b")) is None
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from tracing import Tracer, percentile, summarize
+
+
+def test_spans_and_events_are_written_as_jsonl(tmp_path):
+    trace_path = tmp_path / "trace.jsonl"
+    tracer = Tracer(str(trace_path))
+    tracer.context = {"job_id": "123"}
+
+    with tracer.span("parse"):
+        pass
+    with pytest.raises(ValueError):
+        with tracer.span("submit"):
+            raise ValueError("boom")
+    tracer.record_stages("cover_letter", {"generate": 1.5, "render": 0.25}, job_id="456")
+    tracer.event("job", applied=True, reason="Applied successfully")
+    tracer.close()
+
+    records = [json.loads(line) for line in trace_path.read_text().splitlines()]
+    assert [r["name"] for r in records] == [
+        "parse",
+        "submit",
+        "cover_letter.generate",
+        "cover_letter.render",
+        "job",
+    ]
+    assert all(r["run_id"] == tracer.run_id for r in records)
+    assert records[0]["job_id"] == "123"
+    assert records[1]["error"] == "ValueError: boom"
+    assert records[2]["job_id"] == "456"
+    assert records[2]["duration"] == 1.5
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.95) == 95
+    assert percentile([7], 0.95) == 7
+
+
+def test_summary_reports_steps_skip_reasons_and_rate():
+    records = [
+        {"type": "span", "name": "parse", "start": 0, "duration": d} for d in (1, 2, 3, 4)
+    ] + [
+        {"type": "event", "name": "job", "time": 0, "applied": True},
+        {"type": "event", "name": "job", "time": 0, "applied": False, "reason": "External application"},
+        {"type": "event", "name": "skip", "time": 0, "reason": "Already applied (listing)", "count": 5},
+    ]
+
+    report = summarize(records, elapsed=1800)
+
+    assert "parse" in report
+    assert "5  Already applied (listing)" in report
+    assert "1  External application" in report
+    assert "2.0 applications/hour" in report
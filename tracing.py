@@ -0,0 +1,186 @@
+# Standard imports
+import json
+import math
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+
+class Tracer:
+    """
+    Records timing spans and events for a run to a JSONL trace file and summarizes them at the end.
+    Every line is a JSON object with a type ("span" or "event"), a name, the run ID and any attributes;
+    spans also carry their start time and duration in seconds.
+    """
+
+    def __init__(self, trace_path: str = None) -> None:
+        """
+        Initializes the tracer. Nothing is written to disk when trace_path is None.
+        """
+        self.trace_path = trace_path
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started_at = time.time()
+        self.context = {}
+        self.records = []
+        self.lock = threading.Lock()
+        self.file = open(trace_path, mode="a", encoding="utf-8") if trace_path else None
+
+    def _write(self, record: dict) -> None:
+        record["run_id"] = self.run_id
+        with self.lock:
+            self.records.append(record)
+            if self.file:
+                self.file.write(json.dumps(record) + "\n")
+                self.file.flush()
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """
+        Times the with-block as a span. Exceptions are recorded on the span and re-raised.
+        """
+        start = time.time()
+        perf_start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record = {
+                "type": "span",
+                "name": name,
+                "start": start,
+                "duration": time.perf_counter() - perf_start,
+                **self.context,
+                **attrs,
+            }
+            if error:
+                record["error"] = error
+            self._write(record)
+
+    def record_span(self, name: str, duration: float, **attrs) -> None:
+        """
+        Records a span that was timed elsewhere (e.g. cover letter stages on a background thread).
+        """
+        self._write(
+            {
+                "type": "span",
+                "name": name,
+                "start": time.time() - duration,
+                "duration": duration,
+                **self.context,
+                **attrs,
+            }
+        )
+
+    def record_stages(self, prefix: str, timings: dict, **attrs) -> None:
+        """
+        Records each stage of a timings dict (stage -> seconds) as a "<prefix>.<stage>" span.
+        """
+        for stage, duration in timings.items():
+            self.record_span(f"{prefix}.{stage}", duration, **attrs)
+
+    def event(self, name: str, **attrs) -> None:
+        """
+        Records a point-in-time event, such as the outcome of a job.
+        """
+        self._write({"type": "event", "name": name, "time": time.time(), **self.context, **attrs})
+
+    def close(self) -> None:
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+
+    def summary(self) -> str:
+        """
+        Returns a report of this run: p50/p95 per step, skip reason counts and jobs per hour.
+        """
+        with self.lock:
+            records = list(self.records)
+
+        return summarize(records, time.time() - self.started_at)
+
+
+def percentile(values: list, fraction: float) -> float:
+    """
+    Nearest-rank percentile of a non-empty list.
+    """
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(records: list, elapsed: float = None) -> str:
+    """
+    Builds the run report from trace records. elapsed defaults to the span of time the records cover.
+    """
+    durations = defaultdict(list)
+    skip_reasons = Counter()
+    applied = 0
+    processed = 0
+
+    for record in records:
+        if record["type"] == "span":
+            durations[record["name"]].append(record["duration"])
+        elif record["name"] == "job":
+            processed += 1
+            if record.get("applied"):
+                applied += 1
+            else:
+                skip_reasons[record.get("reason") or "Unknown"] += 1
+        elif record["name"] == "skip":
+            skip_reasons[record.get("reason") or "Unknown"] += record.get("count", 1)
+
+    if elapsed is None:
+        times = [r.get("start", r.get("time")) for r in records]
+        ends = [r.get("start", r.get("time")) + r.get("duration", 0) for r in records]
+        elapsed = (max(ends) - min(times)) if records else 0.0
+
+    lines = ["Run report", f"{'step':<28}{'count':>7}{'p50 (s)':>10}{'p95 (s)':>10}{'total (s)':>11}"]
+    for name, values in sorted(durations.items()):
+        lines.append(
+            f"{name:<28}{len(values):>7}{percentile(values, 0.5):>10.2f}"
+            f"{percentile(values, 0.95):>10.2f}{sum(values):>11.1f}"
+        )
+
+    if skip_reasons:
+        lines.append("Skip reasons:")
+        for reason, count in skip_reasons.most_common():
+            lines.append(f"  {count:>5}  {reason}")
+
+    hours = elapsed / 3600 if elapsed else 0
+    lines.append(
+        f"Applied to {applied} of {processed} job(s) visited in {elapsed / 60:.1f} min"
+        + (f" ({applied / hours:.1f} applications/hour, {processed / hours:.1f} jobs/hour)" if hours else "")
+    )
+
+    return "\n".join(lines)
+
+
+def main():
+    """
+    Prints the report for an existing trace file, optionally limited to one run ID.
+    Usage: python tracing.py trace.jsonl [run_id]
+    """
+    if len(sys.argv) < 2:
+        print(main.__doc__)
+        return
+
+    with open(sys.argv[1], mode="r", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+
+    if len(sys.argv) > 2:
+        records = [record for record in records if record.get("run_id") == sys.argv[2]]
+    elif records:
+        # Default to the most recent run in the file
+        records = [record for record in records if record.get("run_id") == records[-1]["run_id"]]
+
+    print(summarize(records))
+
+
+if __name__ == "__main__":
+    main()